@@ -1,14 +1,17 @@
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import uuid
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, make_response, send_file
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, session, jsonify, make_response, send_file, g, has_request_context
 import mysql.connector
+import mysql.connector.pooling
 import bcrypt
 from werkzeug.utils import secure_filename
+from flask.cli import AppGroup
 import csv
 import io
 import base64
 import math
+import re
 from PIL import Image as PILImage
 import google.generativeai as genai
 import json
@@ -23,9 +26,40 @@ from reportlab.graphics.shapes import Drawing, Rect, String
 from reportlab.graphics import renderPDF
 from reportlab.pdfgen import canvas
 
+import bisect
+import click
 import logging
+import threading
+import time
+import zlib
+import pickle
+import hashlib
+import selectors
+import socket
+import socketserver
+import sqlite3
+import tempfile
+import urllib.parse
+from collections import OrderedDict
+from functools import wraps
 from logging.handlers import RotatingFileHandler
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # columnar exports are optional; CSV works without pyarrow
+    pa = pq = None
+
+try:
+    import numpy as np
+except ImportError:  # without NumPy the analytics endpoints answer from the rollup tables
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; issue ID worker IDs then come from the process ID
+    fcntl = None
+
 # -----------------------------------------------------------------------------
 # App Configuration
 # -----------------------------------------------------------------------------
@@ -46,6 +80,76 @@ db_config = {
     'database': "civicsense_ai"  # Replace with your actual Mysql database schema name.
 }
 
+# --- Connection Pool Configuration ---
+# Every request checks out one pooled connection (held on flask.g) instead of
+# opening a fresh TCP + auth handshake per call. Override with environment variables.
+db_pool_config = {
+    'pool_name': 'civicsense_pool',
+    'pool_size': min(int(os.getenv('DB_POOL_SIZE', 10)), mysql.connector.pooling.CNX_POOL_MAXSIZE),
+    'pool_reset_session': os.getenv('DB_POOL_RESET_SESSION', '1') == '1',
+    'acquire_timeout': float(os.getenv('DB_POOL_TIMEOUT', 5)),  # Seconds to wait for a free connection before answering 503
+    # Each statement reads the latest commits. Under REPEATABLE READ a request's later
+    # reads would see the snapshot of its first one, older than the cache versions read since.
+    'isolation_level': 'READ COMMITTED',
+}
+# Streamed exports keep their connection for the whole download, so they draw from
+# a small pool of their own and slow clients cannot starve request traffic.
+export_pool_config = {
+    'pool_name': 'civicsense_export_pool',
+    'pool_size': min(int(os.getenv('EXPORT_POOL_SIZE', 2)), mysql.connector.pooling.CNX_POOL_MAXSIZE),
+    'pool_reset_session': db_pool_config['pool_reset_session'],
+    'acquire_timeout': float(os.getenv('EXPORT_POOL_TIMEOUT', 1)),
+}
+
+# --- Query Result Cache ---
+# Polled read queries are answered from a cache until one of the tables they read
+# is written to. QUERY_CACHE_MAX_BYTES bounds the in-process store's pickled size.
+QUERY_CACHE_ENABLED = os.getenv('QUERY_CACHE', '1') == '1'
+QUERY_CACHE_MAX_BYTES = int(os.getenv('QUERY_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+# Upper bound on how long an entry is kept; versions, not this TTL, decide freshness
+QUERY_CACHE_ENTRY_TTL = int(os.getenv('QUERY_CACHE_ENTRY_TTL', 3600))
+# redis://host:port/db shares the cache (and its invalidations) between all workers;
+# empty keeps it inside each process.
+CACHE_URL = os.getenv('CACHE_URL', '')
+CACHE_RETRY_SECONDS = 5
+# Concurrent requests for the same expensive result wait for one computation. With a
+# shared CACHE_URL the workers also coordinate through a lock in the store.
+SINGLE_FLIGHT_SHARED = os.getenv('SINGLE_FLIGHT_SHARED', '1') == '1'
+SINGLE_FLIGHT_WAIT_SECONDS = float(os.getenv('SINGLE_FLIGHT_WAIT_SECONDS', 30))  # Then waiters compute it themselves
+# --- Idempotency Keys ---
+# Writes sent with an Idempotency-Key header keep their first response this long and
+# replay it to retries. Stored in CACHE_URL when set, else in a store of this size.
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv('IDEMPOTENCY_TTL_SECONDS', 24 * 3600))
+IDEMPOTENCY_MAX_BYTES = int(os.getenv('IDEMPOTENCY_MAX_BYTES', 8 * 1024 * 1024))
+IDEMPOTENCY_CLAIM_SECONDS = 60  # A request still running after this long no longer blocks its retries
+# --- Asynchronous Report Intake ---
+# ASYNC_REPORTS=1 queues submitted reports in a SQLite file (shared by the processes
+# of one host) and writes them to MySQL in the background. Past REPORT_QUEUE_MAX_DEPTH
+# waiting reports, new submissions are turned away with 503 and Retry-After.
+ASYNC_REPORTS = os.getenv('ASYNC_REPORTS', '0') == '1'
+REPORT_QUEUE_PATH = os.getenv('REPORT_QUEUE_PATH', 'report_queue.sqlite3')
+REPORT_QUEUE_MAX_DEPTH = int(os.getenv('REPORT_QUEUE_MAX_DEPTH', 5000))
+REPORT_QUEUE_WORKERS = int(os.getenv('REPORT_QUEUE_WORKERS', 2))  # Drain threads per web process; 0 leaves it to `reports drain`
+REPORT_QUEUE_BATCH_SIZE = 200
+REPORT_QUEUE_RETRY_AFTER = 30  # Seconds
+# --- Issue IDs ---
+# CS-<date>-<13 Crockford base32 digits>: the digits encode 41 bits of milliseconds
+# since ISSUE_ID_EPOCH_MS, a 10-bit worker ID and a 12-bit sequence, so new IDs sort
+# by creation time. Set ISSUE_ID_WORKER_ID (0-1023) per process on hosts that share
+# no CACHE_URL; otherwise worker IDs are assigned automatically.
+ISSUE_ID_WORKER_ID = int(os.environ['ISSUE_ID_WORKER_ID']) if os.getenv('ISSUE_ID_WORKER_ID') else None
+ISSUE_ID_EPOCH_MS = 1704067200000  # 2024-01-01T00:00:00Z
+ISSUE_ID_WORKER_BITS = 10
+ISSUE_ID_SEQUENCE_BITS = 12
+ISSUE_ID_DIGITS = 13
+CROCKFORD_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+ISSUE_ID_PATTERN = re.compile(r'CS-\d{8}-[0-9A-HJKMNP-TV-Z]{13}')
+# --- Event Bus ---
+# Transport of application events between workers: empty keeps them in the process,
+# redis://host:port/db fans them out (defaults to the cache store).
+EVENT_BUS_URL = os.getenv('EVENT_BUS_URL', CACHE_URL)
+EVENT_BUS_BUFFER = int(os.getenv('EVENT_BUS_BUFFER', 500))  # Recent events each worker keeps for the live feed
+
 # --- ADD THIS BLOCK FOR FILE LOGGING ---
 log_formatter = logging.Formatter('%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]')
 log_handler = RotatingFileHandler('app.log', maxBytes=10240, backupCount=10)
@@ -60,187 +164,3020 @@ app.logger.info('Civicsense AI application starting up...')
 # Database and Helper Functions
 # -----------------------------------------------------------------------------
 
+class DatabaseUnavailable(Exception):
+    """Raised when no pooled connection becomes free within the configured timeout."""
+
+
+class DBConnectionPool:
+    """Bounded MySQL connection pool with a max-wait timeout and usage statistics.
+
+    mysql.connector's pool fails immediately when it is exhausted, so a semaphore with
+    one slot per pooled connection makes callers queue for up to `acquire_timeout`
+    seconds instead. The underlying pool is created lazily on first use so the app can
+    still boot while the database is down.
+    """
+
+    def __init__(self, connection_config, pool_config):
+        self._connection_config = connection_config
+        self.pool_name = pool_config['pool_name']
+        self.pool_size = pool_config['pool_size']
+        self.reset_session = pool_config['pool_reset_session']
+        self.acquire_timeout = pool_config['acquire_timeout']
+        self.isolation_level = pool_config.get('isolation_level')
+        self._pool = None
+        self._init_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._errors = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _get_pool(self):
+        if self._pool is None:
+            with self._init_lock:
+                if self._pool is None:
+                    self._pool = mysql.connector.pooling.MySQLConnectionPool(
+                        pool_name=self.pool_name,
+                        pool_size=self.pool_size,
+                        pool_reset_session=self.reset_session,
+                        # Drain unread rows instead of poisoning the next borrower of the connection
+                        consume_results=True,
+                        **self._connection_config
+                    )
+        return self._pool
+
+    def acquire(self):
+        """Checks out a healthy connection, waiting up to `acquire_timeout` seconds for a free slot."""
+        started = time.monotonic()
+        with self._stats_lock:
+            self._waiting += 1
+        acquired = self._slots.acquire(timeout=self.acquire_timeout)
+        waited = time.monotonic() - started
+        with self._stats_lock:
+            self._waiting -= 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            if not acquired:
+                self._timeouts += 1
+        if not acquired:
+            raise DatabaseUnavailable(f"No database connection available after {waited:.2f}s")
+
+        try:
+            # Pre-ping: get_connection() checks is_connected() (a COM_PING round trip)
+            # on the borrowed connection and transparently reconnects stale ones.
+            conn = self._get_pool().get_connection()
+        except Exception:
+            self._slots.release()
+            with self._stats_lock:
+                self._errors += 1
+            raise
+
+        with self._stats_lock:
+            self._in_use += 1
+            self._checkouts += 1
+        if self.isolation_level:
+            # Session settings are reset when a connection is returned, so this runs per checkout
+            try:
+                conn.cmd_query(f"SET SESSION TRANSACTION ISOLATION LEVEL {self.isolation_level}")
+            except mysql.connector.Error:
+                self.release(conn)
+                with self._stats_lock:
+                    self._errors += 1
+                raise
+        return conn
+
+    def release(self, conn):
+        """Returns a connection obtained from acquire() to the pool."""
+        try:
+            conn.close()
+        except mysql.connector.Error as err:
+            # close() re-queues the connection even when the session reset fails;
+            # the next checkout's ping will reconnect it.
+            print(f"Error returning connection to pool: {err}")
+        finally:
+            with self._stats_lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def health_check(self):
+        """Runs a trivial query on a pooled connection. Returns True when the database answers."""
+        try:
+            conn = self.acquire()
+        except (DatabaseUnavailable, mysql.connector.Error):
+            return False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except mysql.connector.Error:
+            return False
+        finally:
+            self.release(conn)
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'pool_name': self.pool_name,
+                'pool_size': self.pool_size,
+                'in_use': self._in_use,
+                'idle': self.pool_size - self._in_use,
+                'waiting': self._waiting,
+                'checkouts': self._checkouts,
+                'timeouts': self._timeouts,
+                'errors': self._errors,
+                'avg_wait_ms': round(self._total_wait / (self._checkouts + self._timeouts) * 1000, 3) if (self._checkouts + self._timeouts) else 0.0,
+                'max_wait_ms': round(self._max_wait * 1000, 3),
+                'acquire_timeout_s': self.acquire_timeout,
+            }
+
+
+class PooledConnection:
+    """Wraps a pooled connection so that close() hands it back through DBConnectionPool.
+
+    Request-scoped connections ignore close() from the route code; they are released
+    once by the app-context teardown, so every helper running in the same request
+    reuses the same connection. The wrapper also caches server-side prepared
+    cursors for the hot queries executed on it.
+    """
+
+    def __init__(self, pool, conn, request_scoped=False):
+        self._pool = pool
+        self._conn = conn
+        self._request_scoped = request_scoped
+        self._prepared = {}
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def prepared_cursor(self, sql):
+        """Returns a prepared dictionary cursor for `sql`, reused for the lifetime of the checkout."""
+        cursor = self._prepared.get(sql)
+        if cursor is None:
+            cursor = self._conn.cursor(prepared=True, dictionary=True)
+            self._prepared[sql] = cursor
+        return cursor
+
+    def close(self):
+        if not self._request_scoped:
+            self.release()
+
+    def release(self):
+        if self._conn is None:
+            return
+        try:
+            for cursor in self._prepared.values():
+                cursor.close()
+            self._prepared.clear()
+            if self._conn.in_transaction:
+                self._conn.rollback()
+        except mysql.connector.Error as err:
+            print(f"Error cleaning up pooled connection: {err}")
+        finally:
+            self._pool.release(self._conn)
+            self._conn = None
+
+
+db_pool = DBConnectionPool(db_config, db_pool_config)
+export_pool = DBConnectionPool(db_config, export_pool_config)
+
+# Frequently executed statements that run through server-side prepared statements.
+HOT_QUERIES = {
+    'user_by_email': "SELECT * FROM users WHERE email = %s",
+    'issue_by_pk': "SELECT * FROM issues WHERE id = %s",
+    'issue_status_by_issue_id': "SELECT issue_id, issueCategory, customIssueType, locationAddress, priority, status, submitted_at FROM issues WHERE issue_id = %s",
+    'issue_history': "SELECT * FROM issue_status_history WHERE issue_id_ref = %s ORDER BY created_at ASC",
+    'issue_history_public': "SELECT id, status, notes, created_at FROM issue_status_history WHERE issue_id_ref = %s ORDER BY created_at ASC",
+}
+
+
+def run_hot_query(conn, name, params, one=False):
+    """Executes a HOT_QUERIES statement as a prepared statement and returns its rows as dicts."""
+    cursor = conn.prepared_cursor(HOT_QUERIES[name])
+    cursor.execute(HOT_QUERIES[name], params)
+    rows = cursor.fetchall()
+    if one:
+        return rows[0] if rows else None
+    return rows
+
+
+class CacheBackendError(Exception):
+    """Raised when the cache store cannot be reached or rejects a command."""
+
+
+class CacheBackend:
+    """Store behind QueryCache: byte values with optional expiry, integer hash counters and pub/sub.
+
+    subscribe() callbacks may run on a background thread; `on_connect` runs every time
+    the subscription is (re)established, before any message of that connection is
+    delivered. `subscribed` tells whether broadcasts are currently being received.
+    """
+
+    name = 'base'
+    subscribed = False
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=None):
+        """Stores `value`; raises CacheBackendError when it is not stored."""
+        raise NotImplementedError
+
+    def add(self, key, value, ttl=None):
+        """Stores `value` only if `key` is absent; True when it was stored."""
+        raise NotImplementedError
+
+    def delete(self, *keys):
+        raise NotImplementedError
+
+    def hincrby(self, name, field, amount=1):
+        raise NotImplementedError
+
+    def hgetall(self, name):
+        raise NotImplementedError
+
+    def hmget(self, name, *fields):
+        """Integer values of `fields` (None for missing ones), in order."""
+        raise NotImplementedError
+
+    def hset(self, name, field, value):
+        raise NotImplementedError
+
+    def hset_many(self, name, mapping):
+        """Sets several integer fields of a hash in one command."""
+        raise NotImplementedError
+
+    def hdel(self, name, *fields):
+        raise NotImplementedError
+
+    def publish(self, channel, message):
+        raise NotImplementedError
+
+    def subscribe(self, channel, callback, on_connect=None):
+        raise NotImplementedError
+
+    def flush(self):
+        raise NotImplementedError
+
+    def stats(self):
+        return {'backend': self.name}
+
+
+class LocalCacheBackend(CacheBackend):
+    """In-process store: an LRU bounded by the byte size of its values. Broadcasts stay in the process."""
+
+    name = 'local'
+    subscribed = True
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // 16
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._hashes = {}
+        self._subscribers = {}
+        self._bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _drop(self, key):
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] is not None and time.monotonic() >= entry[0]:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _store(self, key, value, ttl):
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (time.monotonic() + ttl if ttl else None, value)
+        self._bytes += len(value)
+        while self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self._evictions += 1
+
+    def set(self, key, value, ttl=None):
+        if len(value) > self.max_entry_bytes:
+            # The key's old value is outdated by this write, so it must not stay either
+            self.delete(key)
+            raise CacheBackendError(f"Value of {len(value)} bytes exceeds the {self.max_entry_bytes}-byte entry limit")
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def add(self, key, value, ttl=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or time.monotonic() < entry[0]):
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    def delete(self, *keys):
+        with self._lock:
+            present = [key for key in keys if key in self._entries]
+            for key in present:
+                self._drop(key)
+            return len(present)
+
+    def hincrby(self, name, field, amount=1):
+        with self._lock:
+            fields = self._hashes.setdefault(name, {})
+            fields[field] = fields.get(field, 0) + amount
+            return fields[field]
+
+    def hgetall(self, name):
+        with self._lock:
+            return dict(self._hashes.get(name, {}))
+
+    def hmget(self, name, *fields):
+        with self._lock:
+            values = self._hashes.get(name, {})
+            return [values.get(field) for field in fields]
+
+    def hset(self, name, field, value):
+        with self._lock:
+            fields = self._hashes.setdefault(name, {})
+            created = field not in fields
+            fields[field] = int(value)
+            return int(created)
+
+    def hset_many(self, name, mapping):
+        with self._lock:
+            fields = self._hashes.setdefault(name, {})
+            created = sum(1 for field in mapping if field not in fields)
+            fields.update((field, int(value)) for field, value in mapping.items())
+            return created
+
+    def hdel(self, name, *fields):
+        with self._lock:
+            values = self._hashes.get(name, {})
+            present = [field for field in fields if field in values]
+            for field in present:
+                del values[field]
+            return len(present)
+
+    def publish(self, channel, message):
+        callbacks = list(self._subscribers.get(channel, ()))
+        for callback in callbacks:
+            callback(message)
+        return len(callbacks)
+
+    def subscribe(self, channel, callback, on_connect=None):
+        self._subscribers.setdefault(channel, []).append(callback)
+        if on_connect:
+            on_connect()
+
+    def flush(self):
+        with self._lock:
+            self._entries.clear()
+            self._hashes.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'backend': self.name,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self._evictions,
+                # Counters are kept outside max_bytes; their owners prune them
+                'hash_fields': sum(len(fields) for fields in self._hashes.values()),
+            }
+
+
+def _resp_encode(*args):
+    """A command in the Redis serialization protocol (an array of bulk strings)."""
+    parts = [b'*%d\r\n' % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode('utf-8')
+        elif not isinstance(arg, bytes):
+            arg = str(arg).encode('ascii')
+        parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+    return b''.join(parts)
+
+
+def _resp_read(reader):
+    """Reads one RESP value from a binary file object. Error replies raise CacheBackendError."""
+    line = reader.readline()
+    if not line.endswith(b'\r\n'):
+        raise ConnectionError('Connection closed by the cache server')
+    kind, rest = line[:1], line[1:-2]
+    if kind == b'+':
+        return rest.decode('utf-8')
+    if kind == b'-':
+        raise CacheBackendError(rest.decode('utf-8'))
+    if kind == b':':
+        return int(rest)
+    if kind == b'$':
+        length = int(rest)
+        if length < 0:
+            return None
+        data = reader.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError('Connection closed by the cache server')
+        return data[:-2]
+    if kind == b'*':
+        length = int(rest)
+        return None if length < 0 else [_resp_read(reader) for _ in range(length)]
+    raise ConnectionError(f"Unexpected reply from the cache server: {line[:40]!r}")
+
+
+class RespCacheBackend(CacheBackend):
+    """Shared store on a Redis-protocol server (Redis, Valkey, KeyDB or LocalCacheServer).
+
+    Each thread keeps its own connection; the subscription runs on a daemon thread
+    that reconnects with a one second back-off. No client library is needed.
+    """
+
+    name = 'resp'
+
+    def __init__(self, url, timeout=0.5):
+        parsed = urllib.parse.urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.strip('/') or 0)
+        self.password = parsed.password
+        self.timeout = timeout
+        self.subscribed = False
+        self._local = threading.local()
+        self._errors = 0
+        self._retry_at = 0.0
+
+    def _connect(self, timeout):
+        sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reader = sock.makefile('rb')
+        if self.password:
+            sock.sendall(_resp_encode('AUTH', self.password))
+            _resp_read(reader)
+        if self.db:
+            sock.sendall(_resp_encode('SELECT', self.db))
+            _resp_read(reader)
+        return sock, reader
+
+    def execute(self, *args):
+        # After a failure the server is left alone for a few seconds instead of
+        # making every request wait for another connect timeout
+        if time.monotonic() < self._retry_at:
+            raise CacheBackendError(f"Cache server {self.host}:{self.port} unavailable (retrying shortly)")
+        connection = getattr(self._local, 'connection', None)
+        # A connection inherited through fork() is shared with the parent; never reuse it
+        if connection is not None and connection[0] != os.getpid():
+            connection = None
+        try:
+            if connection is None:
+                connection = (os.getpid(),) + self._connect(self.timeout)
+                self._local.connection = connection
+            _, sock, reader = connection
+            sock.sendall(_resp_encode(*args))
+            return _resp_read(reader)
+        except CacheBackendError:
+            raise
+        except (OSError, ConnectionError) as err:
+            self._errors += 1
+            self._retry_at = time.monotonic() + CACHE_RETRY_SECONDS
+            if connection is not None:
+                connection[1].close()
+            self._local.connection = None
+            raise CacheBackendError(f"Cache server {self.host}:{self.port} unavailable: {err}")
+
+    def get(self, key):
+        return self.execute('GET', key)
+
+    def set(self, key, value, ttl=None):
+        if ttl:
+            return self.execute('SET', key, value, 'PX', int(ttl * 1000))
+        return self.execute('SET', key, value)
+
+    def add(self, key, value, ttl=None):
+        if ttl:
+            return self.execute('SET', key, value, 'PX', int(ttl * 1000), 'NX') is not None
+        return self.execute('SET', key, value, 'NX') is not None
+
+    def delete(self, *keys):
+        return self.execute('DEL', *keys) if keys else 0
+
+    def hincrby(self, name, field, amount=1):
+        return self.execute('HINCRBY', name, field, amount)
+
+    def hgetall(self, name):
+        flat = self.execute('HGETALL', name) or []
+        return {flat[i].decode('utf-8'): int(flat[i + 1]) for i in range(0, len(flat), 2)}
+
+    def hmget(self, name, *fields):
+        return [None if value is None else int(value) for value in self.execute('HMGET', name, *fields)]
+
+    def hset(self, name, field, value):
+        return self.execute('HSET', name, field, value)
+
+    def hset_many(self, name, mapping):
+        args = []
+        for field, value in mapping.items():
+            args += [field, value]
+        return self.execute('HSET', name, *args) if args else 0
+
+    def hdel(self, name, *fields):
+        return self.execute('HDEL', name, *fields) if fields else 0
+
+    def publish(self, channel, message):
+        return self.execute('PUBLISH', channel, message)
+
+    def subscribe(self, channel, callback, on_connect=None):
+        threading.Thread(target=self._listen, args=(channel, callback, on_connect),
+                         name=f'cache-subscriber-{channel}', daemon=True).start()
+
+    def _listen(self, channel, callback, on_connect):
+        while True:
+            sock = None
+            try:
+                sock, reader = self._connect(self.timeout)
+                sock.sendall(_resp_encode('SUBSCRIBE', channel))
+                _resp_read(reader)  # ['subscribe', channel, 1]
+                sock.settimeout(None)
+                if on_connect:
+                    on_connect()
+                self.subscribed = True
+                while True:
+                    reply = _resp_read(reader)
+                    if isinstance(reply, list) and reply and reply[0] == b'message':
+                        callback(reply[2])
+            except (OSError, ConnectionError, CacheBackendError) as err:
+                if self.subscribed:
+                    print(f"Cache subscription to '{channel}' lost: {err}")
+            finally:
+                self.subscribed = False
+                if sock is not None:
+                    sock.close()
+            time.sleep(1)
+
+    def flush(self):
+        return self.execute('FLUSHDB')
+
+    def stats(self):
+        return {
+            'backend': self.name,
+            'address': f"{self.host}:{self.port}/{self.db}",
+            'subscribed': self.subscribed,
+            'errors': self._errors,
+        }
+
+
+def create_cache_backend(url):
+    """LocalCacheBackend for an empty URL, RespCacheBackend for redis:// URLs."""
+    if not url:
+        return LocalCacheBackend(QUERY_CACHE_MAX_BYTES)
+    if url.startswith(('redis://', 'resp://')):
+        return RespCacheBackend(url)
+    raise ValueError(f"Unsupported CACHE_URL '{url}'")
+
+
+class QueryCache:
+    """Query result cache with exact, table-level invalidation, kept in a CacheBackend.
+
+    Each result remembers the version counters of the tables it was read from. Write
+    paths bump those counters right after committing (invalidate_tables()), so a result
+    is only served while none of its tables has changed. The counters live in a hash
+    in the backend, shared by all workers; each worker mirrors it and receives every
+    bump as a broadcast, so a lookup costs a single round trip. While the broadcast
+    subscription is down, versions are read from the store instead. The hash also
+    holds a random epoch that every result is stored under: when the hash is lost
+    (flushed or evicted) its counters restart, so a new epoch is drawn and workers
+    reload their mirror instead of waiting for the counters to pass their old values.
+
+    Results are stored pickled: the backend bounds its size in bytes, and every hit
+    hands the caller a private copy that it is free to modify. A store that cannot be
+    reached turns into cache misses, never into failed requests.
+    """
+
+    def __init__(self, backend, namespace='civicsense'):
+        self.backend = backend
+        self._entry_prefix = f'{namespace}:query:'
+        self._versions_key = f'{namespace}:table_versions'
+        self._channel = f'{namespace}:invalidate'
+        self._epoch = None
+        self._versions = {}
+        self._subscribe_lock = threading.Lock()
+        self._subscribed_pid = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidated = 0
+        self._errors = 0
+
+    def _ensure_subscribed(self):
+        # Started lazily (and again after a fork) so that every worker process has its own listener
+        if self._subscribed_pid != os.getpid():
+            with self._subscribe_lock:
+                if self._subscribed_pid != os.getpid():
+                    self._subscribed_pid = os.getpid()
+                    self.backend.subscribe(self._channel, self._on_invalidate, on_connect=self._load_versions)
+
+    def _rotate_epoch(self):
+        self.backend.hset(self._versions_key, 'epoch', uuid.uuid4().int >> 80)
+
+    def _read_versions(self):
+        # (epoch, table versions) from the store; a hash without an epoch was lost and restarts
+        versions = self.backend.hgetall(self._versions_key)
+        if 'epoch' not in versions:
+            self._rotate_epoch()
+            versions = self.backend.hgetall(self._versions_key)
+        return versions.pop('epoch', None), versions
+
+    def _load_versions(self):
+        epoch, versions = self._read_versions()
+        with self._lock:
+            self._epoch, self._versions = epoch, versions
+
+    def _on_invalidate(self, message):
+        if isinstance(message, bytes):
+            message = message.decode('utf-8')
+        bump = json.loads(message)
+        with self._lock:
+            # A counter below the mirror's means the hash restarted (or bumps crossed); reread it
+            reload = bump.get('reset') or bump['version'] < self._versions.get(bump['table'], 0)
+            if not reload:
+                self._versions[bump['table']] = bump['version']
+        if reload:
+            self._load_versions()
+
+    def table_versions(self, tables):
+        """Current epoch and versions of `tables`, or None when they cannot be read."""
+        self._ensure_subscribed()
+        if self.backend.subscribed:
+            with self._lock:
+                return (self._epoch,) + tuple(self._versions.get(table, 0) for table in tables)
+        try:
+            epoch, versions = self._read_versions()
+        except CacheBackendError:
+            with self._lock:
+                self._errors += 1
+            return None
+        return (epoch,) + tuple(versions.get(table, 0) for table in tables)
+
+    def _entry_key(self, key):
+        return self._entry_prefix + hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """The cached rows for `key`, or None when absent, stale or expired."""
+        try:
+            payload = self.backend.get(self._entry_key(key))
+            if payload is not None:
+                tables, versions, rows = pickle.loads(payload)
+                if versions == self.table_versions(tables):
+                    with self._lock:
+                        self._hits += 1
+                    return rows
+                with self._lock:
+                    self._invalidated += 1
+        except CacheBackendError as err:
+            print(f"Query cache unavailable: {err}")
+            with self._lock:
+                self._errors += 1
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, key, tables, versions, rows, ttl=None):
+        """Stores rows read while `tables` were at `versions` (taken before the query ran)."""
+        if versions is None:
+            return
+        payload = pickle.dumps((tuple(tables), versions, rows), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            self.backend.set(self._entry_key(key), payload, ttl or QUERY_CACHE_ENTRY_TTL)
+        except CacheBackendError as err:
+            print(f"Query result not cached: {err}")
+            with self._lock:
+                self._errors += 1
+
+    def invalidate(self, *tables):
+        self._ensure_subscribed()
+        for table in tables:
+            reset = False
+            try:
+                version = self.backend.hincrby(self._versions_key, table)
+                if version == 1 and self.backend.hmget(self._versions_key, 'epoch')[0] is None:
+                    # First bump into a lost hash: nothing stored under the old epoch may match again
+                    self._rotate_epoch()
+                    reset = True
+                self.backend.publish(self._channel, json.dumps({'table': table, 'version': version, 'reset': reset}))
+                if reset:
+                    self._load_versions()
+                    continue
+            except CacheBackendError as err:
+                # Other workers keep serving this table until the entries expire
+                print(f"Could not broadcast invalidation of '{table}': {err}")
+                with self._lock:
+                    self._errors += 1
+                    version = self._versions.get(table, 0) + 1
+            with self._lock:
+                self._versions[table] = max(self._versions.get(table, 0), version)
+
+    def clear(self):
+        """Invalidates every table seen so far (in all workers sharing the store)."""
+        with self._lock:
+            tables = list(self._versions)
+        self.invalidate(*tables)
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            stats = {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0,
+                'invalidated': self._invalidated,
+                'errors': self._errors,
+                'table_versions': dict(self._versions),
+            }
+        stats['store'] = self.backend.stats()
+        return stats
+
+
+query_cache = QueryCache(create_cache_backend(CACHE_URL))
+
+# Tables whose contents change with every write to `issues` (the write hooks keep them in step)
+ISSUE_TABLES = ('issues', 'issue_status_history', 'issue_rollup_hourly', 'user_issue_stats')
+
+
+def cached_query(cursor, sql, params=(), tables=(), one=False, ttl=None):
+    """Runs a read-only statement through query_cache and returns its rows (or the first row).
+
+    `tables` lists every table the statement reads. `ttl` (seconds) is only for
+    statements that depend on the clock, e.g. NOW() windows, which no table version
+    can invalidate. The versions are read before the statement runs, so its connection
+    must read at READ COMMITTED (as db_pool's do): an older snapshot would store old
+    rows under new versions.
+    """
+    if not QUERY_CACHE_ENABLED:
+        cursor.execute(sql, tuple(params))
+        rows = cursor.fetchall()
+    else:
+        # The cursor class decides the row shape (tuples or dicts), so it is part of the key
+        key = (type(cursor).__name__, ' '.join(sql.split()), tuple(params))
+        rows = query_cache.get(key)
+        if rows is None:
+            versions = query_cache.table_versions(tables)
+            cursor.execute(sql, tuple(params))
+            rows = cursor.fetchall()
+            query_cache.put(key, tables, versions, rows, ttl)
+    if one:
+        return rows[0] if rows else None
+    return rows
+
+
+# Writes touching more issues than this bump 'issue:*' instead of every issue
+CHANGE_VERSIONS_MAX_ISSUE_KEYS = 100
+CHANGE_VERSIONS_RETENTION = 7 * 86400  # Seconds a row's last change stays recorded
+CHANGE_VERSIONS_PRUNE_SECONDS = 3600
+
+
+class ChangeVersions:
+    """Change versions of single users and issues, behind the validators of conditional GETs.
+
+    The versions live in a hash of the cache store, next to the table versions, so
+    all workers sharing the store agree on them. The issue write hooks record which
+    issues (and owners) a transaction touches; after the commit, invalidate_tables()
+    draws the next number of a shared sequence and stores it, with the time, under
+    each of them in one command. A poll that sees a new version also sees the new rows.
+    Writes touching more than CHANGE_VERSIONS_MAX_ISSUE_KEYS issues bump 'issue:*'
+    instead, which every lookup of an issue reads as well.
+
+    Keys unchanged for CHANGE_VERSIONS_RETENTION are pruned, so the hash stays bounded.
+    Missing keys read as 'floor', a sequence number drawn at the last pruning, so a key
+    never shows a version it had before. The hash holds a random epoch as well: after
+    the store is flushed or restarted, or a bump was lost, the epoch changes and no
+    earlier validator matches again.
+    """
+
+    def __init__(self, backend, namespace='civicsense'):
+        self.backend = backend
+        self._key = f'{namespace}:change_versions'
+        self._pending = threading.local()
+        self._lost = False
+        self._next_prune = 0.0
+
+    def record(self, kind, ids):
+        """Remembers that the `kind` ('user' or 'issue') rows `ids` are being changed."""
+        keys = getattr(self._pending, 'keys', None)
+        if keys is None:
+            keys = self._pending.keys = set()
+        keys.update(f'{kind}:{value}' for value in ids if value is not None)
+
+    def discard_pending(self):
+        self._pending.keys = None
+
+    def _rotate_epoch(self):
+        self.backend.hset(self._key, 'epoch', uuid.uuid4().int >> 80)
+        self._lost = False
+
+    def flush(self):
+        """Bumps the versions of everything recorded on this thread. Call after the commit."""
+        keys = getattr(self._pending, 'keys', None)
+        self._pending.keys = None
+        if not keys:
+            return
+        issue_keys = {key for key in keys if key.startswith('issue:')}
+        if len(issue_keys) > CHANGE_VERSIONS_MAX_ISSUE_KEYS:
+            keys = (keys - issue_keys) | {'issue:*'}
+        now = int(time.time())
+        try:
+            if self._lost:
+                self._rotate_epoch()
+            version = self.backend.hincrby(self._key, 'seq')
+            if version == 1:
+                # A new sequence (first use, or the hash was lost) could repeat earlier versions
+                self._rotate_epoch()
+            fields = {}
+            for key in keys:
+                fields[key] = version
+                fields[key + ':at'] = now
+            self.backend.hset_many(self._key, fields)
+        except CacheBackendError as err:
+            print(f"Could not record changes of {len(keys)} rows: {err}")
+            self._lost = True
+            return
+        if time.monotonic() >= self._next_prune:
+            self._next_prune = time.monotonic() + CHANGE_VERSIONS_PRUNE_SECONDS
+            self.prune()
+
+    def prune(self, retention=CHANGE_VERSIONS_RETENTION):
+        """Drops the keys unchanged for `retention` seconds. Returns how many were dropped.
+
+        Runs in at most one worker per CHANGE_VERSIONS_PRUNE_SECONDS.
+        """
+        try:
+            if not self.backend.add(self._key + ':pruning', str(os.getpid()), CHANGE_VERSIONS_PRUNE_SECONDS):
+                return 0
+            cutoff = int(time.time()) - retention
+            stale = [field[:-len(':at')] for field, value in self.backend.hgetall(self._key).items()
+                     if field.endswith(':at') and value < cutoff]
+            if stale:
+                # Raised before the keys go, so none of them can read an older version
+                self.backend.hset(self._key, 'floor', self.backend.hincrby(self._key, 'seq'))
+                for start in range(0, len(stale), 1000):
+                    chunk = stale[start:start + 1000]
+                    self.backend.hdel(self._key, *chunk, *(key + ':at' for key in chunk))
+            return len(stale)
+        except CacheBackendError as err:
+            print(f"Could not prune change versions: {err}")
+            return 0
+
+    def lookup(self, keys):
+        """(epoch, versions, last change as a Unix time or None) of `keys`, or None when the store is down."""
+        keys = list(keys)
+        if 'issue:*' not in keys and any(key.startswith('issue:') for key in keys):
+            keys.append('issue:*')
+        fields = ['epoch', 'floor']
+        for key in keys:
+            fields += [key, key + ':at']
+        try:
+            if self._lost:
+                self._rotate_epoch()
+            values = self.backend.hmget(self._key, *fields)
+            if values[0] is None:
+                self._rotate_epoch()
+                values = self.backend.hmget(self._key, *fields)
+        except CacheBackendError as err:
+            print(f"Change versions unavailable: {err}")
+            return None
+        floor = values[1] or 0
+        versions = tuple(floor if value is None else value for value in values[2::2])
+        changed = [value for value in values[3::2] if value]
+        return values[0], versions, max(changed) if changed else None
+
+
+change_versions = ChangeVersions(query_cache.backend)
+
+
+def invalidate_tables(*tables):
+    """Marks cached results that read any of `tables` as stale. Call after conn.commit().
+
+    Also bumps the change versions of the issues and users written on this thread.
+    """
+    query_cache.invalidate(*tables)
+    change_versions.flush()
+
+
+@app.teardown_appcontext
+def discard_change_versions(exception=None):
+    # Changes recorded by a request that never committed
+    change_versions.discard_pending()
+
+
+def conditional_get(scope, period=None):
+    """Answers polls of a GET endpoint with 304 Not Modified while nothing it reads has changed.
+
+    `scope()` runs inside the request, before the view, and lists the change keys the
+    response depends on: ('user', id), ('issue', id) or ('table', name). It returns None
+    to skip validation, e.g. without a session, so the view can answer the 401. Views
+    that also depend on the clock pass `period`: the validators then change every
+    `period` seconds. Checking costs one round trip to the cache store and no queries.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            keys = scope(*args, **kwargs)
+            validators = request_validators(keys, period) if keys is not None else None
+            if validators is None:
+                return view(*args, **kwargs)
+            etag, last_modified = validators
+            if request.if_none_match:
+                fresh = request.if_none_match.contains_weak(etag)
+            else:
+                fresh = (last_modified is not None and request.if_modified_since is not None
+                         and last_modified <= request.if_modified_since)
+            if fresh:
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            # Browsers keep the body and revalidate it on every poll
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            response.vary.add('Cookie')
+            return response
+        return wrapper
+    return decorator
+
+
+def request_validators(keys, period=None):
+    """(ETag, Last-Modified) of the current request for the change `keys`, or None when unknown."""
+    tables = [name for kind, name in keys if kind == 'table']
+    rows = [f'{kind}:{value}' for kind, value in keys if kind != 'table']
+    looked_up = change_versions.lookup(rows)
+    table_versions = query_cache.table_versions(tables) if tables else ()
+    if looked_up is None or table_versions is None:
+        return None
+    epoch, versions, changed_at = looked_up
+    viewer = (session.get('user_id'), session.get('admin_id'))
+    clock = int(time.time() // period) if period else None
+    digest = hashlib.sha1(repr((epoch, request.full_path, viewer, rows, versions, tables,
+                                table_versions, clock)).encode('utf-8')).hexdigest()[:24]
+    last_modified = None
+    # Only a second that has fully passed can be a validator: another change may still land in it
+    if changed_at is not None and changed_at < int(time.time()) and not tables and not period:
+        last_modified = datetime.fromtimestamp(changed_at, timezone.utc)
+    return digest, last_modified
+
+
+def user_change_scope(*args, **kwargs):
+    """conditional_get() scope of views showing the logged-in user's own issues."""
+    if 'user_id' not in session or 'user_email' not in session:
+        return None
+    return [('user', session['user_id'])]
+
+
+def admin_issue_scope(*args, **kwargs):
+    """conditional_get() scope of admin views over all issues."""
+    if 'admin_id' not in session:
+        return None
+    return [('table', table) for table in ISSUE_TABLES]
+
+
+class LocalCacheServer(socketserver.ThreadingTCPServer):
+    """Pure-Python stand-in for a Redis server, for development, tests and benchmarks.
+
+    Speaks the part of RESP that RespCacheBackend uses (GET, SET with EX/PX/NX, DEL,
+    HINCRBY, HSET, HDEL, HGETALL, HMGET, PUBLISH, SUBSCRIBE, FLUSHDB, PING) and keeps its data in a
+    LocalCacheBackend. Start one with `flask --app app cache serve`.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, max_bytes=QUERY_CACHE_MAX_BYTES):
+        super().__init__(address, _LocalCacheRequestHandler)
+        self.store = LocalCacheBackend(max_bytes)
+        self.store.max_entry_bytes = max_bytes
+        self.channels = {}  # channel -> set of subscribed handlers
+        self.channels_lock = threading.Lock()
+
+
+class _LocalCacheRequestHandler(socketserver.StreamRequestHandler):
+
+    def setup(self):
+        super().setup()
+        self.write_lock = threading.Lock()
+        self.channels = set()
+
+    def send(self, reply):
+        with self.write_lock:
+            self.wfile.write(self._encode(reply))
+            self.wfile.flush()
+
+    def _encode(self, reply):
+        if reply is None:
+            return b'$-1\r\n'
+        if isinstance(reply, Exception):
+            return f"-ERR {reply}\r\n".encode('utf-8')
+        if isinstance(reply, str):
+            return f"+{reply}\r\n".encode('utf-8')
+        if isinstance(reply, int):
+            return b':%d\r\n' % reply
+        if isinstance(reply, (list, tuple)):
+            return b'*%d\r\n' % len(reply) + b''.join(self._encode(item) for item in reply)
+        return b'$%d\r\n%s\r\n' % (len(reply), reply)
+
+    def handle(self):
+        try:
+            while True:
+                try:
+                    command = _resp_read(self.rfile)
+                except (ConnectionError, OSError):
+                    break
+                if not command:
+                    continue
+                name, args = command[0].decode('utf-8').upper(), command[1:]
+                if name == 'QUIT':
+                    self.send('OK')
+                    break
+                try:
+                    reply = self.dispatch(name, args)
+                except (ValueError, IndexError) as err:
+                    reply = CacheBackendError(f"bad arguments for '{name.lower()}': {err}")
+                except CacheBackendError as err:
+                    reply = err
+                if reply is not _NO_REPLY:
+                    self.send(reply)
+        finally:
+            with self.server.channels_lock:
+                for channel in self.channels:
+                    self.server.channels.get(channel, set()).discard(self)
+
+    def dispatch(self, name, args):
+        store = self.server.store
+        if name == 'PING':
+            return 'PONG'
+        if name in ('SELECT', 'AUTH'):
+            return 'OK'
+        if name == 'GET':
+            return store.get(args[0])
+        if name == 'SET':
+            ttl, only_new = None, False
+            options = [arg.upper() for arg in args[2:]]
+            for i, option in enumerate(options):
+                if option in (b'EX', b'PX'):
+                    ttl = int(options[i + 1]) / (1 if option == b'EX' else 1000)
+                elif option == b'NX':
+                    only_new = True
+            if only_new:
+                return 'OK' if store.add(args[0], args[1], ttl) else None
+            store.set(args[0], args[1], ttl)
+            return 'OK'
+        if name == 'DEL':
+            return store.delete(*args)
+        if name == 'HINCRBY':
+            return store.hincrby(args[0], args[1], int(args[2]))
+        if name == 'HSET':
+            if len(args) < 3 or len(args) % 2 == 0:
+                raise ValueError('expected field value pairs')
+            return store.hset_many(args[0], dict(zip(args[1::2], (int(value) for value in args[2::2]))))
+        if name == 'HDEL':
+            return store.hdel(args[0], *args[1:])
+        if name == 'HGETALL':
+            flat = []
+            for field, value in store.hgetall(args[0]).items():
+                flat += [field, str(value).encode('ascii')]
+            return flat
+        if name == 'HMGET':
+            return [None if value is None else str(value).encode('ascii') for value in store.hmget(args[0], *args[1:])]
+        if name == 'PUBLISH':
+            with self.server.channels_lock:
+                receivers = list(self.server.channels.get(args[0], ()))
+            for receiver in receivers:
+                try:
+                    receiver.send([b'message', args[0], args[1]])
+                except OSError:
+                    pass
+            return len(receivers)
+        if name == 'SUBSCRIBE':
+            for channel in args:
+                with self.server.channels_lock:
+                    self.server.channels.setdefault(channel, set()).add(self)
+                self.channels.add(channel)
+                self.send([b'subscribe', channel, len(self.channels)])
+            return _NO_REPLY
+        if name in ('FLUSHDB', 'FLUSHALL'):
+            store.flush()
+            return 'OK'
+        return CacheBackendError(f"unknown command '{name.lower()}'")
+
+
+_NO_REPLY = object()
+
+cache_cli = AppGroup('cache', help='Shared query cache utilities.')
+
+@cache_cli.command('serve')
+@click.option('--host', default='127.0.0.1')
+@click.option('--port', default=6380, type=int)
+@click.option('--max-mb', default=QUERY_CACHE_MAX_BYTES // (1024 * 1024), type=int, help='Memory bound of the stored values.')
+def cache_serve_command(host, port, max_mb):
+    """Run the pure-Python cache server (point workers at it with CACHE_URL=redis://HOST:PORT)."""
+    server = LocalCacheServer((host, port), max_bytes=max_mb * 1024 * 1024)
+    print(f"Cache server listening on {host}:{port} ({max_mb} MB). Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+app.cli.add_command(cache_cli)
+
+
+class _Flight:
+    """One in-progress computation of a SingleFlight key and the threads waiting for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent computations of the same key into one.
+
+    Threads of a worker that ask for a key while it is being computed wait for that
+    computation and share its result (or its exception) instead of repeating it. With
+    a shared `backend`, the first worker to take the key's lock in the store computes
+    it; the others wait for the result it leaves there. Nothing is cached beyond the
+    flight itself: a request arriving after it has landed starts a new one.
+    """
+
+    def __init__(self, backend=None, namespace='civicsense', wait=SINGLE_FLIGHT_WAIT_SECONDS, poll=0.02):
+        self.backend = backend
+        self.wait = wait
+        self.poll = poll
+        self._prefix = f'{namespace}:flight:'
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._shared = 0
+        self._shared_remote = 0
+        self._timeouts = 0
+
+    def do(self, key, compute):
+        """Returns compute(), or the result of the identical computation already under way."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._leaders += 1
+            else:
+                self._shared += 1
+        if not leader:
+            if not flight.done.wait(self.wait):
+                with self._lock:
+                    self._timeouts += 1
+                return compute()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = self._do_shared(key, compute) if self.backend else compute()
+            return flight.result
+        except Exception as err:
+            flight.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _do_shared(self, key, compute):
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        lock_key = self._prefix + 'lock:' + digest
+        token = f"{os.getpid()}:{threading.get_ident()}:{time.time_ns()}"
+        deadline = time.monotonic() + self.wait
+        try:
+            # The lock holds the leader's token, and the leader publishes its result under
+            # that token, so a waiter never picks up the result of an earlier flight
+            while not self.backend.add(lock_key, token, self.wait):
+                holder = self.backend.get(lock_key)
+                while holder is not None and time.monotonic() < deadline:
+                    # Lock first: the leader stores its result before releasing the lock
+                    current = self.backend.get(lock_key)
+                    payload = self.backend.get(self._prefix + 'result:' + holder.decode('utf-8'))
+                    if payload is not None:
+                        with self._lock:
+                            self._shared_remote += 1
+                        return pickle.loads(payload)
+                    if current != holder:
+                        break
+                    time.sleep(self.poll)
+                if time.monotonic() >= deadline:
+                    with self._lock:
+                        self._timeouts += 1
+                    return compute()
+        except CacheBackendError as err:
+            print(f"Single-flight lock unavailable: {err}")
+            return compute()
+
+        try:
+            result = compute()
+            try:
+                # Kept just long enough for the waiters to pick it up
+                self.backend.set(self._prefix + 'result:' + token,
+                                 pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL), 5)
+            except CacheBackendError as err:
+                print(f"Single-flight result not shared: {err}")
+            return result
+        finally:
+            try:
+                # Not atomic, but the lock only outlives its owner after `wait` seconds,
+                # when the waiters have stopped relying on it anyway
+                if self.backend.get(lock_key) == token.encode('utf-8'):
+                    self.backend.delete(lock_key)
+            except CacheBackendError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                'in_flight': len(self._flights),
+                'flights': self._leaders,
+                'shared_in_worker': self._shared,
+                'shared_across_workers': self._shared_remote,
+                'timeouts': self._timeouts,
+                'shared_store': self.backend is not None,
+            }
+
+
+# Only a store that other workers can see is worth coordinating through
+single_flight = SingleFlight(query_cache.backend if SINGLE_FLIGHT_SHARED and CACHE_URL else None)
+
+
+class IdempotencyStore:
+    """Responses of mutating requests by Idempotency-Key, so that a retry gets the original answer.
+
+    The first request with a key claims it with an atomic add and holds the claim
+    while its view runs; the response then replaces the claim, zlib-compressed, for
+    `ttl` seconds. A retry arriving meanwhile gets 409, later ones the stored
+    response. Keys are scoped to the session's user or admin and to the endpoint,
+    and remember a digest of the request: reusing a key for a different request is
+    answered with 422. 5xx responses, and responses the store refuses (too large),
+    are not kept, so their retries run again. A store that cannot be reached lets
+    requests through unprotected.
+    """
+
+    # Enough to rebuild the JSON bodies and redirects of the protected views
+    kept_headers = ('Content-Type', 'Location')
+
+    def __init__(self, backend, namespace='civicsense', ttl=IDEMPOTENCY_TTL_SECONDS,
+                 claim_ttl=IDEMPOTENCY_CLAIM_SECONDS):
+        self.backend = backend
+        self.ttl = ttl
+        self.claim_ttl = claim_ttl
+        self._prefix = f'{namespace}:idempotency:'
+        self._lock = threading.Lock()
+        self._stored = 0
+        self._replayed = 0
+        self._conflicts = 0
+        self._mismatches = 0
+        self._errors = 0
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def _encode(record):
+        return zlib.compress(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _claim(self, record_key, fingerprint):
+        """None once this request owns the key, else the record found: ('pending', digest) or
+        ('done', digest, status, headers, body)."""
+        claim = self._encode(('pending', fingerprint))
+        for _ in range(2):
+            if self.backend.add(record_key, claim, self.claim_ttl):
+                return None
+            payload = self.backend.get(record_key)
+            if payload is not None:
+                return pickle.loads(zlib.decompress(payload))
+        return ('pending', fingerprint)  # expired and taken again between the two calls
+
+    def _release(self, record_key):
+        try:
+            self.backend.delete(record_key)
+        except CacheBackendError as err:
+            print(f"Could not release idempotency key: {err}")
+
+    def run(self, key, view):
+        """Answers the current request with view(), or with the response already stored for `key`."""
+        scope = (session.get('user_id'), session.get('admin_id'), request.method, request.path)
+        record_key = self._prefix + hashlib.sha1(repr((scope, key)).encode('utf-8')).hexdigest()
+        fingerprint = request_fingerprint()
+        try:
+            record = self._claim(record_key, fingerprint)
+        except CacheBackendError as err:
+            print(f"Idempotency store unavailable: {err}")
+            self._count('_errors')
+            return view()
+
+        if record is not None:
+            if record[1] != fingerprint:
+                self._count('_mismatches')
+                return jsonify({'error': 'This Idempotency-Key was already used for a different request'}), 422
+            if record[0] == 'pending':
+                self._count('_conflicts')
+                response = jsonify({'error': 'A request with this Idempotency-Key is still being processed'})
+                response.status_code = 409
+                response.headers['Retry-After'] = '1'
+                return response
+            _, _, status, headers, body = record
+            self._count('_replayed')
+            response = Response(body, status=status, headers=headers)
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+
+        try:
+            response = make_response(view())
+        except Exception:
+            self._release(record_key)
+            raise
+        if response.status_code >= 500 or response.is_streamed:
+            self._release(record_key)
+            return response
+        headers = [(name, response.headers[name]) for name in self.kept_headers if name in response.headers]
+        try:
+            self.backend.set(record_key, self._encode(('done', fingerprint, response.status_code, headers,
+                                                       response.get_data())), self.ttl)
+            self._count('_stored')
+        except CacheBackendError as err:
+            # Left in place, the claim would answer retries with 409 until it expires;
+            # released, they run the view again as if no key had been sent
+            print(f"Could not store idempotent response: {err}")
+            self._count('_errors')
+            self._release(record_key)
+        return response
+
+    def stats(self):
+        with self._lock:
+            return {
+                'stored': self._stored,
+                'replayed': self._replayed,
+                'in_progress_conflicts': self._conflicts,
+                'key_reuse_rejected': self._mismatches,
+                'errors': self._errors,
+                'store': self.backend.stats(),
+            }
+
+
+def request_fingerprint():
+    """Digest of what the current request asks for: its form fields and files, or its raw body."""
+    digest = hashlib.sha1(request.full_path.encode('utf-8'))
+    # Multipart boundaries differ between two sends of the same form, so hash the parsed parts
+    if request.mimetype in ('multipart/form-data', 'application/x-www-form-urlencoded'):
+        for name, value in sorted(request.form.items(multi=True)):
+            digest.update(repr((name, value)).encode('utf-8'))
+        for name, upload in sorted(request.files.items(multi=True), key=lambda item: item[0]):
+            digest.update(repr((name, upload.filename)).encode('utf-8'))
+            for chunk in iter(lambda: upload.stream.read(65536), b''):
+                digest.update(chunk)
+            upload.stream.seek(0)
+    else:
+        digest.update(request.get_data(cache=True))
+    return digest.hexdigest()
+
+
+def idempotent(view):
+    """Lets clients retry a mutating view safely by sending an Idempotency-Key header.
+
+    Requests without the header, and GETs of the same route, run as usual.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get('Idempotency-Key')
+        if key is None or request.method in ('GET', 'HEAD', 'OPTIONS'):
+            return view(*args, **kwargs)
+        if not 0 < len(key) <= 255 or not key.isprintable():
+            return jsonify({'error': 'Idempotency-Key must be 1 to 255 printable characters'}), 400
+        return idempotency.run(key, lambda: view(*args, **kwargs))
+    return wrapper
+
+
+# Its own in-process store: evictions by the query cache must not forget keys early
+idempotency = IdempotencyStore(query_cache.backend if CACHE_URL else LocalCacheBackend(IDEMPOTENCY_MAX_BYTES))
+
+
+class EventBus:
+    """Small application events ('issue.created', 'issue.status', ...) delivered to every worker.
+
+    publish() numbers an event from a counter in the transport's store and broadcasts
+    it on one channel. Every worker, the publisher included, keeps what it receives in
+    a ring buffer of recent events (read with since()) and hands it to its in-process
+    subscribers. The transport is a CacheBackend: LocalCacheBackend keeps events in the
+    process, RespCacheBackend fans them out through Redis or LocalCacheServer.
+    Publishing never fails a request; without the transport an event stays in its worker,
+    marked 'local' and filed under the newest id seen, since it has no number of its own.
+    """
+
+    def __init__(self, backend, namespace='civicsense', buffer_size=EVENT_BUS_BUFFER):
+        self.backend = backend
+        self.buffer_size = buffer_size
+        self._channel = f'{namespace}:events'
+        self._sequence_key = f'{namespace}:event_sequence'
+        self._recent = []  # Events ordered by id, at most buffer_size
+        self._recent_ids = set()
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._subscribe_lock = threading.Lock()
+        self._subscribed_pid = None
+        self._published = 0
+        self._received = 0
+        self._errors = 0
+
+    def _ensure_subscribed(self):
+        # Started lazily (and again after a fork) so that every worker process has its own listener
+        if self._subscribed_pid != os.getpid():
+            with self._subscribe_lock:
+                if self._subscribed_pid != os.getpid():
+                    self._subscribed_pid = os.getpid()
+                    self.backend.subscribe(self._channel, self._on_message)
+
+    def subscribe(self, callback):
+        """Calls callback(event) for every event this worker receives, on the transport's thread."""
+        self._ensure_subscribed()
+        with self._lock:
+            self._listeners.append(callback)
+
+    def publish(self, kind, **data):
+        """Sends an event of `kind` with the JSON-serialisable `data`. Call after conn.commit()."""
+        self._ensure_subscribed()
+        event = {'kind': kind, 'at': datetime.now().isoformat(timespec='seconds'), 'data': data}
+        try:
+            event['id'] = self.backend.hincrby(self._sequence_key, 'last')
+            self.backend.publish(self._channel, json.dumps(event, default=str))
+            delivered = self.backend.subscribed
+        except CacheBackendError as err:
+            print(f"Could not publish event '{kind}': {err}")
+            with self._lock:
+                self._errors += 1
+                if 'id' not in event:
+                    # The shared counter did not move, so the next published event gets the
+                    # number after the newest one seen. This one is filed under that newest
+                    # number and marked local, so it is never taken for another event.
+                    event['id'] = self._recent[-1]['id'] if self._recent else 0
+                    event['local'] = True
+            delivered = False
+        with self._lock:
+            self._published += 1
+        if not delivered:
+            # Our own subscription is down (or there is no transport): keep the event here at least
+            self._receive(event)
+        return event
+
+    def _on_message(self, message):
+        if isinstance(message, bytes):
+            message = message.decode('utf-8')
+        self._receive(json.loads(message))
+
+    def _receive(self, event):
+        with self._lock:
+            if not event.get('local'):
+                if event['id'] in self._recent_ids:
+                    return
+                self._recent_ids.add(event['id'])
+            # Events of different workers can arrive slightly out of order
+            bisect.insort(self._recent, event, key=lambda item: item['id'])
+            while len(self._recent) > self.buffer_size:
+                dropped = self._recent.pop(0)
+                if not dropped.get('local'):
+                    self._recent_ids.discard(dropped['id'])
+            self._received += 1
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as err:
+                print(f"Event listener failed on '{event['kind']}': {err}")
+
+    def since(self, after_id=None, kinds=None, limit=100):
+        """(events newer than `after_id`, oldest first, newest id, whether older events were already dropped)."""
+        self._ensure_subscribed()
+        with self._lock:
+            events = self._recent
+            latest = events[-1]['id'] if events else after_id or 0
+            if after_id is None:
+                selected, truncated = events[-limit:], False
+            else:
+                start = bisect.bisect_right(events, after_id, key=lambda item: item['id'])
+                selected = events[start:]
+                # Either events after `after_id` were already dropped (or arrived before this
+                # worker started), or the store's counter was reset since
+                truncated = bool(events) and (events[0]['id'] > after_id + 1 or latest < after_id)
+        if kinds:
+            selected = [event for event in selected if event['kind'] in kinds]
+        if len(selected) > limit:
+            selected, truncated = selected[-limit:], True
+        return selected, latest, truncated
+
+    def stats(self):
+        with self._lock:
+            return {
+                'published': self._published,
+                'received': self._received,
+                'errors': self._errors,
+                'buffered': len(self._recent),
+                'transport': self.backend.stats(),
+            }
+
+
+event_bus = EventBus(query_cache.backend if EVENT_BUS_URL == CACHE_URL else create_cache_backend(EVENT_BUS_URL))
+
+
 def get_db_connection():
-    """Establishes and returns a connection to the MySQL database."""
+    """Returns a pooled connection to the MySQL database, or None if it cannot be reached.
+
+    Inside a request the connection is checked out once and shared through flask.g;
+    it goes back to the pool when the request ends. Raises DatabaseUnavailable when the
+    pool stays exhausted past its timeout, which is answered with a 503.
+    """
     try:
-        conn = mysql.connector.connect(**db_config)
-        return conn
+        if has_request_context():
+            if 'db_conn' not in g:
+                g.db_conn = PooledConnection(db_pool, db_pool.acquire(), request_scoped=True)
+            return g.db_conn
+        return PooledConnection(db_pool, db_pool.acquire())
     except mysql.connector.Error as err:
         print(f"Error connecting to database: {err}")
         return None
 
+
+@app.teardown_appcontext
+def release_db_connection(exception=None):
+    """Returns the request's pooled connection, rolling back anything left uncommitted."""
+    conn = g.pop('db_conn', None)
+    if conn is not None:
+        conn.release()
+
+
+@app.errorhandler(DatabaseUnavailable)
+def handle_database_unavailable(err):
+    app.logger.warning(f"Database pool exhausted: {err}")
+    response = jsonify({'status': 'error', 'error': 'The service is busy. Please try again shortly.'})
+    response.status_code = 503
+    response.headers['Retry-After'] = '1'
+    return response
+
 def allowed_file(filename):
     """Checks if the uploaded file has an allowed extension."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def create_tables():
-    """Creates all necessary database tables if they do not already exist."""
+# -----------------------------------------------------------------------------
+# Schema Migrations
+# -----------------------------------------------------------------------------
+# The schema is versioned in the `schema_version` table. Each migration below is
+# applied once, in order, by `flask --app app migrate up`; at boot the app only
+# reads the current version number. Migrations must be safe to re-run against a
+# database created before versioning existed.
+
+MIGRATIONS = []
+
+def migration(version, description):
+    """Registers a schema migration. Versions must be unique and increasing."""
+    def decorator(func):
+        MIGRATIONS.append((version, description, func))
+        MIGRATIONS.sort(key=lambda entry: entry[0])
+        return func
+    return decorator
+
+def index_exists(cursor, table, index_name):
+    """Checks information_schema for an index on a table in the current database."""
+    cursor.execute(
+        "SELECT 1 FROM information_schema.statistics "
+        "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s LIMIT 1",
+        (table, index_name)
+    )
+    return cursor.fetchone() is not None
+
+def column_exists(cursor, table, column):
+    """Checks information_schema for a column on a table in the current database."""
+    cursor.execute(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s LIMIT 1",
+        (table, column)
+    )
+    return cursor.fetchone() is not None
+
+@migration(1, 'Create base tables')
+def migration_0001_base_tables(cursor):
+    # Users Table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            first_name VARCHAR(100) NOT NULL,
+            last_name VARCHAR(100) NOT NULL,
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            mobile VARCHAR(20),
+            age INT,
+            gender VARCHAR(10),
+            address VARCHAR(255),
+            city VARCHAR(100),
+            pincode VARCHAR(20),
+            state VARCHAR(100),
+            country VARCHAR(100),
+            profile_photo_filename VARCHAR(255),
+            status VARCHAR(50) NOT NULL DEFAULT 'active'
+        )
+    """)
+
+    # Admins Table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS admins (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            username VARCHAR(100) UNIQUE NOT NULL,
+            password VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Issues Table with unique issue_id
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS issues (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            issue_id VARCHAR(255) UNIQUE,
+            fullName VARCHAR(255) NOT NULL,
+            age INT,
+            gender VARCHAR(50),
+            mobile VARCHAR(20) NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            pincode VARCHAR(10),
+            city VARCHAR(100),
+            district VARCHAR(100),
+            state VARCHAR(100),
+            country VARCHAR(100),
+            residentialAddress TEXT,
+            workAddress TEXT,
+            issueCategory VARCHAR(100) NOT NULL,
+            customIssueType VARCHAR(255),
+            issueDescription TEXT NOT NULL,
+            latitude DECIMAL(10, 8),
+            longitude DECIMAL(11, 8),
+            locationAddress TEXT,
+            priority VARCHAR(50) NOT NULL,
+            image_filename VARCHAR(255),
+            status VARCHAR(50) DEFAULT 'Submitted',
+            submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Status History Table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS issue_status_history (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            issue_id_ref VARCHAR(255),
+            status VARCHAR(50) NOT NULL,
+            notes TEXT,
+            updated_by VARCHAR(255) DEFAULT 'System',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (issue_id_ref) REFERENCES issues(issue_id) ON DELETE CASCADE
+        )
+    """)
+
+    # Feedback Table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS feedback (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT,
+            rating INT NOT NULL,
+            category VARCHAR(100),
+            comments TEXT,
+            submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL
+        )
+    """)
+
+    # Developers Table (for the team members)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS developers (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            role VARCHAR(255) NOT NULL,
+            year VARCHAR(100),
+            department VARCHAR(255),
+            reg_no VARCHAR(100),
+            institute_name VARCHAR(255),
+            photo_filename VARCHAR(255),
+            linkedin_url VARCHAR(255),
+            github_url VARCHAR(255),
+            email VARCHAR(255),
+            is_leader BOOLEAN DEFAULT FALSE,
+            display_order INT DEFAULT 100
+        )
+    """)
+
+    # Guide Table (for the project guide)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS guides (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            role TEXT NOT NULL,
+            bio_quote TEXT,
+            photo_filename VARCHAR(255),
+            linkedin_url VARCHAR(255),
+            email VARCHAR(255)
+        )
+    """)
+
+    # Announcements Table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS announcements (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            title VARCHAR(255) NOT NULL,
+            content TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Chat logs table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS chat_logs (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT,
+            user_message TEXT,
+            ai_response TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL
+        )
+    """)
+
+@migration(2, 'Seed the default admin account')
+def migration_0002_default_admin(cursor):
+    cursor.execute("SELECT id FROM admins WHERE username = 'admin'")
+    if not cursor.fetchone():
+        default_password = 'admin'
+        hashed_password = bcrypt.hashpw(default_password.encode('utf-8'), bcrypt.gensalt())
+        cursor.execute("INSERT INTO admins (username, password) VALUES (%s, %s)", ('admin', hashed_password))
+        print("Default admin user created with username 'admin' and password 'admin'.")
+
+# Secondary indexes for the hot access paths: (table, index name, column list).
+# Per-user lists filter by email and sort by submitted_at; admin analytics group by
+# status/city over submitted_at windows; history is read per issue in created_at order.
+SECONDARY_INDEXES = [
+    ('issues', 'idx_issues_email_submitted', '(email, submitted_at)'),
+    ('issues', 'idx_issues_status_submitted', '(status, submitted_at)'),
+    ('issues', 'idx_issues_priority_submitted', '(priority, submitted_at)'),
+    ('issues', 'idx_issues_city_submitted', '(city, submitted_at)'),
+    ('issues', 'idx_issues_submitted', '(submitted_at)'),
+    ('issue_status_history', 'idx_history_issue_created', '(issue_id_ref, created_at)'),
+    ('chat_logs', 'idx_chat_logs_created_user', '(created_at, user_id)'),
+    ('feedback', 'idx_feedback_submitted', '(submitted_at)'),
+]
+
+def create_secondary_indexes(cursor, indexes=SECONDARY_INDEXES):
+    """Adds every index from `indexes` that does not exist yet."""
+    for table, index_name, columns in indexes:
+        if index_exists(cursor, table, index_name):
+            continue
+        # Online build so a large table stays writable while the index is created
+        cursor.execute(f"ALTER TABLE {table} ADD INDEX {index_name} {columns}, ALGORITHM=INPLACE, LOCK=NONE")
+        print(f"Index {index_name} created on {table}.")
+
+@migration(3, 'Secondary indexes for the hot access paths')
+def migration_0003_secondary_indexes(cursor):
+    create_secondary_indexes(cursor)
+
+def constraint_exists(cursor, table, constraint_name):
+    """Checks information_schema for a named constraint on a table in the current database."""
+    cursor.execute(
+        "SELECT 1 FROM information_schema.table_constraints "
+        "WHERE table_schema = DATABASE() AND table_name = %s AND constraint_name = %s LIMIT 1",
+        (table, constraint_name)
+    )
+    return cursor.fetchone() is not None
+
+def backfill_in_batches(cursor, table, update_sql, batch_size=10000):
+    """Runs `update_sql` over consecutive primary-key ranges of `table`, committing each range.
+
+    `update_sql` must take the (exclusive) lower and (inclusive) upper id bound as its
+    two parameters; short transactions keep row locks and undo size small on big tables.
+    """
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+    max_id = cursor.fetchone()[0]
+    for lower in range(0, max_id, batch_size):
+        cursor.execute(update_sql, (lower, lower + batch_size))
+        cursor.execute("COMMIT")
+
+@migration(4, 'Link issues to users by integer user_id')
+def migration_0004_issue_user_id(cursor):
+    if not column_exists(cursor, 'issues', 'user_id'):
+        cursor.execute("ALTER TABLE issues ADD COLUMN user_id INT NULL AFTER issue_id")
+    create_secondary_indexes(cursor, [('issues', 'idx_issues_user_submitted', '(user_id, submitted_at)')])
+    # Re-assigning updated_at to itself keeps the backfill from bumping the ON UPDATE timestamp
+    backfill_in_batches(cursor, 'issues', """
+        UPDATE issues i JOIN users u ON u.email = i.email
+        SET i.user_id = u.id, i.updated_at = i.updated_at
+        WHERE i.id > %s AND i.id <= %s AND i.user_id IS NULL
+    """)
+    if not constraint_exists(cursor, 'issues', 'fk_issues_user'):
+        # The backfilled ids come straight from users, so the in-place build can skip the check scan
+        cursor.execute("SET foreign_key_checks = 0")
+        try:
+            cursor.execute(
+                "ALTER TABLE issues ADD CONSTRAINT fk_issues_user FOREIGN KEY (user_id) "
+                "REFERENCES users(id) ON DELETE SET NULL, ALGORITHM=INPLACE"
+            )
+        finally:
+            cursor.execute("SET foreign_key_checks = 1")
+
+@migration(5, 'Stored effective_category column for category aggregations')
+def migration_0005_effective_category(cursor):
+    # The custom issue type overrides the selected category; storing the result lets
+    # category GROUP BYs read an index instead of evaluating the CASE per row.
+    if not column_exists(cursor, 'issues', 'effective_category'):
+        cursor.execute("""
+            ALTER TABLE issues ADD COLUMN effective_category VARCHAR(255) AS (
+                CASE WHEN customIssueType IS NOT NULL AND customIssueType != ''
+                THEN customIssueType ELSE issueCategory END
+            ) STORED
+        """)
+    create_secondary_indexes(cursor, [
+        ('issues', 'idx_issues_category_submitted', '(effective_category, submitted_at)'),
+        ('issues', 'idx_issues_user_category', '(user_id, effective_category)'),
+    ])
+
+def get_schema_version(cursor):
+    """Returns the highest applied migration version, or 0 for an unversioned database."""
+    try:
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+    except mysql.connector.Error as err:
+        if err.errno == 1146:  # Table doesn't exist
+            return 0
+        raise
+    row = cursor.fetchone()
+    return row[0] or 0
+
+def migrate_up(target=None):
+    """Applies pending migrations in order, up to `target` if given. Returns the resulting version."""
     conn = get_db_connection()
     if not conn:
-        print("Could not connect to the database. Table creation skipped.")
-        return
+        print("Could not connect to the database. Migration skipped.")
+        return None
 
-    cursor = conn.cursor()
+    cursor = conn.cursor(buffered=True)
     try:
-        # Users Table
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                first_name VARCHAR(100) NOT NULL,
-                last_name VARCHAR(100) NOT NULL,
-                email VARCHAR(100) UNIQUE NOT NULL,
-                password VARCHAR(255) NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                mobile VARCHAR(20),
-                age INT,
-                gender VARCHAR(10),
-                address VARCHAR(255),
-                city VARCHAR(100),
-                pincode VARCHAR(20),
-                state VARCHAR(100),
-                country VARCHAR(100),
-                profile_photo_filename VARCHAR(255),
-                status VARCHAR(50) NOT NULL DEFAULT 'active'
-
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INT PRIMARY KEY,
+                description VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        print("Users table checked/created successfully.")
+        current = get_schema_version(cursor)
+        for version, description, func in MIGRATIONS:
+            if version <= current or (target is not None and version > target):
+                continue
+            started = time.monotonic()
+            func(cursor)
+            cursor.execute("INSERT INTO schema_version (version, description) VALUES (%s, %s)", (version, description))
+            conn.commit()
+            current = version
+            print(f"Applied migration {version:04d}: {description} ({time.monotonic() - started:.2f}s)")
+        return current
+    except mysql.connector.Error as err:
+        conn.rollback()
+        print(f"Error during migration: {err}")
+        return None
+    finally:
+        cursor.close()
+        conn.close()
 
-        # Admins Table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS admins (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                username VARCHAR(100) UNIQUE NOT NULL,
-                password VARCHAR(255) NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+def latest_schema_version():
+    return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+def check_schema_version():
+    """Boot-time check: one SELECT, plus pending migrations when AUTO_MIGRATE is enabled."""
+    conn = get_db_connection()
+    if not conn:
+        print("Could not connect to the database. Schema check skipped.")
+        return
+    cursor = conn.cursor(buffered=True)
+    try:
+        current = get_schema_version(cursor)
+    finally:
+        cursor.close()
+        conn.close()
+
+    latest = latest_schema_version()
+    if current >= latest:
+        return
+    if os.getenv('AUTO_MIGRATE', '1') == '1':
+        print(f"Database schema is at version {current}, applying migrations up to {latest}...")
+        migrate_up()
+    else:
+        app.logger.warning(f"Database schema is at version {current} but the code expects {latest}. Run 'flask --app app migrate up'.")
+
+migrate_cli = AppGroup('migrate', help='Manage the database schema version.')
+
+@migrate_cli.command('up')
+@click.option('--target', type=int, default=None, help='Stop after this migration version.')
+def migrate_up_command(target):
+    """Apply pending migrations."""
+    version = migrate_up(target)
+    if version is not None:
+        print(f"Database schema is at version {version}.")
+
+@migrate_cli.command('status')
+def migrate_status_command():
+    """Show applied and pending migrations."""
+    conn = get_db_connection()
+    if not conn:
+        print("Could not connect to the database.")
+        return
+    cursor = conn.cursor(buffered=True)
+    try:
+        current = get_schema_version(cursor)
+        applied = {}
+        if current:
+            cursor.execute("SELECT version, applied_at FROM schema_version")
+            applied = dict(cursor.fetchall())
+    finally:
+        cursor.close()
+        conn.close()
+    print(f"Current version: {current} (latest: {latest_schema_version()})")
+    for version, description, _ in MIGRATIONS:
+        state = f"applied {applied[version]}" if version in applied else 'pending'
+        print(f"  {version:04d}  {description:<50} {state}")
+
+app.cli.add_command(migrate_cli)
+
+
+# -----------------------------------------------------------------------------
+# Issue Write Hooks & Analytics Rollups
+# -----------------------------------------------------------------------------
+# Every write to `issues` goes through record_issues_removed() (before the row
+# changes or disappears) and record_issues_added() (after it is inserted or
+# changed), on the same cursor and inside the same transaction. The hooks move
+# the row's old and new state between the derived tables below, so those tables
+# never need a full re-scan of `issues` to stay correct.
+
+# Bucket key of an issue in issue_rollup_hourly: submitted_at truncated to the hour
+ROLLUP_BUCKET_SQL = "DATE_FORMAT(submitted_at, '%Y-%m-%d %H:00:00')"
+# Days from submission to the last status change; only counted once an admin has responded
+ROLLUP_RESPONSE_SQL = "IF(status != 'Submitted' AND updated_at IS NOT NULL, DATEDIFF(updated_at, submitted_at), NULL)"
+ROLLUP_SELECT_SQL = f"""
+    SELECT {ROLLUP_BUCKET_SQL}, COALESCE(status, ''), priority, effective_category, COALESCE(city, ''),
+           %s * COUNT(*), %s * COALESCE(SUM({ROLLUP_RESPONSE_SQL}), 0),
+           MIN({ROLLUP_RESPONSE_SQL}), MAX({ROLLUP_RESPONSE_SQL})
+    FROM issues
+"""
+ROLLUP_INSERT_SQL = """
+    INSERT INTO issue_rollup_hourly
+        (bucket_start, status, priority, category, city,
+         issue_count, response_days_sum, response_days_min, response_days_max)
+"""
+
+@migration(6, 'Hourly issue rollup table for analytics')
+def migration_0006_issue_rollup(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS issue_rollup_hourly (
+            bucket_start DATETIME NOT NULL,
+            status VARCHAR(50) NOT NULL,
+            priority VARCHAR(50) NOT NULL,
+            category VARCHAR(255) NOT NULL,
+            city VARCHAR(100) NOT NULL DEFAULT '',
+            issue_count INT NOT NULL DEFAULT 0,
+            response_days_sum BIGINT NOT NULL DEFAULT 0,
+            response_days_min INT NULL,
+            response_days_max INT NULL,
+            PRIMARY KEY (bucket_start, status, priority, category, city)
+        )
+    """)
+    rebuild_issue_rollups(cursor)
+
+def rebuild_issue_rollups(cursor):
+    """Recomputes issue_rollup_hourly from `issues`. The caller commits.
+
+    The INSERT ... SELECT share-locks the scanned issue rows, so writers wait for
+    the rebuild's commit instead of being counted twice.
+    """
+    cursor.execute("DELETE FROM issue_rollup_hourly")
+    cursor.execute(f"{ROLLUP_INSERT_SQL} {ROLLUP_SELECT_SQL} GROUP BY 1, 2, 3, 4, 5", (1, 1))
+
+def _apply_issue_rollup(cursor, issue_ids, sign):
+    if not issue_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(issue_ids))
+    # Min/max are watermarks: they widen on add but are not narrowed on removal
+    # (a rebuild tightens them again).
+    extremes = """,
+        response_days_min = LEAST(COALESCE(response_days_min, VALUES(response_days_min)),
+                                  COALESCE(VALUES(response_days_min), response_days_min)),
+        response_days_max = GREATEST(COALESCE(response_days_max, VALUES(response_days_max)),
+                                     COALESCE(VALUES(response_days_max), response_days_max))
+    """ if sign > 0 else ""
+    cursor.execute(f"""
+        {ROLLUP_INSERT_SQL}
+        {ROLLUP_SELECT_SQL}
+        WHERE issue_id IN ({placeholders})
+        GROUP BY 1, 2, 3, 4, 5
+        ON DUPLICATE KEY UPDATE
+            issue_count = issue_count + VALUES(issue_count),
+            response_days_sum = response_days_sum + VALUES(response_days_sum){extremes}
+    """, (sign, sign, *issue_ids))
+
+# Per-user summary read by the dashboard and profile endpoints with one primary-key lookup
+USER_STATUS_COLUMNS = {
+    'Submitted': 'submitted_count',
+    'In Progress': 'in_progress_count',
+    'Resolved': 'resolved_count',
+    'Completed': 'completed_count',
+    'Rejected': 'rejected_count',
+}
+# daily_counts keeps the last 31 submission dates, enough for the 30-day activity timeline
+USER_STATS_DAILY_DAYS = 31
+DAY_NAMES = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+@migration(7, 'Per-user issue summary table')
+def migration_0007_user_issue_stats(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS user_issue_stats (
+            user_id INT PRIMARY KEY,
+            total_count INT NOT NULL DEFAULT 0,
+            submitted_count INT NOT NULL DEFAULT 0,
+            in_progress_count INT NOT NULL DEFAULT 0,
+            resolved_count INT NOT NULL DEFAULT 0,
+            completed_count INT NOT NULL DEFAULT 0,
+            rejected_count INT NOT NULL DEFAULT 0,
+            last_submitted_at DATETIME NULL,
+            daily_counts JSON NULL,
+            weekday_counts JSON NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+    """)
+    rebuild_user_issue_stats(cursor)
+
+def rebuild_user_issue_stats(cursor):
+    """Recomputes user_issue_stats from `issues`. The caller commits."""
+    status_sums = ',\n'.join(
+        f"SUM(status = '{status}') AS {column}" for status, column in USER_STATUS_COLUMNS.items()
+    )
+    cursor.execute("DELETE FROM user_issue_stats")
+    cursor.execute(f"""
+        INSERT INTO user_issue_stats
+            (user_id, total_count, {', '.join(USER_STATUS_COLUMNS.values())},
+             last_submitted_at, daily_counts, weekday_counts)
+        SELECT t.user_id, t.total_count, {', '.join('t.' + c for c in USER_STATUS_COLUMNS.values())},
+               t.last_submitted_at, COALESCE(d.daily_counts, JSON_OBJECT()), w.weekday_counts
+        FROM (
+            SELECT user_id, COUNT(*) AS total_count, {status_sums}, MAX(submitted_at) AS last_submitted_at
+            FROM issues WHERE user_id IS NOT NULL GROUP BY user_id
+        ) t
+        LEFT JOIN (
+            SELECT user_id, JSON_OBJECTAGG(day, n) AS daily_counts FROM (
+                SELECT user_id, DATE_FORMAT(submitted_at, '%Y-%m-%d') AS day, COUNT(*) AS n
+                FROM issues
+                WHERE user_id IS NOT NULL AND submitted_at >= DATE_SUB(CURDATE(), INTERVAL {USER_STATS_DAILY_DAYS - 1} DAY)
+                GROUP BY user_id, day
+            ) days GROUP BY user_id
+        ) d ON d.user_id = t.user_id
+        JOIN (
+            SELECT user_id, JSON_OBJECTAGG(weekday, n) AS weekday_counts FROM (
+                SELECT user_id, CAST(DAYOFWEEK(submitted_at) AS CHAR) AS weekday, COUNT(*) AS n
+                FROM issues WHERE user_id IS NOT NULL GROUP BY user_id, weekday
+            ) weekdays GROUP BY user_id
+        ) w ON w.user_id = t.user_id
+    """)
+
+def _row_values(row, *columns):
+    """Column values of a row from either a tuple or a dictionary cursor."""
+    return tuple(row[column] for column in columns) if isinstance(row, dict) else tuple(row)
+
+def _load_json_counts(value):
+    return json.loads(value) if value else {}
+
+def _apply_user_issue_stats(cursor, issue_ids, sign):
+    if not issue_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(issue_ids))
+    cursor.execute(
+        f"SELECT user_id, status, submitted_at FROM issues WHERE issue_id IN ({placeholders}) AND user_id IS NOT NULL",
+        tuple(issue_ids)
+    )
+    changes = {}
+    for row in cursor.fetchall():
+        user_id, status, submitted_at = _row_values(row, 'user_id', 'status', 'submitted_at')
+        changes.setdefault(user_id, []).append((status, submitted_at))
+
+    columns = ['total_count', *USER_STATUS_COLUMNS.values()]
+    oldest_day = (datetime.now() - timedelta(days=USER_STATS_DAILY_DAYS - 1)).strftime('%Y-%m-%d')
+    # Sorted so concurrent writers lock summary rows in the same order
+    for user_id in sorted(changes):
+        cursor.execute(
+            f"SELECT {', '.join(columns)}, last_submitted_at, daily_counts, weekday_counts "
+            "FROM user_issue_stats WHERE user_id = %s FOR UPDATE",
+            (user_id,)
+        )
+        row = cursor.fetchone()
+        if row:
+            values = _row_values(row, *columns, 'last_submitted_at', 'daily_counts', 'weekday_counts')
+            counts = dict(zip(columns, values[:len(columns)]))
+            last_submitted_at = values[-3]
+            daily, weekdays = _load_json_counts(values[-2]), _load_json_counts(values[-1])
+        else:
+            counts, last_submitted_at, daily, weekdays = dict.fromkeys(columns, 0), None, {}, {}
+
+        recompute_last = False
+        for status, submitted_at in changes[user_id]:
+            counts['total_count'] += sign
+            if status in USER_STATUS_COLUMNS:
+                counts[USER_STATUS_COLUMNS[status]] += sign
+            day = submitted_at.strftime('%Y-%m-%d')
+            weekday = str(submitted_at.isoweekday() % 7 + 1)  # MySQL DAYOFWEEK: 1 = Sunday
+            daily[day] = daily.get(day, 0) + sign
+            weekdays[weekday] = weekdays.get(weekday, 0) + sign
+            if sign > 0 and (last_submitted_at is None or submitted_at > last_submitted_at):
+                last_submitted_at = submitted_at
+            elif sign < 0 and last_submitted_at is not None and submitted_at >= last_submitted_at:
+                recompute_last = True
+
+        if recompute_last:
+            # The newest issue is going away; the next one is an index lookup on (user_id, submitted_at)
+            cursor.execute(
+                f"SELECT MAX(submitted_at) AS last_submitted_at FROM issues "
+                f"WHERE user_id = %s AND issue_id NOT IN ({placeholders})",
+                (user_id, *issue_ids)
             )
-        """)
-        print("Admins table checked/created successfully.")
-        
-        # Add a default admin if one doesn't exist
-        cursor.execute("SELECT * FROM admins WHERE username = 'admin'")
-        if not cursor.fetchone():
-            default_password = 'admin'
-            hashed_password = bcrypt.hashpw(default_password.encode('utf-8'), bcrypt.gensalt())
-            cursor.execute("INSERT INTO admins (username, password) VALUES (%s, %s)", ('admin', hashed_password))
-            conn.commit()
-            print("Default admin user created with username 'admin' and password 'admin'.")
+            last_submitted_at = _row_values(cursor.fetchone(), 'last_submitted_at')[0]
+        daily = {day: n for day, n in daily.items() if day >= oldest_day and n > 0}
+        weekdays = {weekday: n for weekday, n in weekdays.items() if n > 0}
+
+        cursor.execute(f"""
+            INSERT INTO user_issue_stats (user_id, {', '.join(columns)}, last_submitted_at, daily_counts, weekday_counts)
+            VALUES (%s, {', '.join(['%s'] * len(columns))}, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE {', '.join(f'{c} = VALUES({c})' for c in columns)},
+                last_submitted_at = VALUES(last_submitted_at),
+                daily_counts = VALUES(daily_counts), weekday_counts = VALUES(weekday_counts)
+        """, (user_id, *(counts[c] for c in columns), last_submitted_at, json.dumps(daily), json.dumps(weekdays)))
+
+def get_user_issue_stats(cursor, user_id):
+    """Dashboard counters for one user from user_issue_stats (a single primary-key lookup)."""
+    cursor.execute(
+        "SELECT s.*, CURDATE() AS today FROM (SELECT 1) AS one "
+        "LEFT JOIN user_issue_stats s ON s.user_id = %s",
+        (user_id,)
+    )
+    row = cursor.fetchone()
+    if not isinstance(row, dict):
+        row = dict(zip(cursor.column_names, row))
+    today = row['today']
+
+    stats = {column: row[column] or 0 for column in ['total_count', *USER_STATUS_COLUMNS.values()]}
+    stats['last_submitted_at'] = row['last_submitted_at']
+    daily = _load_json_counts(row['daily_counts'])
+    weekdays = _load_json_counts(row['weekday_counts'])
+
+    def submitted_since(days_back):
+        first = (today - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        return sum(n for day, n in daily.items() if day >= first)
+
+    stats['today_count'] = submitted_since(0)
+    stats['week_count'] = submitted_since(6)
+    stats['month_count'] = submitted_since(29)
+    stats['daily'] = [
+        {'date': day, 'submissions': daily[day]}
+        for day in sorted(daily) if day >= (today - timedelta(days=USER_STATS_DAILY_DAYS - 1)).strftime('%Y-%m-%d')
+    ]
+    busiest = max(weekdays.items(), key=lambda item: item[1], default=None)
+    stats['most_active_day'] = DAY_NAMES[int(busiest[0]) - 1] if busiest else None
+    return stats
+
+def record_issues_removed(cursor, issue_ids):
+    """Takes the current state of the given issues out of the derived tables.
+
+    Call before an UPDATE or DELETE of the rows, inside the same transaction.
+    The rows are locked first so their state cannot change before the write.
+    """
+    if not issue_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(issue_ids))
+    cursor.execute(f"SELECT id, user_id FROM issues WHERE issue_id IN ({placeholders}) FOR UPDATE", tuple(issue_ids))
+    track_issue_changes(cursor.fetchall())
+    _apply_issue_rollup(cursor, issue_ids, -1)
+    _apply_user_issue_stats(cursor, issue_ids, -1)
+
+def record_issues_added(cursor, issue_ids):
+    """Adds the current state of the given issues to the derived tables.
+
+    Call after an INSERT or UPDATE of the rows, inside the same transaction.
+    """
+    if not issue_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(issue_ids))
+    cursor.execute(f"SELECT id, user_id FROM issues WHERE issue_id IN ({placeholders})", tuple(issue_ids))
+    track_issue_changes(cursor.fetchall())
+    _apply_issue_rollup(cursor, issue_ids, 1)
+    _apply_user_issue_stats(cursor, issue_ids, 1)
+
+def rollup_window(days):
+    """WHERE clause and params restricting issue_rollup_hourly to the last `days` days (None = all time)."""
+    if days is None:
+        return "", ()
+    return "WHERE bucket_start >= DATE_FORMAT(DATE_SUB(NOW(), INTERVAL %s DAY), '%Y-%m-%d %H:00:00')", (days,)
+
+rollups_cli = AppGroup('rollups', help='Maintain the pre-aggregated analytics tables.')
+
+@rollups_cli.command('rebuild')
+def rollups_rebuild_command():
+    """Recompute issue_rollup_hourly and user_issue_stats from the issues table."""
+    conn = get_db_connection()
+    if not conn:
+        print("Could not connect to the database.")
+        return
+    cursor = conn.cursor()
+    try:
+        started = time.monotonic()
+        rebuild_issue_rollups(cursor)
+        rebuild_user_issue_stats(cursor)
+        conn.commit()
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(issue_count), 0) FROM issue_rollup_hourly")
+        buckets, issues = cursor.fetchone()
+        cursor.execute("SELECT COUNT(*) FROM user_issue_stats")
+        users = cursor.fetchone()[0]
+        print(f"Rebuilt {buckets} rollup rows covering {issues} issues and {users} user summaries "
+              f"({time.monotonic() - started:.2f}s).")
+    except mysql.connector.Error as err:
+        conn.rollback()
+        print(f"Error rebuilding rollups: {err}")
+    finally:
+        cursor.close()
+        conn.close()
+
+app.cli.add_command(rollups_cli)
+
+
+# -----------------------------------------------------------------------------
+# In-Memory Analytics Engine
+# -----------------------------------------------------------------------------
+# A columnar copy of the analytics columns of `issues` in NumPy arrays: status,
+# priority, category and city as small integer codes, timestamps as epoch seconds
+# (of the database's wall clock) and coordinates as float32. The analytics
+# endpoints answer from it with vectorized counts instead of querying MySQL.
+#
+# A background thread keeps the copy in sync:
+#   * issues touched by the write hooks of this process are re-read as soon as
+#     the request that changed them has finished,
+#   * rows written by other processes are picked up through idx_issues_updated,
+#   * deletes made elsewhere show up as a mismatch with the issue_rollup_hourly
+#     total, which triggers a full reload.
+# Until the first load completes the endpoints keep answering from the rollups.
+
+ANALYTICS_ENGINE_ENABLED = os.environ.get('ANALYTICS_ENGINE', '1') == '1'
+ANALYTICS_SYNC_SECONDS = float(os.environ.get('ANALYTICS_SYNC_SECONDS', 2))
+ANALYTICS_VERIFY_SECONDS = 60
+# Rows are re-read this far behind the last sync, covering transactions that commit late
+ANALYTICS_SYNC_OVERLAP_SECONDS = 60
+ANALYTICS_LOAD_BATCH = 50000
+ANALYTICS_TOP_K = 10
+ANALYTICS_HOTSPOT_GRID = 0.01  # degrees, roughly 1 km
+# Conversions happen in MySQL so the loader only handles ints and floats:
+# TO_SECONDS() - 62167219200 is seconds since 1970-01-01 on the same wall clock as
+# the stored TIMESTAMPs, and "+ 0e0" turns the DECIMAL coordinates into doubles.
+ANALYTICS_SNAPSHOT_SQL = f"""
+    SELECT id, user_id, COALESCE(status, ''), priority, effective_category, COALESCE(city, ''),
+           TO_SECONDS(submitted_at) - 62167219200, {ROLLUP_RESPONSE_SQL},
+           latitude + 0e0, longitude + 0e0
+    FROM issues
+"""
+
+def _epoch_seconds(value):
+    """Epoch seconds of a naive datetime, matching how the snapshot stores timestamps."""
+    return int(np.datetime64(value, 's').astype(np.int64))
+
+class IssueSnapshot:
+    """Column arrays of the issues table, addressed by row slot; `row_of_id` maps issues.id to its slot."""
+
+    CATEGORICAL = ('status', 'priority', 'category', 'city')
+    DTYPES = {
+        'id': np.int32, 'user_id': np.int32,
+        'status': np.int16, 'priority': np.int16, 'category': np.int16, 'city': np.int16,
+        'submitted': np.int64, 'response_days': np.int32, 'responded': np.bool_,
+        'latitude': np.float32, 'longitude': np.float32, 'alive': np.bool_,
+    }
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.columns = {name: np.zeros(capacity, dtype) for name, dtype in self.DTYPES.items()}
+        self.row_of_id = np.full(capacity, -1, np.int64)
+        self.labels = {name: [] for name in self.CATEGORICAL}
+        self._codes = {name: {} for name in self.CATEGORICAL}
+
+    def _encode(self, column, values):
+        codes, labels = self._codes[column], self.labels[column]
+        encoded = [codes.get(value) for value in values]
+        if None in encoded:
+            for position, value in enumerate(values):
+                if encoded[position] is None:
+                    value = value or ''
+                    if value not in codes:
+                        codes[value] = len(labels)
+                        labels.append(value)
+                    encoded[position] = codes[value]
+        return np.array(encoded, np.int16)
+
+    def _grow(self, capacity, max_id):
+        if capacity > len(self.columns['id']):
+            capacity = max(capacity, 2 * len(self.columns['id']))
+            for name, array in self.columns.items():
+                grown = np.zeros(capacity, array.dtype)
+                grown[:self.size] = array[:self.size]
+                self.columns[name] = grown
+        if max_id >= len(self.row_of_id):
+            grown = np.full(max(max_id + 1, 2 * len(self.row_of_id)), -1, np.int64)
+            grown[:len(self.row_of_id)] = self.row_of_id
+            self.row_of_id = grown
+
+    def upsert(self, rows):
+        """Inserts or overwrites rows in ANALYTICS_SNAPSHOT_SQL column order."""
+        if not rows:
+            return
+        ids, user_ids, statuses, priorities, categories, cities, submitted, response_days, latitudes, longitudes = zip(*rows)
+        ids = np.array(ids, np.int64)
+        self._grow(self.size + len(ids), int(ids.max()))
+
+        slots = self.row_of_id[ids]
+        new = slots < 0
+        slots[new] = np.arange(self.size, self.size + int(new.sum()))
+        self.size += int(new.sum())
+        self.row_of_id[ids] = slots
+
+        response_days = np.array(response_days, np.float64)  # NULL -> NaN: no response yet
+        responded = ~np.isnan(response_days)
+
+        columns = self.columns
+        columns['id'][slots] = ids
+        columns['user_id'][slots] = [user_id or 0 for user_id in user_ids]
+        columns['status'][slots] = self._encode('status', statuses)
+        columns['priority'][slots] = self._encode('priority', priorities)
+        columns['category'][slots] = self._encode('category', categories)
+        columns['city'][slots] = self._encode('city', cities)
+        columns['submitted'][slots] = np.array(submitted, np.int64)
+        columns['response_days'][slots] = np.where(responded, response_days, 0)
+        columns['responded'][slots] = responded
+        columns['latitude'][slots] = np.array(latitudes, np.float64)
+        columns['longitude'][slots] = np.array(longitudes, np.float64)
+        columns['alive'][slots] = True
+
+    def remove(self, ids):
+        ids = np.array([issue_id for issue_id in ids if issue_id < len(self.row_of_id)], np.int64)
+        slots = self.row_of_id[ids]
+        self.columns['alive'][slots[slots >= 0]] = False
+
+    def column(self, name):
+        return self.columns[name][:self.size]
+
+    def mask(self, since=None):
+        """Live rows, optionally only those submitted at or after `since` (a datetime)."""
+        mask = self.column('alive').copy()
+        if since is not None:
+            mask &= self.column('submitted') >= _epoch_seconds(since)
+        return mask
+
+    @property
+    def count(self):
+        return int(np.count_nonzero(self.column('alive')))
+
+    def distribution(self, column, mask, key=None, top=None, skip_empty=False):
+        """[{key: label, 'count': n}] of a categorical column, largest first when `top` is given."""
+        counts = np.bincount(self.column(column)[mask], minlength=len(self.labels[column]))
+        codes = np.argsort(-counts, kind='stable')[:top] if top else np.arange(len(counts))
+        key = key or column
+        return [
+            {key: self.labels[column][code], 'count': int(counts[code])}
+            for code in codes if counts[code] > 0 and not (skip_empty and self.labels[column][code] == '')
+        ]
+
+    def daily_trend(self, mask):
+        days = self.column('submitted')[mask] // 86400
+        if not len(days):
+            return []
+        first = int(days.min())
+        counts = np.bincount(days - first)
+        return [
+            {'date': (datetime(1970, 1, 1) + timedelta(days=first + offset)).strftime('%Y-%m-%d'), 'count': int(count)}
+            for offset, count in enumerate(counts) if count > 0
+        ]
+
+    def response_stats(self, mask):
+        """Average over every answered issue (as the rollups do) and min/max over those with a response time."""
+        answered = mask & np.array([label != 'Submitted' for label in self.labels['status']], np.bool_)[self.column('status')]
+        timed_mask = answered & self.column('responded')
+        days = self.column('response_days')[timed_mask]
+        total = int(np.count_nonzero(answered))
+        return {
+            'avg_response_days': float(days.sum()) / total if total else None,
+            'min_response_days': int(days.min()) if len(days) else None,
+            'max_response_days': int(days.max()) if len(days) else None,
+        }
+
+    def hour_weekday_matrix(self, mask):
+        """7 x 24 submission counts; rows are DAYOFWEEK - 1 (Sunday first)."""
+        seconds = self.column('submitted')[mask]
+        hours = (seconds // 3600) % 24
+        weekdays = (seconds // 86400 + 4) % 7  # 1970-01-01 was a Thursday
+        return np.bincount(weekdays * 24 + hours, minlength=7 * 24).reshape(7, 24)
+
+    def hotspots(self, mask, top=ANALYTICS_TOP_K, grid=ANALYTICS_HOTSPOT_GRID):
+        """Most reported grid cells, as cell centres with their issue counts."""
+        latitudes, longitudes = self.column('latitude')[mask], self.column('longitude')[mask]
+        located = ~(np.isnan(latitudes) | np.isnan(longitudes))
+        cells_lat = np.floor(latitudes[located] / grid).astype(np.int64)
+        cells_lon = np.floor(longitudes[located] / grid).astype(np.int64)
+        # One integer key per cell; longitude cells (-18000..18000 at 0.01) are shifted to stay positive
+        cells, counts = np.unique(cells_lat * 100000 + cells_lon + 50000, return_counts=True)
+        order = np.argsort(-counts, kind='stable')[:top]
+        return [
+            {
+                'latitude': round((int(cells[i]) // 100000 + 0.5) * grid, 5),
+                'longitude': round((int(cells[i]) % 100000 - 50000 + 0.5) * grid, 5),
+                'count': int(counts[i]),
+            }
+            for i in order
+        ]
+
+class IssueAnalyticsEngine:
+    """Keeps an IssueSnapshot in sync with MySQL and answers the analytics endpoints from it."""
+
+    def __init__(self):
+        self.snapshot = None
+        self._lock = threading.RLock()
+        self._start_lock = threading.Lock()
+        self._pending = set()
+        self._wake = threading.Event()
+        self._thread = None
+        self._synced_at = None
+        self._verify_misses = 0
+        # Answers are memoised until the snapshot changes (or the hour turns, for the time windows)
+        self._version = 0
+        self._results = {}
+
+    @property
+    def ready(self):
+        return self.snapshot is not None
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='issue-analytics-sync', daemon=True)
+                self._thread.start()
+
+    def mark_dirty(self, ids):
+        """Queues issues.id values for re-reading; call once the writing transaction has ended."""
+        if self._thread is None or not ids:
+            return
+        with self._lock:
+            self._pending.update(ids)
+        self._wake.set()
+
+    def _run(self):
+        last_verify = time.monotonic()
+        while True:
+            conn = None
+            try:
+                conn = get_dedicated_db_connection()
+                if conn:
+                    if not self.ready:
+                        self.reload(conn)
+                    else:
+                        self.sync(conn)
+                        if time.monotonic() - last_verify >= ANALYTICS_VERIFY_SECONDS:
+                            self.verify(conn)
+                            last_verify = time.monotonic()
+            except Exception as e:
+                print(f"Analytics engine sync failed: {e}")
+            finally:
+                if conn:
+                    conn.close()
+            self._wake.wait(ANALYTICS_SYNC_SECONDS)
+            self._wake.clear()
+
+    def reload(self, conn):
+        """Builds a fresh snapshot in the background and swaps it in; readers keep the old one meanwhile."""
+        started = time.monotonic()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT NOW()")
+            synced_at = cursor.fetchone()[0]
+            snapshot = IssueSnapshot()
+            cursor.execute(ANALYTICS_SNAPSHOT_SQL)
+            while True:
+                rows = cursor.fetchmany(ANALYTICS_LOAD_BATCH)
+                if not rows:
+                    break
+                snapshot.upsert(rows)
+        finally:
+            cursor.close()
+        with self._lock:
+            self.snapshot = snapshot
+            self._synced_at = synced_at
+            self._verify_misses = 0
+            self._changed()
+        app.logger.info(f"Analytics engine loaded {snapshot.count} issues in {time.monotonic() - started:.2f}s")
+
+    def sync(self, conn):
+        """Applies the issues queued by mark_dirty() and rows updated since the last sync."""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT NOW()")
+            synced_at = cursor.fetchone()[0]
+            cursor.execute(f"{ANALYTICS_SNAPSHOT_SQL} WHERE updated_at >= %s",
+                           (self._synced_at - timedelta(seconds=ANALYTICS_SYNC_OVERLAP_SECONDS),))
+            rows = cursor.fetchall()
+            if pending:
+                placeholders = ', '.join(['%s'] * len(pending))
+                cursor.execute(f"{ANALYTICS_SNAPSHOT_SQL} WHERE id IN ({placeholders})", tuple(pending))
+                rows += cursor.fetchall()
+        except Exception:
+            with self._lock:
+                self._pending |= pending
+            raise
+        finally:
+            cursor.close()
+        with self._lock:
+            if rows or pending:
+                self.snapshot.remove(pending - {row[0] for row in rows})
+                self.snapshot.upsert(list({row[0]: row for row in rows}.values()))
+                self._changed()
+            self._synced_at = synced_at
+
+    def _changed(self):
+        self._version += 1
+        self._results = {}
+
+    def _cached(self, key, compute):
+        key = key + (datetime.now().strftime('%Y%m%d%H'),)
+        with self._lock:
+            if key not in self._results:
+                self._results[key] = compute(self.snapshot)
+            # Shallow copy: callers may add keys to the answer
+            return dict(self._results[key])
+
+    def verify(self, conn):
+        """Reloads when the snapshot and the rollup disagree on the issue count twice in a row."""
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT CAST(COALESCE(SUM(issue_count), 0) AS SIGNED) FROM issue_rollup_hourly")
+            expected = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+        if expected == self.snapshot.count:
+            self._verify_misses = 0
+            return
+        self._verify_misses += 1
+        if self._verify_misses >= 2:
+            print(f"Analytics engine drifted ({self.snapshot.count} vs {expected} issues); reloading.")
+            self.reload(conn)
+
+    def overview(self):
+        """Data of /api/analytics/overview."""
+        return self._cached(('overview',), self._overview)
+
+    def _overview(self, snapshot):
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        everything = snapshot.mask()
+        response_time = snapshot.response_stats(everything)
+        return {
+            'overview': {
+                'total_issues': int(np.count_nonzero(everything)),
+                'monthly_issues': int(np.count_nonzero(snapshot.mask(today.replace(day=1)))),
+                'avg_response_time': round(response_time['avg_response_days'] or 0, 1),
+            },
+            'status_distribution': snapshot.distribution('status', everything),
+            'category_distribution': snapshot.distribution('category', everything, key='issueCategory', top=ANALYTICS_TOP_K),
+            'priority_distribution': snapshot.distribution('priority', everything),
+            'trend_data': snapshot.daily_trend(snapshot.mask(today - timedelta(days=30))),
+            'response_time': response_time,
+            'location_data': snapshot.distribution('city', everything, top=ANALYTICS_TOP_K, skip_empty=True),
+        }
+
+    def comprehensive(self, days):
+        """Issue figures of /admin/api/comprehensive-analytics for the last `days` days (None = all time)."""
+        return self._cached(('comprehensive', days), lambda snapshot: self._comprehensive(snapshot, days))
+
+    def _comprehensive(self, snapshot, days):
+        since = None
+        if days is not None:
+            since = (datetime.now() - timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+        window = snapshot.mask(since)
+        total = int(np.count_nonzero(window))
+        statuses = snapshot.distribution('status', window)
+        resolved = next((item['count'] for item in statuses if item['status'] == 'Resolved'), 0)
+        user_ids = snapshot.column('user_id')[snapshot.mask()]
+        return {
+            'overview': {
+                'total_issues': total,
+                'resolution_rate': (resolved / total * 100) if total > 0 else 0,
+                'avg_response_days': snapshot.response_stats(window)['avg_response_days'] or 0.0,
+            },
+            'status_distribution': statuses,
+            'priority_distribution': snapshot.distribution('priority', window),
+            'category_distribution': snapshot.distribution('category', window, key='issueCategory', top=ANALYTICS_TOP_K),
+            'location_data': snapshot.distribution('city', window, top=ANALYTICS_TOP_K, skip_empty=True),
+            'trend_data': snapshot.daily_trend(window),
+            'hotspots': snapshot.hotspots(window),
+            'user_stats': {'users_with_submissions': int(np.count_nonzero(np.bincount(user_ids)[1:])) if len(user_ids) else 0},
+        }
+
+    def activity_patterns(self):
+        """Data of /admin/api/detailed-analytics/activity-patterns, plus the hour x weekday matrix."""
+        return self._cached(('activity_patterns',), self._activity_patterns)
+
+    def _activity_patterns(self, snapshot):
+        matrix = snapshot.hour_weekday_matrix(snapshot.mask())
+        hourly, weekly = matrix.sum(axis=0), matrix.sum(axis=1)
+        return {
+            'hourly': [{'hour': hour, 'count': int(count)} for hour, count in enumerate(hourly) if count > 0],
+            'weekly': [
+                {'day': DAY_NAMES[day], 'day_num': day + 1, 'count': int(count)}
+                for day, count in enumerate(weekly) if count > 0
+            ],
+            'matrix': matrix.tolist(),
+        }
+
+analytics_engine = IssueAnalyticsEngine()
+
+def ready_analytics_engine():
+    """The analytics engine once its snapshot is loaded, else None (starting it on first use)."""
+    if not ANALYTICS_ENGINE_ENABLED or np is None:
+        return None
+    analytics_engine.start()
+    return analytics_engine if analytics_engine.ready else None
+
+def track_analytics_changes(ids):
+    """Remembers issues.id values written during this request for the analytics engine."""
+    if has_request_context():
+        g.setdefault('analytics_dirty', set()).update(ids)
+    else:
+        analytics_engine.mark_dirty(set(ids))
+
+def track_issue_changes(rows):
+    """Records (id, user_id) rows of issues being written for the analytics engine and the change versions."""
+    rows = [_row_values(row, 'id', 'user_id') for row in rows]
+    track_analytics_changes(issue_pk for issue_pk, _ in rows)
+    change_versions.record('issue', [issue_pk for issue_pk, _ in rows])
+    change_versions.record('user', [user_id for _, user_id in rows])
+
+@app.teardown_appcontext
+def flush_analytics_changes(exception=None):
+    dirty = g.pop('analytics_dirty', None)
+    if dirty:
+        analytics_engine.mark_dirty(dirty)
+
+
+# -----------------------------------------------------------------------------
+# Issue Status Event Stream
+# -----------------------------------------------------------------------------
+# Status changes are pushed to the pages watching an issue as Server-Sent Events.
+# They are served by a separate single-threaded gateway (`flask --app app events
+# serve`), so an idle subscriber costs one socket instead of one WSGI thread. The
+# events are the rows of issue_status_history, and their ids are the event ids: a
+# client that reconnects with Last-Event-ID resumes from the database, on any
+# gateway. The 'issue.status' events of the event bus wake the gateways right after
+# a status update commits; the gateways also poll the table, which covers lost events.
+
+EVENT_STREAM_URL = os.getenv('EVENT_STREAM_URL', '')  # Base URL of the gateway; empty keeps the pages polling
+EVENT_STREAM_POLL_SECONDS = float(os.getenv('EVENT_STREAM_POLL_SECONDS', 1))
+EVENT_STREAM_HEARTBEAT_SECONDS = 15
+EVENT_STREAM_BUFFER_BYTES = 64 * 1024  # Unsent bytes a slow client may hold before it is dropped (it resumes on reconnect)
+EVENT_STREAM_GAP_SECONDS = 10  # How long a missing history id may still turn up (transactions commit out of id order)
+EVENT_STREAM_PATH = re.compile(r'^/api/issues/([A-Za-z0-9_-]+)/events$')
+
+STATUS_EVENT_COLUMNS = "id, issue_id_ref, status, notes, created_at"
+
+
+def format_status_event(row):
+    """An issue_status_history row as one SSE message."""
+    created_at = row['created_at']
+    data = {
+        'issue_id': row['issue_id_ref'],
+        'status': row['status'],
+        'notes': row['notes'],
+        'created_at': created_at.strftime('%B %d, %Y at %I:%M %p') if isinstance(created_at, datetime) else created_at,
+        'timestamp': created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+    }
+    return f"id: {row['id']}\nevent: status\ndata: {json.dumps(data)}\n\n".encode('utf-8')
+
+
+class _EventStreamClient:
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.opened = time.monotonic()
+        self.request = b''
+        self.outbuf = bytearray()
+        self.issue_id = None  # Set once the stream has started
+        self.replayed_to = 0
+        self.close_after_flush = False
+
+
+class IssueEventGateway:
+    """Serves /api/issues/<issue_id>/events to any number of clients from one thread.
 
-        # Issues Table with unique issue_id
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS issues (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                issue_id VARCHAR(255) UNIQUE,
-                fullName VARCHAR(255) NOT NULL,
-                age INT,
-                gender VARCHAR(50),
-                mobile VARCHAR(20) NOT NULL,
-                email VARCHAR(255) NOT NULL,
-                pincode VARCHAR(10),
-                city VARCHAR(100),
-                district VARCHAR(100),
-                state VARCHAR(100),
-                country VARCHAR(100),
-                residentialAddress TEXT,
-                workAddress TEXT,
-                issueCategory VARCHAR(100) NOT NULL,
-                customIssueType VARCHAR(255),
-                issueDescription TEXT NOT NULL,
-                latitude DECIMAL(10, 8),
-                longitude DECIMAL(11, 8),
-                locationAddress TEXT,
-                priority VARCHAR(50) NOT NULL,
-                image_filename VARCHAR(255),
-                status VARCHAR(50) DEFAULT 'Submitted',
-                submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-            )
-        """)
-        print("Issues table checked/created successfully.")
+    Like /api/check-status, the tracking ID is all a client needs. Each client has a
+    bounded output buffer; one that falls behind is disconnected and resumes from its
+    Last-Event-ID. A comment line goes out as heartbeat so proxies keep idle streams open.
+    """
 
-        # Status History Table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS issue_status_history (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                issue_id_ref VARCHAR(255),
-                status VARCHAR(50) NOT NULL,
-                notes TEXT,
-                updated_by VARCHAR(255) DEFAULT 'System',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (issue_id_ref) REFERENCES issues(issue_id) ON DELETE CASCADE
-            )
-        """)
-        print("Issue Status History table checked/created successfully.")
+    def __init__(self, address, poll=EVENT_STREAM_POLL_SECONDS, heartbeat=EVENT_STREAM_HEARTBEAT_SECONDS,
+                 buffer_bytes=EVENT_STREAM_BUFFER_BYTES):
+        self.poll = poll
+        self.heartbeat = heartbeat
+        self.buffer_bytes = buffer_bytes
+        self.selector = selectors.DefaultSelector()
+        self.listener = socket.create_server(address)
+        self.listener.setblocking(False)
+        self.address = self.listener.getsockname()
+        self.selector.register(self.listener, selectors.EVENT_READ, None)
+        # Nudges arrive on the cache subscriber thread and wake the loop through this pair
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self.selector.register(self._wake_reader, selectors.EVENT_READ, None)
+        self.clients = {}  # socket -> _EventStreamClient
+        self.watchers = {}  # issue_id -> set of streaming clients
+        self.floor = 0  # Every history id up to here has been delivered (or given up on)
+        self._delivered = set()  # Delivered ids above the floor
+        self._stuck_since = None
+        self._nudged = False
+        self._running = False
+        self.events_sent = 0
+        self.dropped = 0
+
+    def _on_event(self, event):
+        if event['kind'] in ('issue.status', 'issue.bulk_status'):
+            self.wake()
+
+    def wake(self):
+        self._nudged = True
+        try:
+            self._wake_writer.send(b'!')
+        except OSError:
+            pass  # Already awake
+
+    def stop(self):
+        self._running = False
+        self.wake()
+
+    def serve_forever(self):
+        event_bus.subscribe(self._on_event)
+        self.floor = self._query("SELECT COALESCE(MAX(id), 0) AS last_id FROM issue_status_history")[0]['last_id']
+        self._running = True
+        next_poll = next_beat = time.monotonic()
+        try:
+            while self._running:
+                timeout = max(0.0, min(next_poll, next_beat) - time.monotonic())
+                for key, mask in self.selector.select(timeout):
+                    if key.fileobj is self.listener:
+                        self._accept()
+                    elif key.fileobj is self._wake_reader:
+                        self._drain_wake()
+                    else:
+                        self._on_client(self.clients.get(key.fileobj), mask)
+                now = time.monotonic()
+                if self._nudged or now >= next_poll:
+                    self._nudged = False
+                    try:
+                        self._tail(now)
+                    except mysql.connector.Error as err:
+                        print(f"Event gateway could not read status history: {err}")
+                    next_poll = now + self.poll
+                if now >= next_beat:
+                    self._heartbeat(now)
+                    next_beat = now + self.heartbeat
+        finally:
+            for client in list(self.clients.values()):
+                self._close(client)
+            self.selector.close()
+            self.listener.close()
 
-        # Feedback Table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS feedback (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT,
-                rating INT NOT NULL,
-                category VARCHAR(100),
-                comments TEXT,
-                submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL
-            )
-        """)
-        print("Feedback table checked/created successfully.")
+    def _query(self, sql, params=()):
+        conn = get_db_connection()
+        if not conn:
+            raise mysql.connector.Error(msg='Database connection failed')
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
 
+    def _drain_wake(self):
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
 
-        # NEW: Developers Table (for the team members)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS developers (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                role VARCHAR(255) NOT NULL,
-                year VARCHAR(100),
-                department VARCHAR(255),
-                reg_no VARCHAR(100),
-                institute_name VARCHAR(255),
-                photo_filename VARCHAR(255),
-                linkedin_url VARCHAR(255),
-                github_url VARCHAR(255),
-                email VARCHAR(255),
-                is_leader BOOLEAN DEFAULT FALSE,
-                display_order INT DEFAULT 100
-            )
-        """)
-        print("Developers table checked/created successfully.")
+    def _accept(self):
+        try:
+            sock, _ = self.listener.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        self.clients[sock] = _EventStreamClient(sock)
+        self.selector.register(sock, selectors.EVENT_READ, None)
 
-        # NEW: Guide Table (for the project guide)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS guides (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                role TEXT NOT NULL,
-                bio_quote TEXT,
-                photo_filename VARCHAR(255),
-                linkedin_url VARCHAR(255),
-                email VARCHAR(255)
-            )
-        """)
-        print("Guides table checked/created successfully.")
+    def _on_client(self, client, mask):
+        if client is None:
+            return
+        if mask & selectors.EVENT_READ:
+            try:
+                data = client.sock.recv(8192)
+            except BlockingIOError:
+                data = None
+            except OSError:
+                data = b''
+            if data == b'':
+                self._close(client)
+                return
+            if data and client.issue_id is None:
+                client.request += data
+                if b'\r\n\r\n' in client.request:
+                    self._start_stream(client)
+                elif len(client.request) > 8192:
+                    self._reply(client, '431 Request Header Fields Too Large')
+        if mask & selectors.EVENT_WRITE and client.sock in self.clients:
+            self._flush(client)
+
+    def _reply(self, client, status, message=''):
+        body = message.encode('utf-8')
+        self._send(client, f"HTTP/1.1 {status}\r\nContent-Type: text/plain\r\nContent-Length: {len(body)}\r\n"
+                           f"Access-Control-Allow-Origin: *\r\nConnection: close\r\n\r\n".encode('ascii') + body)
+        self._close(client, after_flush=True)
+
+    def _start_stream(self, client):
+        head = client.request.split(b'\r\n\r\n', 1)[0].decode('latin-1').split('\r\n')
+        try:
+            method, target, _ = head[0].split(' ', 2)
+        except ValueError:
+            return self._reply(client, '400 Bad Request')
+        headers = {}
+        for line in head[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        url = urllib.parse.urlsplit(target)
+        match = EVENT_STREAM_PATH.match(url.path)
+        if method != 'GET' or not match:
+            return self._reply(client, '404 Not Found')
+        issue_id = match.group(1)
+        # EventSource sends Last-Event-ID when it reconnects; the page passes the newest
+        # history id it rendered on the first connect
+        last_event_id = headers.get('last-event-id') or urllib.parse.parse_qs(url.query).get('last_event_id', [''])[0]
+        try:
+            last_event_id = int(last_event_id) if last_event_id else None
+        except ValueError:
+            return self._reply(client, '400 Bad Request', 'Invalid Last-Event-ID')
+        try:
+            if not self._query("SELECT 1 AS found FROM issues WHERE issue_id = %s", (issue_id,)):
+                return self._reply(client, '404 Not Found', 'Issue ID not found.')
+            missed = []
+            if last_event_id is not None:
+                missed = self._query(f"SELECT {STATUS_EVENT_COLUMNS} FROM issue_status_history "
+                                     "WHERE issue_id_ref = %s AND id > %s ORDER BY id", (issue_id, last_event_id))
+        except mysql.connector.Error as err:
+            print(f"Event gateway could not open a stream: {err}")
+            return self._reply(client, '503 Service Unavailable')
+
+        client.issue_id = issue_id
+        client.request = b''
+        self.watchers.setdefault(issue_id, set()).add(client)
+        self._send(client, b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                           b"Access-Control-Allow-Origin: *\r\nX-Accel-Buffering: no\r\nConnection: keep-alive\r\n\r\n"
+                           b"retry: 5000\n\n")
+        for row in missed:
+            client.replayed_to = max(client.replayed_to, row['id'])
+            self._send(client, format_status_event(row))
+
+    def _tail(self, now):
+        rows = self._query(f"SELECT {STATUS_EVENT_COLUMNS} FROM issue_status_history WHERE id > %s ORDER BY id LIMIT 1000",
+                           (self.floor,))
+        for row in rows:
+            if row['id'] in self._delivered:
+                continue
+            self._delivered.add(row['id'])
+            message = None
+            for client in list(self.watchers.get(row['issue_id_ref'], ())):
+                if row['id'] > client.replayed_to:
+                    message = message or format_status_event(row)
+                    self._send(client, message)
+                    self.events_sent += 1
+        if len(rows) == 1000:
+            self._nudged = True
+        # Ids are handed out at insert time but become visible at commit, so a gap may
+        # still fill in; it is given up on after a while (rolled back inserts never do)
+        while self._delivered:
+            if self.floor + 1 in self._delivered:
+                self.floor += 1
+                self._delivered.remove(self.floor)
+                self._stuck_since = None
+                continue
+            if self._stuck_since is None:
+                self._stuck_since = now
+            if now - self._stuck_since < EVENT_STREAM_GAP_SECONDS:
+                break
+            self.floor = min(self._delivered) - 1
+            self._stuck_since = None
+
+    def _heartbeat(self, now):
+        for client in list(self.clients.values()):
+            if client.issue_id is not None:
+                self._send(client, b': ping\n\n')
+            elif now - client.opened > 10:
+                self._close(client)  # Never finished its request
+
+    def _send(self, client, data):
+        if client.sock not in self.clients:
+            return
+        client.outbuf += data
+        if len(client.outbuf) > self.buffer_bytes:
+            self.dropped += 1
+            self._close(client)
+            return
+        self._flush(client)
 
-        # ADD THIS TO your create_tables() function in app.py
+    def _flush(self, client):
+        try:
+            sent = client.sock.send(client.outbuf)
+            del client.outbuf[:sent]
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._close(client)
+            return
+        if client.outbuf:
+            self.selector.modify(client.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, None)
+        else:
+            self.selector.modify(client.sock, selectors.EVENT_READ, None)
+            if client.close_after_flush:
+                self._close(client)
 
-        # NEW: Announcements Table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS announcements (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                title VARCHAR(255) NOT NULL,
-                content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        print("Announcements table checked/created successfully.")
+    def _close(self, client, after_flush=False):
+        if client.sock not in self.clients:
+            return
+        if after_flush and client.outbuf:
+            client.close_after_flush = True
+            return
+        del self.clients[client.sock]
+        watchers = self.watchers.get(client.issue_id)
+        if watchers is not None:
+            watchers.discard(client)
+            if not watchers:
+                del self.watchers[client.issue_id]
+        self.selector.unregister(client.sock)
+        client.sock.close()
+
+    def stats(self):
+        return {
+            'clients': len(self.clients),
+            'issues_watched': len(self.watchers),
+            'events_sent': self.events_sent,
+            'dropped_slow_clients': self.dropped,
+            'floor': self.floor,
+        }
 
 
-    except mysql.connector.Error as err:
-        print(f"Error during table creation: {err}")
-    finally:
-        cursor.close()
-        conn.close()
+events_cli = AppGroup('events', help='Server-Sent Events gateway for issue status changes.')
+
+@events_cli.command('serve')
+@click.option('--host', default='127.0.0.1')
+@click.option('--port', default=5001, type=int)
+def events_serve_command(host, port):
+    """Run the event gateway (point the pages at it with EVENT_STREAM_URL=http://HOST:PORT)."""
+    gateway = IssueEventGateway((host, port))
+    print(f"Event gateway listening on {host}:{port}. Press Ctrl+C to stop.")
+    try:
+        gateway.serve_forever()
+    except KeyboardInterrupt:
+        pass
 
+app.cli.add_command(events_cli)
 
 
 # -----------------------------------------------------------------------------
@@ -260,8 +3197,7 @@ def login():
         cursor = conn.cursor(dictionary=True)
         try:
             # Fetch the user's status along with other details
-            cursor.execute("SELECT * FROM users WHERE email = %s", (email,))
-            user = cursor.fetchone()
+            user = run_hot_query(conn, 'user_by_email', (email,), one=True)
 
             # 1. Check if user exists and password is correct
             if user and bcrypt.checkpw(password.encode('utf-8'), user['password'].encode('utf-8')):
@@ -300,7 +3236,164 @@ def login():
 # DASHBOARD API ROUTES
 # =============================================================================
 
+# Each dashboard section is computed by one helper so the standalone endpoints
+# and /api/dashboard/bundle share the same queries. Sections that only need
+# counters read them from the user's summary row (`stats`), fetched once.
+
+USER_SUBMISSIONS_PAGE_LIMIT = 100
+# updated_at is stamped when an UPDATE runs, not when it commits, so a change can become
+# visible with an updated_at before the `as_of` of a poll that missed it. Delta polls
+# therefore look back this far; it must outlast the longest issue write transaction
+# (a bulk status chunk, an import batch).
+USER_SUBMISSIONS_DELTA_OVERLAP = timedelta(seconds=60)
+# Deleted issues leave a tombstone for delta polls; a poll older than this reloads instead
+ISSUE_TOMBSTONE_RETENTION = timedelta(days=7)
+
+@migration(10, 'Tombstones of deleted issues for delta polls')
+def migration_0010_issue_deletions(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS issue_deletions (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            user_id INT NOT NULL,
+            issue_pk INT NOT NULL,
+            deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_issue_deletions_user (user_id, deleted_at),
+            INDEX idx_issue_deletions_at (deleted_at)
+        )
+    """)
+
+def record_issues_deleted(cursor, issue_ids):
+    """Leaves tombstones for the given issues. Call before their DELETE, inside the same transaction."""
+    if not issue_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(issue_ids))
+    cursor.execute(f"""
+        INSERT INTO issue_deletions (user_id, issue_pk)
+        SELECT user_id, id FROM issues WHERE issue_id IN ({placeholders}) AND user_id IS NOT NULL
+    """, tuple(issue_ids))
+    cursor.execute("DELETE FROM issue_deletions WHERE deleted_at < NOW() - INTERVAL %s SECOND",
+                   (int(ISSUE_TOMBSTONE_RETENTION.total_seconds()),))
+
+def user_submissions_page(cursor, user_id, columns, limit, cursor_token=None):
+    """One keyset page of a user's issues, newest first. Returns (rows, next_cursor or None).
+
+    Seeks on (submitted_at, id) through idx_issues_user_submitted, so any page
+    costs the same as the first. Raises ValueError for a malformed cursor.
+    """
+    where, params = "WHERE user_id = %s", [user_id]
+    if cursor_token:
+        position = decode_cursor(cursor_token)
+        if 't' not in position or 'id' not in position:
+            raise ValueError('Invalid cursor')
+        where += " AND (submitted_at < %s OR (submitted_at = %s AND id < %s))"
+        params.extend([position['t'], position['t'], position['id']])
+    cursor.execute(f"""
+        SELECT {columns}, id AS seek_id, submitted_at AS seek_at
+        FROM issues {where}
+        ORDER BY submitted_at DESC, id DESC
+        LIMIT {limit + 1}
+    """, tuple(params))
+    rows = cursor.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor({'t': rows[-1]['seek_at'], 'id': rows[-1]['seek_id']})
+    for row in rows:
+        del row['seek_id'], row['seek_at']
+    return rows, next_cursor
+
+def dashboard_page_args():
+    """`limit`/`cursor` query parameters of the recent-submissions list."""
+    try:
+        limit = int(request.args.get('limit', 10))
+    except ValueError:
+        limit = 10
+    return max(1, min(limit, USER_SUBMISSIONS_PAGE_LIMIT)), request.args.get('cursor') or None
+
+def dashboard_stats_section(stats):
+    return {
+        'total_submissions': stats['total_count'],
+        'pending_issues': stats['submitted_count'],
+        'in_progress_issues': stats['in_progress_count'],
+        'resolved_issues': stats['resolved_count'] + stats['completed_count'],
+        'today_submissions': stats['today_count'],
+        'week_submissions': stats['week_count']
+    }
+
+def dashboard_recent_section(cursor, user_id, total_submissions, limit, cursor_token=None):
+    # The total comes from the user's summary row; the page itself is a keyset seek
+    total_pages = math.ceil(total_submissions / limit) if limit > 0 else 0
+    submissions, next_cursor = user_submissions_page(
+        cursor, user_id, "issue_id, effective_category as category, status, submitted_at", limit, cursor_token
+    )
+    
+    formatted_submissions = []
+    for submission in submissions:
+        if isinstance(submission['submitted_at'], datetime):
+            formatted_date = submission['submitted_at'].strftime('%b %d, %Y')
+        else:
+            formatted_date = 'N/A'
+        
+        formatted_submissions.append({
+            'issue_id': submission['issue_id'],
+            'category': submission['category'][:25] + '...' if len(submission['category']) > 25 else submission['category'],
+            'status': submission['status'],
+            'date': formatted_date
+        })
+    
+    return {
+        'submissions': formatted_submissions,
+        'pagination': {
+            'nextCursor': next_cursor,
+            'hasMore': next_cursor is not None,
+            'totalPages': total_pages,
+            'totalSubmissions': total_submissions,
+            'limit': limit
+        }
+    }
+
+def dashboard_category_section(cursor, user_id):
+    # Get category distribution
+    cursor.execute("""
+        SELECT 
+            effective_category as category,
+            COUNT(*) as count
+        FROM issues 
+        WHERE user_id = %s 
+        GROUP BY effective_category
+        ORDER BY count DESC
+        LIMIT 10
+    """, (user_id,))
+    return {'categories': cursor.fetchall()}
+
+def dashboard_overview_section(stats):
+    overview_stats = {
+        **dashboard_stats_section(stats),
+        'rejected_issues': stats['rejected_count'],
+        'month_submissions': stats['month_count']
+    }
+    
+    # Calculate resolution rate
+    total = overview_stats['total_submissions']
+    resolved = overview_stats['resolved_issues']
+    resolution_rate = round((resolved / total * 100) if total > 0 else 0, 1)
+    
+    return {
+        'overview': {
+            **overview_stats,
+            'resolution_rate': resolution_rate,
+            'most_active_day': stats['most_active_day'],
+            'engagement_level': 'High' if total > 10 else 'Medium' if total > 3 else 'Low'
+        }
+    }
+
+def dashboard_timeline_section(stats):
+    # Daily activity for the last 30 days, kept in the user's summary row
+    return {'activity_timeline': stats['daily']}
+
 @app.route('/api/dashboard/stats')
+@conditional_get(user_change_scope, period=3600)
 def api_dashboard_stats():
     """Get dashboard statistics for the current user"""
     if 'user_id' not in session or 'user_email' not in session:
@@ -312,39 +3405,10 @@ def api_dashboard_stats():
     
     cursor = conn.cursor(dictionary=True)
     try:
-        user_email = session['user_email']
-        
-        # Total submissions by user
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s", (user_email,))
-        total_submissions = cursor.fetchone()['count']
-        
-        # Pending issues (Submitted status)
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s AND status = 'Submitted'", (user_email,))
-        pending_issues = cursor.fetchone()['count']
-        
-        # In Progress issues
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s AND status = 'In Progress'", (user_email,))
-        in_progress_issues = cursor.fetchone()['count']
-        
-        # Resolved issues
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s AND status IN ('Resolved', 'Completed')", (user_email,))
-        resolved_issues = cursor.fetchone()['count']
-        
-        # Additional stats
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s AND DATE(submitted_at) = CURDATE()", (user_email,))
-        today_submissions = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s AND submitted_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)", (user_email,))
-        week_submissions = cursor.fetchone()['count']
-        
+        stats = get_user_issue_stats(cursor, session['user_id'])
         return jsonify({
             'status': 'success',
-            'total_submissions': total_submissions,
-            'pending_issues': pending_issues,
-            'in_progress_issues': in_progress_issues,
-            'resolved_issues': resolved_issues,
-            'today_submissions': today_submissions,
-            'week_submissions': week_submissions,
+            **dashboard_stats_section(stats),
             'timestamp': datetime.now().isoformat()
         })
         
@@ -360,20 +3424,14 @@ def api_dashboard_stats():
 # =============================================================================
 
 @app.route('/api/dashboard/recent-submissions')
+@conditional_get(user_change_scope, period=3600)
 def api_dashboard_recent_submissions():
     """Get recent submissions for the current user with pagination"""
     if 'user_id' not in session or 'user_email' not in session:
         return jsonify({'error': 'User not authenticated'}), 401
     
-    try:
-        page = int(request.args.get('page', 1))
-        limit = int(request.args.get('limit', 10))
-    except ValueError:
-        page = 1
-        limit = 10
-    
-    offset = (page - 1) * limit
-    user_email = session['user_email']
+    limit, cursor_token = dashboard_page_args()
+    user_id = session['user_id']
     
     conn = get_db_connection()
     if not conn:
@@ -381,58 +3439,15 @@ def api_dashboard_recent_submissions():
     
     cursor = conn.cursor(dictionary=True)
     try:
-        # --- FIX #1: Handle the count result safely ---
-        # This prevents an error if a user has zero submissions.
-        cursor.execute("SELECT COUNT(*) as total FROM issues WHERE email = %s", (user_email,))
-        count_result = cursor.fetchone()
-        total_submissions = count_result['total'] if count_result else 0
-        total_pages = math.ceil(total_submissions / limit) if limit > 0 else 0
-        
-        # The f-string query for LIMIT/OFFSET remains correct
-        query = f"""
-            SELECT 
-                issue_id,
-                CASE 
-                    WHEN customIssueType IS NOT NULL AND customIssueType != '' 
-                    THEN customIssueType 
-                    ELSE issueCategory 
-                END as category,
-                status,
-                submitted_at
-            FROM issues 
-            WHERE email = %s 
-            ORDER BY submitted_at DESC 
-            LIMIT {limit} OFFSET {offset}
-        """
-        cursor.execute(query, (user_email,))
-        submissions = cursor.fetchall()
-        
-        formatted_submissions = []
-        for submission in submissions:
-            if isinstance(submission['submitted_at'], datetime):
-                formatted_date = submission['submitted_at'].strftime('%b %d, %Y')
-            else:
-                formatted_date = 'N/A'
-            
-            formatted_submissions.append({
-                'issue_id': submission['issue_id'],
-                'category': submission['category'][:25] + '...' if len(submission['category']) > 25 else submission['category'],
-                'status': submission['status'],
-                'date': formatted_date
-            })
-        
+        total_submissions = get_user_issue_stats(cursor, user_id)['total_count']
         return jsonify({
             'status': 'success',
-            'submissions': formatted_submissions,
-            'pagination': {
-                'currentPage': page,
-                'totalPages': total_pages,
-                'totalSubmissions': total_submissions,
-                'limit': limit
-            },
+            **dashboard_recent_section(cursor, user_id, total_submissions, limit, cursor_token),
             'timestamp': datetime.now().isoformat()
         })
         
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
     # --- FIX #2: Broaden the exception to catch all errors ---
     except Exception as err:
         print(f"Database or other error on recent submissions: {err}")
@@ -442,6 +3457,7 @@ def api_dashboard_recent_submissions():
         conn.close()
 
 @app.route('/api/dashboard/category-stats')
+@conditional_get(user_change_scope, period=3600)
 def api_dashboard_category_stats():
     """Get issue category statistics for the current user"""
     if 'user_id' not in session or 'user_email' not in session:
@@ -453,29 +3469,9 @@ def api_dashboard_category_stats():
     
     cursor = conn.cursor(dictionary=True)
     try:
-        user_email = session['user_email']
-        
-        # Get category distribution
-        cursor.execute("""
-            SELECT 
-                CASE 
-                    WHEN customIssueType IS NOT NULL AND customIssueType != '' 
-                    THEN customIssueType 
-                    ELSE issueCategory 
-                END as category,
-                COUNT(*) as count
-            FROM issues 
-            WHERE email = %s 
-            GROUP BY category
-            ORDER BY count DESC
-            LIMIT 10
-        """, (user_email,))
-        
-        categories = cursor.fetchall()
-        
         return jsonify({
             'status': 'success',
-            'categories': categories,
+            **dashboard_category_section(cursor, session['user_id']),
             'timestamp': datetime.now().isoformat()
         })
         
@@ -486,6 +3482,63 @@ def api_dashboard_category_stats():
         cursor.close()
         conn.close()
 
+# Sections of /api/dashboard/bundle, in response order
+DASHBOARD_SECTIONS = ['stats', 'recent', 'categories', 'overview', 'timeline']
+
+@app.route('/api/dashboard/bundle')
+@conditional_get(user_change_scope, period=3600)
+def api_dashboard_bundle():
+    """All (or the `sections=` subset of) dashboard sections from one connection.
+
+    Each section has the same shape as its standalone endpoint; `limit`/`cursor`
+    apply to the `recent` section.
+    """
+    if 'user_id' not in session or 'user_email' not in session:
+        return jsonify({'error': 'User not authenticated'}), 401
+    
+    sections_arg = request.args.get('sections')
+    sections = [name.strip() for name in sections_arg.split(',') if name.strip()] if sections_arg else DASHBOARD_SECTIONS
+    unknown = [name for name in sections if name not in DASHBOARD_SECTIONS]
+    if unknown:
+        return jsonify({'error': f"Unknown dashboard section(s): {', '.join(unknown)}"}), 400
+    
+    limit, cursor_token = dashboard_page_args()
+    user_id = session['user_id']
+    
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed'}), 500
+    
+    cursor = conn.cursor(dictionary=True)
+    try:
+        # The summary row backs every section except categories; read it once
+        stats = get_user_issue_stats(cursor, user_id) if set(sections) - {'categories'} else None
+        payload = {'status': 'success'}
+        for name in DASHBOARD_SECTIONS:
+            if name not in sections:
+                continue
+            if name == 'stats':
+                payload['stats'] = dashboard_stats_section(stats)
+            elif name == 'recent':
+                payload['recent'] = dashboard_recent_section(cursor, user_id, stats['total_count'], limit, cursor_token)
+            elif name == 'categories':
+                payload['categories'] = dashboard_category_section(cursor, user_id)
+            elif name == 'overview':
+                payload['overview'] = dashboard_overview_section(stats)
+            elif name == 'timeline':
+                payload['timeline'] = dashboard_timeline_section(stats)
+        payload['timestamp'] = datetime.now().isoformat()
+        return jsonify(payload)
+        
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
+    except mysql.connector.Error as err:
+        print(f"Database error on dashboard bundle: {err}")
+        return jsonify({'error': 'An internal server error occurred.'}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
 # =============================================================================
 # UPDATE THE DASHBOARD ROUTE
 # =============================================================================
@@ -503,6 +3556,7 @@ def dashboard():
 # =============================================================================
 
 @app.route('/api/dashboard/overview')
+@conditional_get(user_change_scope, period=3600)
 def api_dashboard_overview():
     """Get comprehensive dashboard overview"""
     if 'user_id' not in session or 'user_email' not in session:
@@ -514,51 +3568,10 @@ def api_dashboard_overview():
     
     cursor = conn.cursor(dictionary=True)
     try:
-        user_email = session['user_email']
-        
-        # Get comprehensive stats
-        stats_query = """
-            SELECT 
-                COUNT(*) as total_submissions,
-                SUM(CASE WHEN status = 'Submitted' THEN 1 ELSE 0 END) as pending_issues,
-                SUM(CASE WHEN status = 'In Progress' THEN 1 ELSE 0 END) as in_progress_issues,
-                SUM(CASE WHEN status IN ('Resolved', 'Completed') THEN 1 ELSE 0 END) as resolved_issues,
-                SUM(CASE WHEN status = 'Rejected' THEN 1 ELSE 0 END) as rejected_issues,
-                SUM(CASE WHEN DATE(submitted_at) = CURDATE() THEN 1 ELSE 0 END) as today_submissions,
-                SUM(CASE WHEN submitted_at >= DATE_SUB(NOW(), INTERVAL 7 DAY) THEN 1 ELSE 0 END) as week_submissions,
-                SUM(CASE WHEN submitted_at >= DATE_SUB(NOW(), INTERVAL 30 DAY) THEN 1 ELSE 0 END) as month_submissions
-            FROM issues 
-            WHERE email = %s
-        """
-        
-        cursor.execute(stats_query, (user_email,))
-        overview_stats = cursor.fetchone()
-        
-        # Calculate resolution rate
-        total = overview_stats['total_submissions']
-        resolved = overview_stats['resolved_issues']
-        resolution_rate = round((resolved / total * 100) if total > 0 else 0, 1)
-        
-        # Get user's most active day
-        cursor.execute("""
-            SELECT DAYNAME(submitted_at) as day_name, COUNT(*) as count
-            FROM issues 
-            WHERE email = %s
-            GROUP BY DAYNAME(submitted_at), DAYOFWEEK(submitted_at)
-            ORDER BY count DESC
-            LIMIT 1
-        """, (user_email,))
-        
-        most_active_day = cursor.fetchone()
-        
+        stats = get_user_issue_stats(cursor, session['user_id'])
         return jsonify({
             'status': 'success',
-            'overview': {
-                **overview_stats,
-                'resolution_rate': resolution_rate,
-                'most_active_day': most_active_day['day_name'] if most_active_day else None,
-                'engagement_level': 'High' if total > 10 else 'Medium' if total > 3 else 'Low'
-            },
+            **dashboard_overview_section(stats),
             'timestamp': datetime.now().isoformat()
         })
         
@@ -570,6 +3583,7 @@ def api_dashboard_overview():
         conn.close()
 
 @app.route('/api/dashboard/activity-timeline')
+@conditional_get(user_change_scope, period=3600)
 def api_dashboard_activity_timeline():
     """Get user's activity timeline for the last 30 days"""
     if 'user_id' not in session or 'user_email' not in session:
@@ -581,30 +3595,10 @@ def api_dashboard_activity_timeline():
     
     cursor = conn.cursor(dictionary=True)
     try:
-        user_email = session['user_email']
-        
-        # Get daily activity for last 30 days
-        cursor.execute("""
-            SELECT 
-                DATE(submitted_at) as date,
-                COUNT(*) as submissions
-            FROM issues 
-            WHERE email = %s 
-            AND submitted_at >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
-            GROUP BY DATE(submitted_at)
-            ORDER BY date ASC
-        """, (user_email,))
-        
-        activity_data = cursor.fetchall()
-        
-        # Format dates for JSON
-        for item in activity_data:
-            if isinstance(item['date'], datetime):
-                item['date'] = item['date'].strftime('%Y-%m-%d')
-        
+        stats = get_user_issue_stats(cursor, session['user_id'])
         return jsonify({
             'status': 'success',
-            'activity_timeline': activity_data,
+            **dashboard_timeline_section(stats),
             'timestamp': datetime.now().isoformat()
         })
     except mysql.connector.Error as err:
@@ -731,22 +3725,32 @@ def api_admin_all_issues():
     if 'admin_id' not in session:
         return jsonify({'error': 'Admin not authenticated'}), 401
     
+    try:
+        filters = parse_issue_filters(request.args)
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
+    
     conn = get_db_connection()
     if not conn:
         return jsonify({'error': 'Database connection failed'}), 500
     
     cursor = conn.cursor(dictionary=True)
     try:
-        # Fetches all issues and orders them by submission time
-        cursor.execute("SELECT id, issue_id, fullName, issueCategory, locationAddress, priority, status, submitted_at FROM issues ORDER BY submitted_at DESC")
-        all_issues = cursor.fetchall()
+        # One page in submission order; the cursor for the next page is sent in X-Next-Cursor
+        try:
+            all_issues, next_cursor = list_issues_page(cursor, filters, **admin_issue_page_args())
+        except ValueError as err:
+            return jsonify({'error': str(err)}), 400
         
         # Format datetime objects to strings for JSON serialization
         for issue in all_issues:
             if isinstance(issue['submitted_at'], datetime):
                 issue['submitted_at'] = issue['submitted_at'].strftime('%d %b %Y, %I:%M %p')
         
-        return jsonify(all_issues)
+        response = jsonify(all_issues)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response
         
     except mysql.connector.Error as err:
         print(f"Database error on fetching all issues: {err}")
@@ -762,6 +3766,7 @@ def api_admin_all_issues():
 
 # NEW: API endpoint for admins to update an issue's status
 @app.route('/api/admin/update-status/<int:issue_id>', methods=['POST'])
+@idempotent
 def api_admin_update_status(issue_id):
     if 'admin_id' not in session:
         return jsonify({'error': 'Admin not authenticated'}), 401
@@ -779,17 +3784,23 @@ def api_admin_update_status(issue_id):
         
     cursor = conn.cursor(dictionary=True)
     try:
-        # Update the status in the main issues table
-        cursor.execute("UPDATE issues SET status = %s WHERE id = %s", (new_status, issue_id))
-        
-        # Log the status change in the history table
         cursor.execute("SELECT issue_id FROM issues WHERE id = %s", (issue_id,))
         issue = cursor.fetchone()
         if issue:
+            record_issues_removed(cursor, [issue['issue_id']])
+            # Update the status in the main issues table
+            cursor.execute("UPDATE issues SET status = %s WHERE id = %s", (new_status, issue_id))
+            record_issues_added(cursor, [issue['issue_id']])
+
+            # Log the status change in the history table
             history_sql = "INSERT INTO issue_status_history (issue_id_ref, status, notes, updated_by) VALUES (%s, %s, %s, %s)"
             cursor.execute(history_sql, (issue['issue_id'], new_status, notes, session.get('admin_username', 'Admin')))
         
         conn.commit()
+        invalidate_tables(*ISSUE_TABLES)
+        if issue:
+            event_bus.publish('issue.status', issue_id=issue['issue_id'], status=new_status,
+                              by=session.get('admin_username', 'Admin'))
         return jsonify({'status': 'success', 'message': f'Issue status updated to {new_status}.'})
 
     except mysql.connector.Error as err:
@@ -870,6 +3881,7 @@ def admin_api_feedbacks():
 
 # API endpoint for feedback statistics
 @app.route('/admin/api/feedback-stats')
+@conditional_get(lambda: [('table', 'feedback')] if 'admin_id' in session else None, period=60)
 def admin_api_feedback_stats():
     if 'admin_id' not in session:
         return jsonify({'error': 'Admin not authenticated'}), 401
@@ -880,26 +3892,24 @@ def admin_api_feedback_stats():
     
     cursor = conn.cursor(dictionary=True)
     try:
+        # Polled every 30 seconds; served from query_cache until feedback is written
         # Total feedbacks
-        cursor.execute("SELECT COUNT(*) as total_feedbacks FROM feedback")
-        total_feedbacks = cursor.fetchone()['total_feedbacks']
+        total_feedbacks = cached_query(cursor, "SELECT COUNT(*) as total_feedbacks FROM feedback", tables=('feedback',), one=True)['total_feedbacks']
         
         # Average rating
-        cursor.execute("SELECT AVG(rating) as avg_rating FROM feedback")
-        avg_rating_result = cursor.fetchone()
+        avg_rating_result = cached_query(cursor, "SELECT AVG(rating) as avg_rating FROM feedback", tables=('feedback',), one=True)
         avg_rating = round(avg_rating_result['avg_rating'], 1) if avg_rating_result['avg_rating'] else 0
         
         # Rating distribution
-        cursor.execute("""
+        rating_distribution = cached_query(cursor, """
             SELECT rating, COUNT(*) as count 
             FROM feedback 
             GROUP BY rating 
             ORDER BY rating DESC
-        """)
-        rating_distribution = cursor.fetchall()
+        """, tables=('feedback',))
         
         # Category distribution
-        cursor.execute("""
+        category_distribution = cached_query(cursor, """
             SELECT 
                 CASE 
                     WHEN category IS NULL OR category = '' THEN 'General'
@@ -909,16 +3919,14 @@ def admin_api_feedback_stats():
             FROM feedback 
             GROUP BY category 
             ORDER BY count DESC
-        """)
-        category_distribution = cursor.fetchall()
+        """, tables=('feedback',))
         
-        # Recent feedbacks (last 7 days)
-        cursor.execute("""
+        # Recent feedbacks (last 7 days); the window moves with the clock, hence the TTL
+        recent_feedbacks = cached_query(cursor, """
             SELECT COUNT(*) as recent_feedbacks 
             FROM feedback 
             WHERE submitted_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-        """)
-        recent_feedbacks = cursor.fetchone()['recent_feedbacks']
+        """, tables=('feedback',), one=True, ttl=60)['recent_feedbacks']
         
         return jsonify({
             'status': 'success',
@@ -938,86 +3946,747 @@ def admin_api_feedback_stats():
         cursor.close()
         conn.close()
 
-# API endpoint for deleting feedback
-@app.route('/admin/api/feedbacks/<int:feedback_id>', methods=['DELETE'])
-def admin_delete_feedback(feedback_id):
+# API endpoint for deleting feedback
+@app.route('/admin/api/feedbacks/<int:feedback_id>', methods=['DELETE'])
+def admin_delete_feedback(feedback_id):
+    if 'admin_id' not in session:
+        return jsonify({'error': 'Admin not authenticated'}), 401
+
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed.'}), 500
+        
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM feedback WHERE id = %s", (feedback_id,))
+        
+        if cursor.rowcount == 0:
+            return jsonify({'error': 'Feedback not found'}), 404
+        
+        conn.commit()
+        invalidate_tables('feedback')
+        return jsonify({'status': 'success', 'message': 'Feedback deleted successfully.'})
+
+    except mysql.connector.Error as err:
+        print(f"Database error deleting feedback: {err}")
+        conn.rollback()
+        return jsonify({'error': 'An internal server error occurred.'}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
+# -----------------------------------------------------------------------------
+# Streaming Exports
+# -----------------------------------------------------------------------------
+# Exports are generated while they are sent: rows are read in batches from an
+# unbuffered cursor and written out chunk by chunk, so memory stays flat no
+# matter how many rows the table holds.
+
+EXPORT_BATCH_SIZE = 2000
+
+# Export name -> source, whitelisted columns (output name -> SELECT expression),
+# the timestamp the from/to range applies to, the row order, and the column types
+# of the columnar formats (anything not listed is exported as a string).
+EXPORT_SPECS = {
+    'issues': {
+        'source': 'issues',
+        'columns': {name: name for name in [
+            'id', 'issue_id', 'user_id', 'fullName', 'age', 'gender', 'mobile', 'email', 'pincode',
+            'city', 'district', 'state', 'country', 'residentialAddress', 'workAddress',
+            'issueCategory', 'customIssueType', 'issueDescription', 'latitude', 'longitude',
+            'locationAddress', 'priority', 'image_filename', 'status', 'submitted_at', 'updated_at',
+            'effective_category',
+        ]},
+        'time_column': 'submitted_at',
+        'order_by': 'submitted_at DESC',
+        'types': {
+            'id': 'int32', 'user_id': 'int32', 'age': 'int32',
+            'latitude': 'decimal(10,8)', 'longitude': 'decimal(11,8)',
+            'submitted_at': 'timestamp', 'updated_at': 'timestamp',
+        },
+    },
+    'feedbacks': {
+        'source': 'feedback f LEFT JOIN users u ON f.user_id = u.id',
+        'columns': {
+            'id': 'f.id',
+            'user_name': "CONCAT(u.first_name, ' ', u.last_name)",
+            'user_email': 'u.email',
+            'rating': 'f.rating',
+            'category': 'f.category',
+            'comments': 'f.comments',
+            'submitted_at': 'f.submitted_at',
+        },
+        'time_column': 'f.submitted_at',
+        'order_by': 'f.submitted_at DESC',
+        'types': {'id': 'int32', 'rating': 'int32', 'submitted_at': 'timestamp'},
+    },
+    'issue_status_history': {
+        'source': 'issue_status_history',
+        'columns': {name: name for name in ['id', 'issue_id_ref', 'status', 'notes', 'updated_by', 'created_at']},
+        'time_column': 'created_at',
+        'order_by': 'created_at DESC',
+        'types': {'id': 'int32', 'created_at': 'timestamp'},
+    },
+    'chat_logs': {
+        'source': 'chat_logs',
+        'columns': {name: name for name in ['id', 'user_id', 'user_message', 'ai_response', 'created_at']},
+        'time_column': 'created_at',
+        'order_by': 'created_at DESC',
+        'types': {'id': 'int32', 'user_id': 'int32', 'created_at': 'timestamp'},
+    },
+}
+
+def get_dedicated_db_connection():
+    """A pooled connection that is not shared through flask.g; the caller must close() it.
+
+    Streamed response bodies are produced after the request's teardown has already
+    returned the request-scoped connection, so they need their own checkout.
+    """
+    try:
+        return PooledConnection(db_pool, db_pool.acquire())
+    except mysql.connector.Error as err:
+        print(f"Error connecting to database: {err}")
+        return None
+
+def get_export_db_connection():
+    """Like get_dedicated_db_connection(), but checked out of export_pool."""
+    try:
+        return PooledConnection(export_pool, export_pool.acquire())
+    except mysql.connector.Error as err:
+        print(f"Error connecting to database: {err}")
+        return None
+
+def parse_export_args(spec, args):
+    """Columns and from/to range of an export request. Raises ValueError for bad input."""
+    columns = list(spec['columns'])
+    if args.get('columns'):
+        columns = [name.strip() for name in args['columns'].split(',') if name.strip()]
+        unknown = [name for name in columns if name not in spec['columns']]
+        if unknown or not columns:
+            raise ValueError(f"Unknown export column(s): {', '.join(unknown) or '(none given)'}")
+    bounds = {}
+    for key in ('from', 'to'):
+        value = (args.get(key) or '').strip()
+        if value:
+            try:
+                bounds[key] = datetime.strptime(value, '%Y-%m-%d')
+            except ValueError:
+                raise ValueError(f"'{key}' must be a date in YYYY-MM-DD format")
+    return columns, bounds.get('from'), bounds.get('to')
+
+def export_query(spec, columns, date_from=None, date_to=None):
+    """SELECT statement and params for an export; `date_to` is inclusive of the whole day."""
+    select = ', '.join(f"{spec['columns'][name]} AS `{name}`" for name in columns)
+    clauses, params = [], []
+    if date_from:
+        clauses.append(f"{spec['time_column']} >= %s")
+        params.append(date_from)
+    if date_to:
+        clauses.append(f"{spec['time_column']} < %s")
+        params.append(date_to + timedelta(days=1))
+    where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+    return f"SELECT {select} FROM {spec['source']}{where} ORDER BY {spec['order_by']}", params
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return value
+
+def stream_csv_export(conn, sql, params, header, compress=False):
+    """Yields the CSV (optionally gzip) bytes of `sql`, one fetchmany() batch at a time.
+
+    Takes ownership of `conn` and closes it when the stream ends or is abandoned;
+    callers also close it when the response closes, in case it never starts.
+    """
+    cursor = conn.cursor()  # unbuffered: rows stay on the server until fetched
+    try:
+        cursor.execute(sql, tuple(params))
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # wbits=31 writes a gzip container rather than a raw zlib stream
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+        def drain():
+            data = buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+            return compressor.compress(data) if compressor else data
+
+        writer.writerow(header)
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                writer.writerow([_csv_value(value) for value in row])
+            chunk = drain()
+            if chunk:
+                yield chunk
+        tail = drain()
+        if compressor:
+            tail += compressor.flush()
+        if tail:
+            yield tail
+    except mysql.connector.Error as err:
+        # Headers are already sent; the client sees a truncated file
+        print(f"Database error while streaming export: {err}")
+    finally:
+        cursor.close()
+        conn.close()
+
+def csv_export_response(export_name):
+    """Streams EXPORT_SPECS[export_name] as a CSV download.
+
+    Query parameters: `columns` (comma-separated subset), `from`/`to` (YYYY-MM-DD,
+    inclusive) and `gzip=1` for a .csv.gz file.
+    """
+    spec = EXPORT_SPECS[export_name]
+    try:
+        columns, date_from, date_to = parse_export_args(spec, request.args)
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
+    compress = request.args.get('gzip') == '1'
+
+    conn = get_export_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed'}), 500
+    sql, params = export_query(spec, columns, date_from, date_to)
+
+    filename = f'{export_name}_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv' + ('.gz' if compress else '')
+    response = Response(stream_csv_export(conn, sql, params, columns, compress),
+                        mimetype='application/gzip' if compress else 'text/csv')
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    # Let reverse proxies pass chunks through instead of buffering the whole file
+    response.headers['X-Accel-Buffering'] = 'no'
+    # The stream's finally never runs when the body is not iterated (HEAD, or a client
+    # gone before the first chunk); closing the response returns the connection then
+    response.call_on_close(conn.close)
+    return response
+
+# -----------------------------------------------------------------------------
+# Columnar Exports (Parquet / Arrow)
+# -----------------------------------------------------------------------------
+# Typed, compressed alternative to the CSV exports for analysts. Each fetchmany()
+# batch becomes one Parquet row group (or Arrow record batch) and is sent as soon
+# as it is encoded, so memory is bounded by COLUMNAR_BATCH_SIZE rows.
+
+COLUMNAR_BATCH_SIZE = 50000
+COLUMNAR_COMPRESSION = 'zstd'
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('arrow', 'application/vnd.apache.arrow.file'),
+}
+
+def export_arrow_schema(spec, columns):
+    """pyarrow schema of an export, from the spec's 'types' (default: string)."""
+    fields = []
+    for name in columns:
+        type_name = spec.get('types', {}).get(name, 'string')
+        if type_name == 'int32':
+            arrow_type = pa.int32()
+        elif type_name == 'timestamp':
+            arrow_type = pa.timestamp('s')
+        elif type_name.startswith('decimal('):
+            precision, scale = type_name[len('decimal('):-1].split(',')
+            arrow_type = pa.decimal128(int(precision), int(scale))
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that collects what pyarrow writes until it is drained."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def write_columnar_export(cursor, sink, schema, export_format):
+    """Writes the rows of an executed cursor to `sink` as Parquet or Arrow IPC.
+
+    Generator: yields the running row count after every batch so callers can
+    flush the sink between row groups.
+    """
+    if export_format == 'parquet':
+        writer = pq.ParquetWriter(sink, schema, compression=COLUMNAR_COMPRESSION)
+    else:
+        writer = pa.ipc.new_file(sink, schema,
+                                 options=pa.ipc.IpcWriteOptions(compression=COLUMNAR_COMPRESSION))
+    written = 0
+    try:
+        while True:
+            rows = cursor.fetchmany(COLUMNAR_BATCH_SIZE)
+            if not rows:
+                break
+            values = list(zip(*rows))
+            batch = pa.RecordBatch.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(values, schema)],
+                schema=schema
+            )
+            writer.write_batch(batch)
+            written += len(rows)
+            yield written
+    finally:
+        writer.close()
+
+def stream_columnar_export(conn, sql, params, schema, export_format):
+    """Yields the Parquet/Arrow bytes of `sql`; takes ownership of `conn` like stream_csv_export()."""
+    cursor = conn.cursor()
+    sink = _ChunkSink()
+    try:
+        cursor.execute(sql, tuple(params))
+        for _ in write_columnar_export(cursor, sink, schema, export_format):
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+        tail = sink.drain()  # footer written by writer.close()
+        if tail:
+            yield tail
+    except (mysql.connector.Error, pa.ArrowException) as err:
+        print(f"Error while streaming {export_format} export: {err}")
+    finally:
+        cursor.close()
+        conn.close()
+
+def export_response(export_name):
+    """CSV, Parquet or Arrow download of EXPORT_SPECS[export_name], chosen by `?format=`."""
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f"Unsupported format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}"}), 400
+    if export_format == 'csv':
+        return csv_export_response(export_name)
+    if pa is None:
+        return jsonify({'error': 'Columnar exports need the pyarrow package on the server'}), 501
+
+    spec = EXPORT_SPECS[export_name]
+    try:
+        columns, date_from, date_to = parse_export_args(spec, request.args)
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
+
+    conn = get_export_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed'}), 500
+    sql, params = export_query(spec, columns, date_from, date_to)
+
+    extension, mimetype = EXPORT_FORMATS[export_format]
+    filename = f'{export_name}_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}'
+    response = Response(stream_columnar_export(conn, sql, params, export_arrow_schema(spec, columns), export_format),
+                        mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    response.headers['X-Accel-Buffering'] = 'no'
+    response.call_on_close(conn.close)  # as in csv_export_response()
+    return response
+
+# API endpoint for exporting feedbacks
+@app.route('/admin/api/feedbacks/export')
+def admin_export_feedbacks():
     if 'admin_id' not in session:
         return jsonify({'error': 'Admin not authenticated'}), 401
+    return export_response('feedbacks')
 
-    conn = get_db_connection()
+# Generic export endpoint, also covering the tables without a page of their own
+@app.route('/admin/api/export/<export_name>')
+def admin_export_table(export_name):
+    if 'admin_id' not in session:
+        return jsonify({'error': 'Admin not authenticated'}), 401
+    if export_name not in EXPORT_SPECS:
+        return jsonify({'error': f"Unknown export '{export_name}'"}), 404
+    return export_response(export_name)
+
+export_cli = AppGroup('export', help='Bulk data exports.')
+
+@export_cli.command('table')
+@click.argument('export_name', type=click.Choice(sorted(EXPORT_SPECS)))
+@click.argument('path', type=click.Path(dir_okay=False, writable=True))
+@click.option('--format', 'export_format', type=click.Choice(['parquet', 'arrow']), default='parquet')
+@click.option('--from', 'date_from', type=click.DateTime(formats=['%Y-%m-%d']), default=None)
+@click.option('--to', 'date_to', type=click.DateTime(formats=['%Y-%m-%d']), default=None)
+def export_table_command(export_name, path, export_format, date_from, date_to):
+    """Write a table to a Parquet or Arrow file."""
+    if pa is None:
+        print("Columnar exports need the pyarrow package (pip install pyarrow).")
+        return
+    spec = EXPORT_SPECS[export_name]
+    columns = list(spec['columns'])
+    sql, params = export_query(spec, columns, date_from, date_to)
+    conn = get_dedicated_db_connection()
     if not conn:
-        return jsonify({'error': 'Database connection failed.'}), 500
-        
+        print("Could not connect to the database.")
+        return
     cursor = conn.cursor()
     try:
-        cursor.execute("DELETE FROM feedback WHERE id = %s", (feedback_id,))
-        
-        if cursor.rowcount == 0:
-            return jsonify({'error': 'Feedback not found'}), 404
-        
-        conn.commit()
-        return jsonify({'status': 'success', 'message': 'Feedback deleted successfully.'})
-
+        started = time.monotonic()
+        cursor.execute(sql, tuple(params))
+        written = 0
+        with open(path, 'wb') as output:
+            for written in write_columnar_export(cursor, output, export_arrow_schema(spec, columns), export_format):
+                pass
+        print(f"Wrote {written} rows to {path} ({os.path.getsize(path)} bytes, {time.monotonic() - started:.2f}s).")
     except mysql.connector.Error as err:
-        print(f"Database error deleting feedback: {err}")
-        conn.rollback()
-        return jsonify({'error': 'An internal server error occurred.'}), 500
+        print(f"Error exporting {export_name}: {err}")
     finally:
         cursor.close()
         conn.close()
 
-# API endpoint for exporting feedbacks
-@app.route('/admin/api/feedbacks/export')
-def admin_export_feedbacks():
-    if 'admin_id' not in session:
-        return jsonify({'error': 'Admin not authenticated'}), 401
-    
+app.cli.add_command(export_cli)
+
+# -----------------------------------------------------------------------------
+# Asynchronous Report Intake
+# -----------------------------------------------------------------------------
+# With ASYNC_REPORTS=1, /report-issue only validates a report, keeps its image and
+# commits it to a SQLite queue on local disk, then answers 202 with the issue ID
+# it will get. Worker threads (and `flask --app app reports drain`) move queued
+# reports into MySQL in batches, so a burst of submissions waits in the queue
+# instead of holding web workers and database connections.
+
+class ReportQueueFull(Exception):
+    """Raised by ReportQueue.put() when REPORT_QUEUE_MAX_DEPTH reports are waiting."""
+
+
+class ReportQueue:
+    """Durable FIFO of accepted issue reports, shared by all processes of the host.
+
+    put() returns once the report is committed to the SQLite file (WAL mode, full
+    sync), so an accepted report survives a crash or restart. Workers claim batches
+    under a lease: the batch of a worker that dies is claimed again when its lease
+    runs out. A report that keeps failing is parked after `max_attempts` and stays
+    in the file, with its last error, for an admin to look at.
+    """
+
+    def __init__(self, path, max_depth, lease_seconds=60, max_attempts=5):
+        self.path = path
+        self.max_depth = max_depth
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._workers_pid = None
+        self._workers = 0
+        self._lock = threading.Lock()
+        self._accepted = 0
+        self._rejected = 0
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_batch = None
+
+    def _connection(self):
+        # One connection per thread, opened again in a forked child
+        if getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS reports (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    issue_id TEXT NOT NULL UNIQUE,
+                    payload TEXT NOT NULL,
+                    enqueued_at REAL NOT NULL,
+                    claimed_until REAL NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    parked INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT
+                )
+            """)
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return self._local.conn
+
+    def _transaction(self, work):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = work(conn)
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def put(self, issue_id, payload):
+        """Queues a report. Raises ReportQueueFull, or sqlite3.Error when the file is unusable."""
+        def work(conn):
+            depth = conn.execute("SELECT COUNT(*) FROM reports WHERE parked = 0").fetchone()[0]
+            if depth >= self.max_depth:
+                raise ReportQueueFull(depth)
+            conn.execute("INSERT INTO reports (issue_id, payload, enqueued_at) VALUES (?, ?, ?)",
+                         (issue_id, json.dumps(payload, default=str), time.time()))
+        try:
+            self._transaction(work)
+        except ReportQueueFull:
+            with self._lock:
+                self._rejected += 1
+            raise
+        with self._lock:
+            self._accepted += 1
+        self._wakeup.set()
+
+    def claim(self, limit):
+        """Up to `limit` waiting reports as (queue id, issue_id, payload), leased to the caller."""
+        now = time.time()
+
+        def work(conn):
+            rows = conn.execute(
+                "SELECT id, issue_id, payload FROM reports WHERE parked = 0 AND claimed_until <= ? ORDER BY id LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            conn.executemany("UPDATE reports SET claimed_until = ?, attempts = attempts + 1 WHERE id = ?",
+                             [(now + self.lease_seconds, row[0]) for row in rows])
+            return rows
+        return [(queue_id, issue_id, json.loads(payload)) for queue_id, issue_id, payload in self._transaction(work)]
+
+    def done(self, queue_ids, seconds=None):
+        """Removes reports that are now in MySQL."""
+        self._transaction(lambda conn: conn.executemany("DELETE FROM reports WHERE id = ?",
+                                                        [(queue_id,) for queue_id in queue_ids]))
+        with self._lock:
+            self._written += len(queue_ids)
+            if seconds is not None:
+                self._batches += 1
+                self._last_batch = {'reports': len(queue_ids), 'seconds': round(seconds, 3)}
+
+    def retry(self, failures):
+        """Hands failed reports back for a later attempt (backing off), or parks them. `failures`: [(queue id, error)]."""
+        now = time.time()
+        self._transaction(lambda conn: conn.executemany(
+            "UPDATE reports SET claimed_until = ? + 5 * attempts, last_error = ?, parked = attempts >= ? WHERE id = ?",
+            [(now, error, self.max_attempts, queue_id) for queue_id, error in failures]
+        ))
+        with self._lock:
+            self._failed += len(failures)
+
+    def get(self, issue_id):
+        """The payload of a report still waiting in the queue, or None."""
+        row = self._connection().execute(
+            "SELECT payload FROM reports WHERE issue_id = ? AND parked = 0", (issue_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def start_workers(self, count, drain, batch_size):
+        """Starts `count` threads in this process that call drain(batch_size) until the queue is empty."""
+        if count <= 0 or self._workers_pid == os.getpid():
+            return
+        with self._lock:
+            if self._workers_pid == os.getpid():
+                return
+            self._workers_pid = os.getpid()
+            self._workers = count
+        for number in range(count):
+            threading.Thread(target=self._work, args=(drain, batch_size), daemon=True,
+                             name=f'report-queue-{number}').start()
+
+    def _work(self, drain, batch_size):
+        while True:
+            try:
+                if drain(batch_size):
+                    continue
+            except Exception as err:
+                print(f"Report queue worker error: {err}")
+            # Woken by put() in this process; reports queued by other processes within a second
+            self._wakeup.wait(1)
+            self._wakeup.clear()
+
+    def stats(self):
+        conn = self._connection()
+        waiting, oldest, in_progress = conn.execute(
+            "SELECT COUNT(*), MIN(enqueued_at), SUM(claimed_until > ?) FROM reports WHERE parked = 0", (time.time(),)
+        ).fetchone()
+        parked = conn.execute("SELECT COUNT(*) FROM reports WHERE parked = 1").fetchone()[0]
+        with self._lock:
+            return {
+                'depth': waiting,
+                'max_depth': self.max_depth,
+                'in_progress': in_progress or 0,
+                'parked': parked,
+                'lag_seconds': round(time.time() - oldest, 3) if oldest else 0.0,
+                'accepted': self._accepted,
+                'rejected_full': self._rejected,
+                'written': self._written,
+                'failed_attempts': self._failed,
+                'batches': self._batches,
+                'last_batch': self._last_batch,
+                'workers': self._workers if self._workers_pid == os.getpid() else 0,
+                'path': self.path,
+            }
+
+
+report_queue = ReportQueue(REPORT_QUEUE_PATH, REPORT_QUEUE_MAX_DEPTH)
+
+
+def write_queued_reports(conn, cursor, entries):
+    """Writes claimed reports to MySQL in one transaction. Returns (written, failed) queue entries.
+
+    `failed` pairs a queue id with its error. On a database error the reports are
+    written one at a time, so only the bad ones go back to the queue. A report whose
+    issue_id is already in MySQL was written before its worker could remove it from
+    the queue; it counts as written.
+    """
+    placeholders = ', '.join(['%s'] * len(entries))
+    try:
+        cursor.execute(f"SELECT issue_id, user_id, submitted_at FROM issues WHERE issue_id IN ({placeholders})",
+                       tuple(issue_id for _, issue_id, _ in entries))
+        existing = {issue_id: (user_id, str(submitted_at)) for issue_id, user_id, submitted_at in cursor.fetchall()}
+        rows, written, failed = [], [], []
+        for entry in entries:
+            queue_id, issue_id, values = entry
+            if issue_id not in existing:
+                rows.append(dict(values, submitted_at=datetime.strptime(values['submitted_at'], '%Y-%m-%d %H:%M:%S')))
+                written.append(entry)
+            elif existing[issue_id] == (values['user_id'], values['submitted_at']):
+                written.append(entry)
+            else:
+                failed.append((queue_id, f"issue_id {issue_id} already belongs to another issue"))
+        if rows:
+            write_issue_rows(cursor, rows, 'Issue has been successfully submitted by the user.', 'System')
+        conn.commit()
+        return written, failed
+    except mysql.connector.Error as err:
+        conn.rollback()
+        if len(entries) == 1:
+            return [], [(entries[0][0], str(err))]
+        print(f"Database error writing {len(entries)} queued reports, retrying one at a time: {err}")
+        written, failed = [], []
+        for entry in entries:
+            entry_written, entry_failed = write_queued_reports(conn, cursor, [entry])
+            written += entry_written
+            failed += entry_failed
+        return written, failed
+
+
+def drain_report_queue(batch_size=REPORT_QUEUE_BATCH_SIZE):
+    """Moves one batch of queued reports into MySQL. Returns the number of reports claimed."""
+    entries = report_queue.claim(batch_size)
+    if not entries:
+        return 0
+    started = time.monotonic()
     conn = get_db_connection()
     if not conn:
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    cursor = conn.cursor(dictionary=True)
+        report_queue.retry([(queue_id, 'Database connection failed') for queue_id, _, _ in entries])
+        return 0
+    cursor = conn.cursor()
     try:
-        cursor.execute("""
-            SELECT 
-                f.id,
-                f.rating,
-                f.category,
-                f.comments,
-                f.submitted_at,
-                CONCAT(u.first_name, ' ', u.last_name) as user_name,
-                u.email as user_email
-            FROM feedback f
-            LEFT JOIN users u ON f.user_id = u.id
-            ORDER BY f.submitted_at DESC
-        """)
-        feedbacks = cursor.fetchall()
-        
-        # Convert to CSV format
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=['id', 'user_name', 'user_email', 'rating', 'category', 'comments', 'submitted_at'])
-        writer.writeheader()
-        for feedback in feedbacks:
-            # Convert datetime objects to strings
-            row = {}
-            for key, value in feedback.items():
-                if isinstance(value, datetime):
-                    row[key] = value.strftime('%Y-%m-%d %H:%M:%S')
-                else:
-                    row[key] = value
-            writer.writerow(row)
-        
-        response = make_response(output.getvalue())
-        response.headers['Content-Type'] = 'text/csv'
-        response.headers['Content-Disposition'] = f'attachment; filename=feedbacks_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        return response
-        
-    except mysql.connector.Error as err:
-        print(f"Database error on export: {err}")
-        return jsonify({'error': 'An internal server error occurred.'}), 500
+        written, failed = write_queued_reports(conn, cursor, entries)
     finally:
         cursor.close()
         conn.close()
+    if written:
+        report_queue.done([queue_id for queue_id, _, _ in written], time.monotonic() - started)
+        invalidate_tables(*ISSUE_TABLES)
+        for _, issue_id, values in written:
+            event_bus.publish('issue.created', issue_id=issue_id,
+                              category=values['customIssueType'] or values['issueCategory'],
+                              priority=values['priority'], city=values['city'])
+    if failed:
+        report_queue.retry(failed)
+    return len(entries)
+
+
+def enqueue_issue_report():
+    """The ASYNC_REPORTS branch of /report-issue: validate, keep the image, queue, answer 202."""
+    now = datetime.now().replace(microsecond=0)
+    form = {column: value for column, value in request.form.items() if column not in ('status', 'submitted_at')}
+    values, errors = validate_ingest_row(dict(form, email=session['user_email']), now)
+    if errors:
+        return jsonify({'status': 'error', 'message': ' '.join(f"{error}." for error in errors)}), 400
+
+    issue_id = generate_issue_id(now)
+    image_path = None
+    file = request.files.get('files[]')
+    if file and allowed_file(file.filename):
+        values['image_filename'] = f"{issue_id}_{secure_filename(file.filename)}"
+        image_path = os.path.join(app.config['UPLOAD_FOLDER'], values['image_filename'])
+        file.save(image_path)
+    values.update(issue_id=issue_id, user_id=session['user_id'],
+                  submitted_at=now.strftime('%Y-%m-%d %H:%M:%S'))
+
+    try:
+        report_queue.put(issue_id, values)
+    except (ReportQueueFull, sqlite3.Error) as err:
+        if image_path and os.path.exists(image_path):
+            os.remove(image_path)
+        if not isinstance(err, ReportQueueFull):
+            print(f"Report queue unavailable: {err}")
+            return jsonify({'status': 'error', 'message': 'An internal error occurred.'}), 500
+        response = jsonify({'status': 'error',
+                            'message': 'We are receiving a very large number of reports. Please try again in a minute.'})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(REPORT_QUEUE_RETRY_AFTER)
+        return response
+
+    report_queue.start_workers(REPORT_QUEUE_WORKERS, drain_report_queue, REPORT_QUEUE_BATCH_SIZE)
+    return jsonify({
+        'status': 'success',
+        'message': 'Issue received! It will appear in your submissions shortly.',
+        'issueId': issue_id,
+        'queued': True
+    }), 202
+
+
+def queued_issue_status(issue_id):
+    """/api/check-status answer for a report that is accepted but still in the queue, or None."""
+    try:
+        values = report_queue.get(issue_id)
+    except sqlite3.Error as err:
+        print(f"Report queue unavailable: {err}")
+        return None
+    if values is None:
+        return None
+    submitted_at = datetime.strptime(values['submitted_at'], '%Y-%m-%d %H:%M:%S').strftime('%B %d, %Y at %I:%M %p')
+    details = {column: values.get(column) for column in
+               ('issue_id', 'issueCategory', 'customIssueType', 'locationAddress', 'priority')}
+    details.update(status='Submitted', submitted_at=submitted_at)
+    history = [{'id': 0, 'status': 'Submitted', 'created_at': submitted_at,
+                'notes': 'Your report has been received and is being processed.'}]
+    return {'details': details, 'history': history}
+
+
+reports_cli = AppGroup('reports', help='Asynchronous report intake queue.')
+
+@reports_cli.command('drain')
+@click.option('--workers', type=int, default=REPORT_QUEUE_WORKERS, show_default=True)
+@click.option('--batch-size', type=int, default=REPORT_QUEUE_BATCH_SIZE, show_default=True)
+@click.option('--once', is_flag=True, help='Exit as soon as the queue is empty.')
+def drain_reports_command(workers, batch_size, once):
+    """Write queued reports to MySQL (runs until interrupted unless --once)."""
+    if once:
+        total = 0
+        while True:
+            claimed = drain_report_queue(batch_size)
+            if not claimed:
+                break
+            total += claimed
+        print(f"Processed {total} queued reports; {report_queue.stats()['depth']} still waiting.")
+        return
+    report_queue.start_workers(max(workers, 1), drain_report_queue, batch_size)
+    print(f"Draining {REPORT_QUEUE_PATH} with {max(workers, 1)} workers. Press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(10)
+            stats = report_queue.stats()
+            print(f"depth={stats['depth']} lag={stats['lag_seconds']}s written={stats['written']} parked={stats['parked']}")
+    except KeyboardInterrupt:
+        pass
+
+app.cli.add_command(reports_cli)
+
 # -----------------------------------------------------------------------------
 # Core Application Routes
 # -----------------------------------------------------------------------------
@@ -1028,13 +4697,142 @@ def index():
     return render_template('Main.html')
 
 
+class IssueIdGenerator:
+    """Snowflake-style issue ID values: unique across workers and increasing within each.
+
+    A value packs the milliseconds since ISSUE_ID_EPOCH_MS (41 bits), a worker ID
+    (10 bits) and a per-millisecond sequence (12 bits). The worker ID is
+    ISSUE_ID_WORKER_ID when set; otherwise it is leased in the shared cache store,
+    or, without one, held as a lock on a file in the temp directory, so no two live
+    processes use the same one. If the clock steps back, or a millisecond's sequence
+    runs out, counting continues from the last millisecond handed out, so values
+    never repeat or decrease.
+    """
+
+    def __init__(self, worker_id=None, backend=None, namespace='civicsense', lease_seconds=600):
+        self.fixed_worker_id = worker_id
+        self.backend = backend
+        self.lease_seconds = lease_seconds
+        self._prefix = f'{namespace}:issue_id_worker:'
+        self._lock = threading.Lock()
+        self._pid = None
+        self._worker_id = None
+        self._lease_token = None
+        self._lease_renewed_at = 0
+        self._lock_file = None
+        self._last_ms = -1
+        self._sequence = 0
+
+    def _acquire_worker_id(self):
+        if self.fixed_worker_id is not None:
+            return self.fixed_worker_id
+        workers = 1 << ISSUE_ID_WORKER_BITS
+        # Start the scan at a different slot per process, so most claims succeed at once
+        start = zlib.crc32(f"{socket.gethostname()}:{os.getpid()}".encode('utf-8')) % workers
+        if self.backend is not None:
+            token = f"{socket.gethostname()}:{os.getpid()}:{time.time_ns()}"
+            try:
+                for offset in range(workers):
+                    candidate = (start + offset) % workers
+                    if self.backend.add(self._prefix + str(candidate), token, self.lease_seconds):
+                        self._lease_token, self._lease_renewed_at = token, time.monotonic()
+                        return candidate
+                raise RuntimeError(f"All {workers} issue ID worker IDs are leased")
+            except CacheBackendError as err:
+                print(f"Issue ID worker lease unavailable, falling back to a host-local worker ID: {err}")
+        if fcntl is not None:
+            for offset in range(workers):
+                candidate = (start + offset) % workers
+                handle = open(os.path.join(tempfile.gettempdir(), f'civicsense-issue-id-{candidate}.lock'), 'a')
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    handle.close()
+                    continue
+                self._lock_file = handle  # Held, and the lock with it, for the life of the process
+                return candidate
+        return os.getpid() % workers
+
+    def _renew_lease(self):
+        # Renewed before the lease can run out; a lease lost anyway (the process stalled
+        # past it) is replaced before another ID is generated, so slots are never shared
+        if self._lease_token is None or time.monotonic() - self._lease_renewed_at < self.lease_seconds / 3:
+            return
+        key = self._prefix + str(self._worker_id)
+        try:
+            if self.backend.get(key) == self._lease_token.encode('utf-8'):
+                self.backend.set(key, self._lease_token, self.lease_seconds)
+                self._lease_renewed_at = time.monotonic()
+                return
+        except CacheBackendError as err:
+            print(f"Could not renew issue ID worker lease: {err}")
+            return
+        self._lease_token = None
+        self._worker_id = self._acquire_worker_id()
+
+    def next_value(self):
+        """(value, its millisecond relative to ISSUE_ID_EPOCH_MS) for a new issue ID."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the parent keeps its worker ID (and its lock file)
+                if self._lock_file is not None:
+                    self._lock_file.close()
+                    self._lock_file = None
+                self._lease_token = None
+                self._pid = os.getpid()
+                self._worker_id = self._acquire_worker_id()
+                self._last_ms, self._sequence = -1, 0
+            else:
+                self._renew_lease()
+            now_ms = time.time_ns() // 1_000_000 - ISSUE_ID_EPOCH_MS
+            if now_ms > self._last_ms:
+                self._last_ms, self._sequence = now_ms, 0
+            else:
+                self._sequence += 1
+                if self._sequence >> ISSUE_ID_SEQUENCE_BITS:
+                    self._last_ms, self._sequence = self._last_ms + 1, 0
+            value = (self._last_ms << (ISSUE_ID_WORKER_BITS + ISSUE_ID_SEQUENCE_BITS)
+                     | self._worker_id << ISSUE_ID_SEQUENCE_BITS | self._sequence)
+            return value, self._last_ms
+
+    def stats(self):
+        with self._lock:
+            return {'worker_id': self._worker_id, 'leased': self._lease_token is not None,
+                    'lock_file': self._lock_file.name if self._lock_file else None}
+
+
+issue_ids = IssueIdGenerator(ISSUE_ID_WORKER_ID, query_cache.backend if CACHE_URL else None)
+
+
+def encode_crockford(value, width):
+    """`value` as `width` Crockford base32 digits, zero-padded, so equal-width strings sort numerically."""
+    digits = []
+    for _ in range(width):
+        value, remainder = divmod(value, 32)
+        digits.append(CROCKFORD_ALPHABET[remainder])
+    return ''.join(reversed(digits))
+
+def generate_issue_id(submitted_at=None):
+    """Public issue ID: CS-<submission date>-<13 Crockford base32 digits of an IssueIdGenerator value>.
+
+    New IDs sort by creation time. `submitted_at` dates imported historical issues;
+    their suffix still orders by when they were imported.
+    """
+    value, millis = issue_ids.next_value()
+    day = submitted_at or datetime.fromtimestamp((millis + ISSUE_ID_EPOCH_MS) / 1000)
+    return f"CS-{day.strftime('%Y%m%d')}-{encode_crockford(value, ISSUE_ID_DIGITS)}"
+
 @app.route('/report-issue', methods=['GET', 'POST'])
+@idempotent
 def report_issue():
     if 'user_id' not in session:
         flash('You must be logged in to view this page.', 'warning')
         return redirect(url_for('login'))
 
     if request.method == 'POST':
+        if ASYNC_REPORTS:
+            return enqueue_issue_report()
+
         conn = get_db_connection()
         if not conn:
             return jsonify({'status': 'error', 'message': 'Database connection failed.'}), 500
@@ -1049,12 +4847,11 @@ def report_issue():
                     file.save(os.path.join(app.config['UPLOAD_FOLDER'], filename))
                     image_filename = filename
 
-            date_str = datetime.now().strftime('%Y%m%d')
-            unique_part = str(uuid.uuid4()).split('-')[0].upper()
-            generated_issue_id = f"CS-{date_str}-{unique_part}"
+            generated_issue_id = generate_issue_id()
 
             data = {
                 'issue_id': generated_issue_id,
+                'user_id': session['user_id'],
                 'fullName': request.form.get('fullName'),
                 'age': request.form.get('age'),
                 'gender': request.form.get('gender'),
@@ -1079,22 +4876,27 @@ def report_issue():
 
             sql = """
                 INSERT INTO issues (
-                    issue_id, fullName, age, gender, mobile, email, pincode, city, district, state, country,
+                    issue_id, user_id, fullName, age, gender, mobile, email, pincode, city, district, state, country,
                     residentialAddress, workAddress, issueCategory, customIssueType, issueDescription,
                     latitude, longitude, locationAddress, priority, image_filename
                 ) VALUES (
-                    %(issue_id)s, %(fullName)s, %(age)s, %(gender)s, %(mobile)s, %(email)s, %(pincode)s, %(city)s,
+                    %(issue_id)s, %(user_id)s, %(fullName)s, %(age)s, %(gender)s, %(mobile)s, %(email)s, %(pincode)s, %(city)s,
                     %(district)s, %(state)s, %(country)s, %(residentialAddress)s, %(workAddress)s,
                     %(issueCategory)s, %(customIssueType)s, %(issueDescription)s, %(latitude)s,
                     %(longitude)s, %(locationAddress)s, %(priority)s, %(image_filename)s
                 )
             """
             cursor.execute(sql, data)
+            record_issues_added(cursor, [generated_issue_id])
 
             history_sql = "INSERT INTO issue_status_history (issue_id_ref, status, notes) VALUES (%s, %s, %s)"
             cursor.execute(history_sql, (generated_issue_id, 'Submitted', 'Issue has been successfully submitted by the user.'))
 
             conn.commit()
+            invalidate_tables(*ISSUE_TABLES)
+            event_bus.publish('issue.created', issue_id=generated_issue_id,
+                              category=data['customIssueType'] or data['issueCategory'],
+                              priority=data['priority'], city=data['city'])
 
             return jsonify({
                 'status': 'success',
@@ -1122,7 +4924,8 @@ def my_submissions():
 @app.route('/check-status')
 def check_status():
     issue_id = request.args.get('issue_id', '')
-    return render_template('check-status.html', first_name=session.get('user_first_name'), issue_id=issue_id)
+    return render_template('check-status.html', first_name=session.get('user_first_name'), issue_id=issue_id,
+                           event_stream_url=EVENT_STREAM_URL)
 
 @app.route('/feedback')
 def feedback():
@@ -1405,14 +5208,11 @@ def get_user_profile():
         if not user:
             return jsonify({'error': 'User not found'}), 404
 
-        # --- Calculate user activity stats (code remains the same) ---
-        user_email = user['email']
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s", (user_email,))
-        user['total_submissions'] = cursor.fetchone()['count']
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s AND status = 'Resolved'", (user_email,))
-        user['resolved_issues'] = cursor.fetchone()['count']
-        cursor.execute("SELECT COUNT(*) as count FROM issues WHERE email = %s AND status = 'In Progress'", (user_email,))
-        user['in_progress_issues'] = cursor.fetchone()['count']
+        # --- User activity stats from the summary row ---
+        stats = get_user_issue_stats(cursor, user['id'])
+        user['total_submissions'] = stats['total_count']
+        user['resolved_issues'] = stats['resolved_count']
+        user['in_progress_issues'] = stats['in_progress_count']
         
         if isinstance(user['created_at'], datetime):
             user['member_since'] = user['created_at'].strftime('%B %d, %Y')
@@ -1532,20 +5332,78 @@ def update_user_password():
 # -----------------------------------------------------------------------------
 
 @app.route('/my-submissions-data')
+@conditional_get(user_change_scope)
 def my_submissions_data():
+    """One page of the user's submissions, newest first.
+
+    `limit` (default 20, max 100) and `cursor` (the previous page's `next_cursor`)
+    select the page; `totals=1` adds the counters from the user's summary row.
+    With `since` (the `as_of` of an earlier response) only the submissions whose
+    updated_at moved since then (less USER_SUBMISSIONS_DELTA_OVERLAP, so recent
+    changes are sent again) are returned, oldest change first, with the ids of those
+    deleted meanwhile in `deleted`; `reset` tells the client that too much changed
+    (or `since` is older than the tombstones) and it should reload the list instead.
+    """
     if 'user_id' not in session or 'user_email' not in session:
         return jsonify({'error': 'User not authenticated'}), 401
+    try:
+        limit = max(1, min(int(request.args.get('limit', 20)), USER_SUBMISSIONS_PAGE_LIMIT))
+    except ValueError:
+        limit = 20
+    since = request.args.get('since')
+    if since:
+        try:
+            since = datetime.strptime(since, '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            return jsonify({'error': 'since must be formatted as YYYY-MM-DD HH:MM:SS'}), 400
     conn = get_db_connection()
     if not conn:
         return jsonify({'error': 'Database connection failed'}), 500
     cursor = conn.cursor(dictionary=True)
     try:
-        cursor.execute("SELECT id, issue_id, issueCategory, customIssueType, locationAddress, priority, status, submitted_at FROM issues WHERE email = %s ORDER BY submitted_at DESC", (session['user_email'],))
-        submissions = cursor.fetchall()
-        for submission in submissions:
+        # Read the clock first: a row updated while the page is read is sent again next time
+        cursor.execute("SELECT NOW() AS as_of")
+        as_of = cursor.fetchone()['as_of']
+        columns = "id, issue_id, issueCategory, customIssueType, locationAddress, priority, status, submitted_at"
+        if since:
+            # Changes committed after the last poll but stamped before it are caught by
+            # the overlap; the client merges rows it already has by id
+            cursor.execute(f"""
+                SELECT {columns} FROM issues
+                WHERE user_id = %s AND updated_at >= %s
+                ORDER BY updated_at ASC, id ASC
+                LIMIT {USER_SUBMISSIONS_PAGE_LIMIT + 1}
+            """, (session['user_id'], since - USER_SUBMISSIONS_DELTA_OVERLAP))
+            submissions = cursor.fetchall()
+            cursor.execute(
+                "SELECT issue_pk FROM issue_deletions WHERE user_id = %s AND deleted_at >= %s",
+                (session['user_id'], since - USER_SUBMISSIONS_DELTA_OVERLAP)
+            )
+            deleted = sorted({row['issue_pk'] for row in cursor.fetchall()})
+            reset = (len(submissions) > USER_SUBMISSIONS_PAGE_LIMIT
+                     or since < as_of - ISSUE_TOMBSTONE_RETENTION + USER_SUBMISSIONS_DELTA_OVERLAP)
+            response = {'submissions': [] if reset else submissions, 'deleted': [] if reset else deleted,
+                        'reset': reset}
+        else:
+            try:
+                submissions, next_cursor = user_submissions_page(
+                    cursor, session['user_id'], columns, limit, request.args.get('cursor') or None
+                )
+            except ValueError as err:
+                return jsonify({'error': str(err)}), 400
+            response = {'submissions': submissions, 'next_cursor': next_cursor, 'has_more': next_cursor is not None}
+        for submission in response['submissions']:
             if isinstance(submission['submitted_at'], datetime):
                 submission['submitted_at'] = submission['submitted_at'].strftime('%B %d, %Y %I:%M %p')
-        return jsonify(submissions)
+        response['as_of'] = as_of.strftime('%Y-%m-%d %H:%M:%S')
+        if request.args.get('totals') == '1':
+            stats = get_user_issue_stats(cursor, session['user_id'])
+            response['totals'] = {
+                'total': stats['total_count'],
+                'in_progress': stats['in_progress_count'],
+                'resolved': stats['resolved_count']
+            }
+        return jsonify(response)
     except mysql.connector.Error as err:
         print(f"Database error on fetching submissions: {err}")
         return jsonify({'error': 'An internal error occurred.'}), 500
@@ -1563,14 +5421,13 @@ def get_submission_details(issue_id):
     cursor = conn.cursor(dictionary=True)
     try:
         # Get main submission details
-        cursor.execute("SELECT * FROM issues WHERE id = %s AND email = %s", (issue_id, session['user_email']))
+        cursor.execute("SELECT * FROM issues WHERE id = %s AND user_id = %s", (issue_id, session['user_id']))
         submission = cursor.fetchone()
         if not submission:
             return jsonify({'error': 'Submission not found or access denied'}), 404
 
         # Get the status history for that submission
-        cursor.execute("SELECT * FROM issue_status_history WHERE issue_id_ref = %s ORDER BY created_at ASC", (submission['issue_id'],))
-        history = cursor.fetchall()
+        history = run_hot_query(conn, 'issue_history', (submission['issue_id'],))
 
         # Format dates for consistency
         if isinstance(submission['submitted_at'], datetime):
@@ -1603,14 +5460,15 @@ def api_check_status():
 
     cursor = conn.cursor(dictionary=True)
     try:
-        cursor.execute("SELECT issue_id, issueCategory, customIssueType, locationAddress, priority, status, submitted_at FROM issues WHERE issue_id = %s", (issue_id,))
-        issue_details = cursor.fetchone()
+        issue_details = run_hot_query(conn, 'issue_status_by_issue_id', (issue_id,), one=True)
 
         if not issue_details:
+            queued = queued_issue_status(issue_id) if ASYNC_REPORTS else None
+            if queued:
+                return jsonify(queued)
             return jsonify({'error': 'Issue ID not found.'}), 404
 
-        cursor.execute("SELECT status, notes, created_at FROM issue_status_history WHERE issue_id_ref = %s ORDER BY created_at ASC", (issue_id,))
-        status_history = cursor.fetchall()
+        status_history = run_hot_query(conn, 'issue_history_public', (issue_id,))
 
         if isinstance(issue_details['submitted_at'], datetime):
             issue_details['submitted_at'] = issue_details['submitted_at'].strftime('%B %d, %Y at %I:%M %p')
@@ -1631,6 +5489,7 @@ def api_check_status():
         conn.close()
 
 @app.route('/api/submit-feedback', methods=['POST'])
+@idempotent
 def submit_feedback():
     if 'user_id' not in session:
         return jsonify({'status': 'error', 'message': 'User not authenticated.'}), 401
@@ -1657,6 +5516,8 @@ def submit_feedback():
         )
         cursor.execute(sql, feedback_data)
         conn.commit()
+        invalidate_tables('feedback')
+        event_bus.publish('feedback.created', rating=data.get('rating'), category=data.get('category'))
         
         return jsonify({'status': 'success', 'message': 'Thank you for your feedback!'})
 
@@ -1668,38 +5529,251 @@ def submit_feedback():
         cursor.close()
         conn.close()
 
+# -----------------------------------------------------------------------------
+# Admin Issue Listing (filters, facets, keyset pagination)
+# -----------------------------------------------------------------------------
+
+# Filter name -> issues column for exact-match filters
+ISSUE_FILTER_COLUMNS = {
+    'status': 'status',
+    'priority': 'priority',
+    'category': 'effective_category',
+    'city': 'city',
+}
+# The same filters against issue_rollup_hourly, for counts that need no row access
+ROLLUP_FILTER_COLUMNS = {
+    'status': 'status',
+    'priority': 'priority',
+    'category': 'category',
+    'city': 'city',
+}
+ISSUE_FULLTEXT_COLUMNS = 'fullName, email, locationAddress, issueCategory, customIssueType, issueDescription'
+# Sort key -> SQL expression; every sort is made unique by the id tiebreaker
+ADMIN_ISSUE_SORTS = {
+    'submitted_at': 'submitted_at',
+    'updated_at': 'updated_at',
+    'priority': "FIELD(priority, 'Low', 'Medium', 'Normal', 'High', 'Critical')",
+    'status': 'status',
+    'issue_id': 'issue_id',
+}
+ADMIN_ISSUE_FACETS = ['status', 'priority', 'category', 'city']
+ADMIN_ISSUE_PAGE_LIMIT = 200
+FACET_LIMIT = 20
+
+@migration(8, 'Full-text and updated_at indexes for the admin issue listing')
+def migration_0008_issue_listing_indexes(cursor):
+    create_secondary_indexes(cursor, [('issues', 'idx_issues_updated', '(updated_at)')])
+    if not index_exists(cursor, 'issues', 'ft_issues_search'):
+        # The first FULLTEXT index adds a hidden FTS_DOC_ID column, i.e. a table
+        # rebuild that cannot run with LOCK=NONE; let the server pick the algorithm.
+        cursor.execute(f"ALTER TABLE issues ADD FULLTEXT INDEX ft_issues_search ({ISSUE_FULLTEXT_COLUMNS})")
+        print("Index ft_issues_search created on issues.")
+
+def encode_cursor(payload):
+    """Opaque, URL-safe pagination cursor for a JSON-serialisable payload."""
+    raw = json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(token):
+    """Reverses encode_cursor(). Raises ValueError for anything that is not a cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as err:
+        raise ValueError('Invalid cursor') from err
+    if not isinstance(payload, dict):
+        raise ValueError('Invalid cursor')
+    return payload
+
+def parse_issue_filters(args):
+    """Reads the issue filters from request args. Raises ValueError for malformed dates."""
+    filters = {}
+    for key in ISSUE_FILTER_COLUMNS:
+        value = (args.get(key) or '').strip()
+        if value:
+            filters[key] = value
+    for key in ('date_from', 'date_to'):
+        value = (args.get(key) or '').strip()
+        if value:
+            try:
+                filters[key] = datetime.strptime(value, '%Y-%m-%d').date()
+            except ValueError:
+                raise ValueError(f"'{key}' must be a date in YYYY-MM-DD format")
+    text = (args.get('q') or '').strip()
+    if text:
+        filters['q'] = text
+    return filters
+
+def issue_filter_sql(filters, rollup=False, exclude=None):
+    """WHERE clause and params for parse_issue_filters() output.
+
+    With `rollup=True` the clause targets issue_rollup_hourly, which cannot answer
+    a free-text filter. `exclude` drops one filter, for facet counts.
+    """
+    columns = ROLLUP_FILTER_COLUMNS if rollup else ISSUE_FILTER_COLUMNS
+    time_column = 'bucket_start' if rollup else 'submitted_at'
+    clauses, params = [], []
+    for key, column in columns.items():
+        if key in filters and key != exclude:
+            clauses.append(f"{column} = %s")
+            params.append(filters[key])
+    # Day boundaries fall on rollup hour boundaries, so both tables filter exactly
+    if 'date_from' in filters:
+        clauses.append(f"{time_column} >= %s")
+        params.append(filters['date_from'])
+    if 'date_to' in filters:
+        clauses.append(f"{time_column} < %s")
+        params.append(filters['date_to'] + timedelta(days=1))
+    if 'q' in filters and not rollup:
+        terms = re.findall(r'\w+', filters['q'])
+        if terms:
+            clauses.append(f"(MATCH({ISSUE_FULLTEXT_COLUMNS}) AGAINST (%s IN BOOLEAN MODE) OR issue_id LIKE %s)")
+            params.extend([' '.join(f'+{term}*' for term in terms), filters['q'] + '%'])
+        else:
+            clauses.append("issue_id LIKE %s")
+            params.append(filters['q'] + '%')
+    return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+def issue_facets(cursor, filters):
+    """Total and per-dimension counts for the filtered issue set.
+
+    Each facet ignores its own filter, so the counts show what picking another
+    value would return. Without a free-text filter everything is read from the
+    hourly rollup and never touches the issues table. Results are served from
+    query_cache until an issue is written.
+    """
+    rollup = 'q' not in filters
+    table = 'issue_rollup_hourly' if rollup else 'issues'
+    count_sql = 'CAST(COALESCE(SUM(issue_count), 0) AS SIGNED)' if rollup else 'COUNT(*)'
+    columns = ROLLUP_FILTER_COLUMNS if rollup else ISSUE_FILTER_COLUMNS
+
+    where, params = issue_filter_sql(filters, rollup=rollup)
+    row = cached_query(cursor, f"SELECT {count_sql} AS total FROM {table}{where}", params, tables=(table,), one=True)
+    total = _row_values(row, 'total')[0]
+
+    facets = {}
+    for name in ADMIN_ISSUE_FACETS:
+        column = columns[name]
+        where, params = issue_filter_sql(filters, rollup=rollup, exclude=name)
+        where += (' AND ' if where else ' WHERE ') + f"{column} IS NOT NULL AND {column} != ''"
+        rows = cached_query(cursor, f"""
+            SELECT {column} AS value, {count_sql} AS count
+            FROM {table}{where}
+            GROUP BY {column}
+            HAVING count > 0
+            ORDER BY count DESC
+            LIMIT {FACET_LIMIT}
+        """, params, tables=(table,))
+        facets[name] = [dict(zip(('value', 'count'), _row_values(row, 'value', 'count'))) for row in rows]
+    return total, facets
+
+def list_issues_page(cursor, filters, sort='submitted_at', order='desc', limit=50, cursor_token=None):
+    """One keyset page of issues. Returns (rows, next_cursor or None).
+
+    Raises ValueError for an unknown sort or a cursor issued for a different sort.
+    """
+    if sort not in ADMIN_ISSUE_SORTS:
+        raise ValueError(f"Unknown sort '{sort}'")
+    if order not in ('asc', 'desc'):
+        raise ValueError("order must be 'asc' or 'desc'")
+    sort_sql = ADMIN_ISSUE_SORTS[sort]
+    where, params = issue_filter_sql(filters)
+
+    if cursor_token:
+        if sort == 'issue_id' and ISSUE_ID_PATTERN.fullmatch(cursor_token):
+            # Issue IDs are unique and ordered, so one is a cursor by itself
+            position = {'v': cursor_token, 'id': 0 if order == 'desc' else 2 ** 31 - 1}
+        else:
+            position = decode_cursor(cursor_token)
+            if position.get('s') != sort or position.get('o') != order or 'id' not in position:
+                raise ValueError('Cursor does not match this sort order')
+        op = '<' if order == 'desc' else '>'
+        where += (' AND ' if where else ' WHERE ') + f"({sort_sql} {op} %s OR ({sort_sql} = %s AND id {op} %s))"
+        params.extend([position['v'], position['v'], position['id']])
+
+    cursor.execute(f"""
+        SELECT id, issue_id, fullName, issueCategory, customIssueType, locationAddress, city,
+               priority, status, submitted_at, updated_at, email, mobile, {sort_sql} AS sort_value
+        FROM issues{where}
+        ORDER BY {sort_sql} {order.upper()}, id {order.upper()}
+        LIMIT {limit + 1}
+    """, tuple(params))
+    rows = cursor.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        if sort == 'issue_id' and ISSUE_ID_PATTERN.fullmatch(last['issue_id']):
+            next_cursor = last['issue_id']
+        else:
+            next_cursor = encode_cursor({'s': sort, 'o': order, 'v': last['sort_value'], 'id': last['id']})
+    for row in rows:
+        del row['sort_value']
+    return rows, next_cursor
+
+def admin_issue_page_args():
+    """Sort, order, limit and cursor of the admin issue listing from the query string."""
+    try:
+        limit = int(request.args.get('limit', 50))
+    except ValueError:
+        limit = 50
+    return {
+        'sort': request.args.get('sort', 'submitted_at'),
+        'order': request.args.get('order', 'desc').lower(),
+        'limit': max(1, min(limit, ADMIN_ISSUE_PAGE_LIMIT)),
+        'cursor_token': request.args.get('cursor') or None,
+    }
+
 # Add these routes to your Flask app.py file
 
 # Route to match what the HTML expects
 @app.route('/admin/api/issues')
+@conditional_get(admin_issue_scope)
 def admin_api_issues():
+    """One page of issues plus facet counts.
+
+    Filters: status, priority, category, city, date_from/date_to (YYYY-MM-DD), q (free text).
+    Paging: sort (submitted_at|updated_at|priority|status|issue_id), order (asc|desc), limit (max 200)
+    and the `next_cursor` of the previous page as `cursor`. Pass facets=0 to skip the counts.
+    """
     if 'admin_id' not in session:
         return jsonify({'error': 'Admin not authenticated'}), 401
     
+    try:
+        filters = parse_issue_filters(request.args)
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
+    page_args = admin_issue_page_args()
+    
     conn = get_db_connection()
     if not conn:
         return jsonify({'error': 'Database connection failed'}), 500
     
     cursor = conn.cursor(dictionary=True)
     try:
-        # Fetch all issues with basic info
-        cursor.execute("""
-            SELECT id, issue_id, fullName, issueCategory, locationAddress, 
-                   priority, status, submitted_at, email, mobile
-            FROM issues 
-            ORDER BY submitted_at DESC
-        """)
-        issues = cursor.fetchall()
+        try:
+            issues, next_cursor = list_issues_page(cursor, filters, **page_args)
+        except ValueError as err:
+            return jsonify({'error': str(err)}), 400
         
         # Format datetime objects to strings for JSON serialization
         for issue in issues:
-            if isinstance(issue['submitted_at'], datetime):
-                issue['submitted_at'] = issue['submitted_at'].strftime('%Y-%m-%d %H:%M:%S')
+            for key in ('submitted_at', 'updated_at'):
+                if isinstance(issue[key], datetime):
+                    issue[key] = issue[key].strftime('%Y-%m-%d %H:%M:%S')
         
-        return jsonify({
+        response = {
             'status': 'success',
-            'issues': issues
-        })
+            'issues': issues,
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None,
+            'limit': page_args['limit']
+        }
+        # Facets describe the whole filtered set, so the first page is enough
+        if request.args.get('facets', '1') != '0' and not page_args['cursor_token']:
+            response['total'], response['facets'] = issue_facets(cursor, filters)
+        return jsonify(response)
         
     except mysql.connector.Error as err:
         print(f"Database error on fetching issues: {err}")
@@ -1729,11 +5803,7 @@ def admin_api_issue_details(issue_id):
             return jsonify({'error': 'Issue not found'}), 404
 
         # NEW: Step 2: Get the full status history for that issue
-        cursor.execute(
-            "SELECT * FROM issue_status_history WHERE issue_id_ref = %s ORDER BY created_at ASC", 
-            (issue['issue_id'],)
-        )
-        history = cursor.fetchall()
+        history = run_hot_query(conn, 'issue_history', (issue['issue_id'],))
 
         # Step 3: Format all dates for consistency
         for item in [issue] + history:
@@ -1750,121 +5820,756 @@ def admin_api_issue_details(issue_id):
         return jsonify({'error': 'An internal server error occurred.'}), 500
     finally:
         cursor.close()
-        conn.close()
-# Route to update issue status
-@app.route('/admin/api/issues/<issue_id>/status', methods=['PUT'])
-def admin_update_issue_status(issue_id):
+        conn.close()
+# Route to update issue status
+@app.route('/admin/api/issues/<issue_id>/status', methods=['PUT'])
+@idempotent
+def admin_update_issue_status(issue_id):
+    if 'admin_id' not in session:
+        return jsonify({'error': 'Admin not authenticated'}), 401
+
+    data = request.get_json()
+    new_status = data.get('status')
+    notes = data.get('notes', f'Status updated to {new_status} by admin.')
+
+    if not new_status:
+        return jsonify({'error': 'New status is required.'}), 400
+
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed.'}), 500
+        
+    cursor = conn.cursor(dictionary=True)
+    try:
+        # Update the status in the main issues table
+        record_issues_removed(cursor, [issue_id])
+        cursor.execute("UPDATE issues SET status = %s WHERE issue_id = %s", (new_status, issue_id))
+        record_issues_added(cursor, [issue_id])
+        
+        # Log the status change in the history table
+        history_sql = "INSERT INTO issue_status_history (issue_id_ref, status, notes, updated_by) VALUES (%s, %s, %s, %s)"
+        cursor.execute(history_sql, (issue_id, new_status, notes, session.get('admin_username', 'Admin')))
+        
+        conn.commit()
+        invalidate_tables(*ISSUE_TABLES)
+        event_bus.publish('issue.status', issue_id=issue_id, status=new_status, by=session.get('admin_username', 'Admin'))
+        return jsonify({'status': 'success', 'message': f'Issue status updated to {new_status}.'})
+
+    except mysql.connector.Error as err:
+        print(f"Database error updating status: {err}")
+        conn.rollback()
+        return jsonify({'error': 'An internal server error occurred.'}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
+# Route to delete an issue
+@app.route('/admin/api/issues/<issue_id>', methods=['DELETE'])
+def admin_delete_issue(issue_id):
+    if 'admin_id' not in session:
+        return jsonify({'error': 'Admin not authenticated'}), 401
+
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed.'}), 500
+        
+    cursor = conn.cursor()
+    try:
+        # First delete from status history (due to foreign key constraint)
+        cursor.execute("DELETE FROM issue_status_history WHERE issue_id_ref = %s", (issue_id,))
+        
+        # Then delete the main issue
+        record_issues_removed(cursor, [issue_id])
+        record_issues_deleted(cursor, [issue_id])
+        cursor.execute("DELETE FROM issues WHERE issue_id = %s", (issue_id,))
+        
+        if cursor.rowcount == 0:
+            return jsonify({'error': 'Issue not found'}), 404
+        
+        conn.commit()
+        invalidate_tables(*ISSUE_TABLES)
+        event_bus.publish('issue.deleted', issue_id=issue_id, by=session.get('admin_username', 'Admin'))
+        return jsonify({'status': 'success', 'message': 'Issue deleted successfully.'})
+
+    except mysql.connector.Error as err:
+        print(f"Database error deleting issue: {err}")
+        conn.rollback()
+        return jsonify({'error': 'An internal server error occurred.'}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
+# -----------------------------------------------------------------------------
+# Bulk Triage
+# -----------------------------------------------------------------------------
+# Bulk status updates and deletes work through the issues in chunks, one
+# transaction per chunk: a handful of statements per chunk instead of a few round
+# trips per issue, while row locks are held for one chunk at a time.
+
+BULK_CHUNK_SIZE = 500
+BULK_MAX_ISSUES = 20000
+
+def resolve_bulk_issue_ids(cursor, data):
+    """The issue IDs a bulk request names: its `issue_ids` list, or every issue matching its `filter`.
+
+    `filter` takes the admin issue list filters (status, priority, category, city,
+    date_from, date_to, q) and must not be empty. Raises ValueError for a malformed
+    request or more than BULK_MAX_ISSUES issues.
+    """
+    if 'issue_ids' in data:
+        issue_ids = data['issue_ids']
+        if not isinstance(issue_ids, list) or not all(isinstance(issue_id, str) and issue_id for issue_id in issue_ids):
+            raise ValueError("'issue_ids' must be a list of issue IDs")
+        issue_ids = list(dict.fromkeys(issue_ids))
+    elif isinstance(data.get('filter'), dict):
+        filters = parse_issue_filters(data['filter'])
+        if not filters:
+            raise ValueError("'filter' must contain at least one filter")
+        where, params = issue_filter_sql(filters)
+        cursor.execute(f"SELECT issue_id FROM issues{where} ORDER BY id LIMIT {BULK_MAX_ISSUES + 1}", tuple(params))
+        issue_ids = [row[0] for row in cursor.fetchall()]
+    else:
+        raise ValueError("Provide either 'issue_ids' or 'filter'")
+    if len(issue_ids) > BULK_MAX_ISSUES:
+        raise ValueError(f"A bulk request may touch at most {BULK_MAX_ISSUES} issues; narrow it down")
+    return issue_ids
+
+def bulk_update_issue_status(conn, issue_ids, new_status, notes, updated_by, chunk_size=BULK_CHUNK_SIZE):
+    """Sets the status of many issues. Returns {issue_id: outcome}.
+
+    Outcomes: 'updated', 'unchanged' (already in that status, so no history entry),
+    'not_found', or 'failed' when the chunk's transaction was rolled back.
+    """
+    results = {}
+    cursor = conn.cursor()
+    try:
+        for start in range(0, len(issue_ids), chunk_size):
+            chunk = issue_ids[start:start + chunk_size]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            try:
+                cursor.execute(f"SELECT issue_id, status FROM issues WHERE issue_id IN ({placeholders}) FOR UPDATE", tuple(chunk))
+                current = dict(cursor.fetchall())
+                changing = [issue_id for issue_id in chunk if issue_id in current and current[issue_id] != new_status]
+                if changing:
+                    record_issues_removed(cursor, changing)
+                    cursor.execute(
+                        f"UPDATE issues SET status = %s WHERE issue_id IN ({', '.join(['%s'] * len(changing))})",
+                        (new_status, *changing)
+                    )
+                    record_issues_added(cursor, changing)
+                    cursor.executemany(
+                        "INSERT INTO issue_status_history (issue_id_ref, status, notes, updated_by) VALUES (%s, %s, %s, %s)",
+                        [(issue_id, new_status, notes, updated_by) for issue_id in changing]
+                    )
+                conn.commit()
+            except mysql.connector.Error as err:
+                print(f"Database error in bulk status update: {err}")
+                conn.rollback()
+                results.update(dict.fromkeys(chunk, 'failed'))
+                continue
+            if changing:
+                invalidate_tables(*ISSUE_TABLES)
+                event_bus.publish('issue.bulk_status', count=len(changing), status=new_status, by=updated_by)
+            changed = set(changing)
+            for issue_id in chunk:
+                results[issue_id] = 'updated' if issue_id in changed else 'unchanged' if issue_id in current else 'not_found'
+    finally:
+        cursor.close()
+    return results
+
+def bulk_delete_issues(conn, issue_ids, deleted_by, chunk_size=BULK_CHUNK_SIZE):
+    """Deletes many issues with their status history. Returns {issue_id: 'deleted' | 'not_found' | 'failed'}."""
+    results = {}
+    cursor = conn.cursor()
+    try:
+        for start in range(0, len(issue_ids), chunk_size):
+            chunk = issue_ids[start:start + chunk_size]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            try:
+                cursor.execute(f"SELECT issue_id FROM issues WHERE issue_id IN ({placeholders}) FOR UPDATE", tuple(chunk))
+                found = [row[0] for row in cursor.fetchall()]
+                if found:
+                    found_placeholders = ', '.join(['%s'] * len(found))
+                    cursor.execute(f"DELETE FROM issue_status_history WHERE issue_id_ref IN ({found_placeholders})", tuple(found))
+                    record_issues_removed(cursor, found)
+                    record_issues_deleted(cursor, found)
+                    cursor.execute(f"DELETE FROM issues WHERE issue_id IN ({found_placeholders})", tuple(found))
+                conn.commit()
+            except mysql.connector.Error as err:
+                print(f"Database error in bulk delete: {err}")
+                conn.rollback()
+                results.update(dict.fromkeys(chunk, 'failed'))
+                continue
+            if found:
+                invalidate_tables(*ISSUE_TABLES)
+                event_bus.publish('issue.bulk_deleted', count=len(found), by=deleted_by)
+            deleted = set(found)
+            for issue_id in chunk:
+                results[issue_id] = 'deleted' if issue_id in deleted else 'not_found'
+    finally:
+        cursor.close()
+    return results
+
+def bulk_response(results):
+    summary = {}
+    for outcome in results.values():
+        summary[outcome] = summary.get(outcome, 0) + 1
+    return jsonify({
+        'status': 'partial' if 'failed' in summary else 'success',
+        'summary': summary,
+        'results': [{'issue_id': issue_id, 'result': outcome} for issue_id, outcome in results.items()]
+    })
+
+@app.route('/admin/api/issues/bulk-status', methods=['POST'])
+@idempotent
+def admin_bulk_update_status():
+    """Sets one status on many issues: {"issue_ids": [...]} or {"filter": {...}}, plus "status" and optional "notes"."""
     if 'admin_id' not in session:
         return jsonify({'error': 'Admin not authenticated'}), 401
 
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     new_status = data.get('status')
     notes = data.get('notes', f'Status updated to {new_status} by admin.')
-
     if not new_status:
         return jsonify({'error': 'New status is required.'}), 400
 
     conn = get_db_connection()
     if not conn:
         return jsonify({'error': 'Database connection failed.'}), 500
-        
-    cursor = conn.cursor(dictionary=True)
-    try:
-        # Update the status in the main issues table
-        cursor.execute("UPDATE issues SET status = %s WHERE issue_id = %s", (new_status, issue_id))
-        
-        # Log the status change in the history table
-        history_sql = "INSERT INTO issue_status_history (issue_id_ref, status, notes, updated_by) VALUES (%s, %s, %s, %s)"
-        cursor.execute(history_sql, (issue_id, new_status, notes, session.get('admin_username', 'Admin')))
-        
-        conn.commit()
-        return jsonify({'status': 'success', 'message': f'Issue status updated to {new_status}.'})
 
+    cursor = conn.cursor()
+    try:
+        issue_ids = resolve_bulk_issue_ids(cursor, data)
+        results = bulk_update_issue_status(conn, issue_ids, new_status, notes, session.get('admin_username', 'Admin'))
+        return bulk_response(results)
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
     except mysql.connector.Error as err:
-        print(f"Database error updating status: {err}")
-        conn.rollback()
+        print(f"Database error in bulk status update: {err}")
         return jsonify({'error': 'An internal server error occurred.'}), 500
     finally:
         cursor.close()
         conn.close()
 
-# Route to delete an issue
-@app.route('/admin/api/issues/<issue_id>', methods=['DELETE'])
-def admin_delete_issue(issue_id):
+@app.route('/admin/api/issues/bulk-delete', methods=['POST'])
+def admin_bulk_delete_issues():
+    """Deletes many issues: {"issue_ids": [...]} or {"filter": {...}}."""
     if 'admin_id' not in session:
         return jsonify({'error': 'Admin not authenticated'}), 401
 
+    data = request.get_json(silent=True) or {}
     conn = get_db_connection()
     if not conn:
         return jsonify({'error': 'Database connection failed.'}), 500
-        
+
     cursor = conn.cursor()
     try:
-        # First delete from status history (due to foreign key constraint)
-        cursor.execute("DELETE FROM issue_status_history WHERE issue_id_ref = %s", (issue_id,))
-        
-        # Then delete the main issue
-        cursor.execute("DELETE FROM issues WHERE issue_id = %s", (issue_id,))
-        
-        if cursor.rowcount == 0:
-            return jsonify({'error': 'Issue not found'}), 404
-        
-        conn.commit()
-        return jsonify({'status': 'success', 'message': 'Issue deleted successfully.'})
-
+        issue_ids = resolve_bulk_issue_ids(cursor, data)
+        results = bulk_delete_issues(conn, issue_ids, session.get('admin_username', 'Admin'))
+        return bulk_response(results)
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
     except mysql.connector.Error as err:
-        print(f"Database error deleting issue: {err}")
-        conn.rollback()
+        print(f"Database error in bulk delete: {err}")
         return jsonify({'error': 'An internal server error occurred.'}), 500
     finally:
         cursor.close()
         conn.close()
 
-# Route to export issues data
-@app.route('/admin/api/issues/export')
-def admin_export_issues():
+# -----------------------------------------------------------------------------
+# Bulk Issue Ingestion
+# -----------------------------------------------------------------------------
+# Imports historical complaints from CSV or JSONL (one JSON object per line), e.g.
+# when a ward office migrates its backlog. Every row is validated on its own; the
+# valid ones are inserted INGEST_BATCH_SIZE at a time with multi-row INSERTs
+# (executemany), together with their status history, one transaction per batch.
+# Columns use the names of the report form fields, plus optional `status` and
+# `submitted_at`.
+
+INGEST_BATCH_SIZE = 5000
+INGEST_MAX_ERRORS = 1000  # rows listed in the error report; the rest are only counted
+INGEST_FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+INGEST_MIMETYPES = {'text/csv': 'csv', 'application/x-ndjson': 'jsonl', 'application/jsonl': 'jsonl',
+                    'application/x-jsonlines': 'jsonl'}
+# Maximum length in characters of each text column; None marks TEXT columns (64 KB)
+INGEST_TEXT_LIMITS = {
+    'fullName': 255, 'gender': 50, 'mobile': 20, 'email': 255, 'pincode': 10, 'city': 100, 'district': 100,
+    'state': 100, 'country': 100, 'residentialAddress': None, 'workAddress': None, 'issueCategory': 100,
+    'customIssueType': 255, 'issueDescription': None, 'locationAddress': None, 'priority': 50,
+}
+INGEST_REQUIRED = ('fullName', 'mobile', 'email', 'issueCategory', 'issueDescription', 'priority')
+INGEST_NUMBERS = {'age': (int, 0, 150), 'latitude': (float, -90, 90), 'longitude': (float, -180, 180)}
+INGEST_DATETIME_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d')
+INGEST_ISSUE_COLUMNS = (
+    'issue_id', 'user_id', 'fullName', 'age', 'gender', 'mobile', 'email', 'pincode', 'city', 'district', 'state',
+    'country', 'residentialAddress', 'workAddress', 'issueCategory', 'customIssueType', 'issueDescription',
+    'latitude', 'longitude', 'locationAddress', 'priority', 'status', 'submitted_at', 'image_filename',
+)
+
+def ingest_format_for(filename, mimetype=None):
+    """'csv' or 'jsonl' from a file name's extension or a content type; None if neither says."""
+    extension = os.path.splitext(filename or '')[1].lower()
+    return INGEST_FORMATS.get(extension) or INGEST_MIMETYPES.get(mimetype)
+
+def iter_ingest_rows(text_stream, ingest_format):
+    """Yields (row_number, row, error) for every record of a CSV or JSONL text stream.
+
+    CSV rows are numbered from 1 below the header, JSONL rows by line. `row` is a
+    dict, or None with `error` set when the record cannot be parsed. A decoding or
+    CSV syntax error ends the stream with a final error entry.
+    """
+    row_number = 0
+    try:
+        if ingest_format == 'csv':
+            for row_number, row in enumerate(csv.DictReader(text_stream), start=1):
+                if None in row:  # DictReader's bucket for fields beyond the header
+                    yield row_number, None, 'more fields than the header has columns'
+                else:
+                    yield row_number, row, None
+            return
+        for row_number, line in enumerate(text_stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as err:
+                yield row_number, None, f'invalid JSON: {err}'
+                continue
+            if isinstance(row, dict):
+                yield row_number, row, None
+            else:
+                yield row_number, None, 'each line must be a JSON object'
+    except (UnicodeDecodeError, csv.Error) as err:
+        yield row_number + 1, None, f'the file could not be read past this point: {err}'
+
+def validate_ingest_row(row, now):
+    """Checks and normalizes one imported row. Returns (values, errors); values is None if rejected."""
+    values, errors = {}, []
+    for column, limit in INGEST_TEXT_LIMITS.items():
+        value = row.get(column)
+        if value is not None and not isinstance(value, str):
+            value = str(value)  # numbers in JSONL, e.g. a mobile or pincode
+        value = value.strip() if value else None
+        if not value:
+            if column in INGEST_REQUIRED:
+                errors.append(f"'{column}' is required")
+            values[column] = None
+            continue
+        if limit and len(value) > limit:
+            errors.append(f"'{column}' is longer than {limit} characters")
+        elif not limit and len(value.encode('utf-8')) > 65535:
+            errors.append(f"'{column}' is longer than 64 KB")
+        values[column] = value
+    if values['email'] and '@' not in values['email']:
+        errors.append("'email' is not an email address")
+
+    for column, (kind, low, high) in INGEST_NUMBERS.items():
+        value = row.get(column)
+        values[column] = None
+        if value is None or value == '':
+            continue
+        try:
+            number = kind(value)
+        except (TypeError, ValueError):
+            errors.append(f"'{column}' must be a number")
+            continue
+        if not low <= number <= high:
+            errors.append(f"'{column}' must be between {low} and {high}")
+        values[column] = number
+
+    status = row.get('status')
+    values['status'] = str(status).strip() if status else 'Submitted'
+    if values['status'] not in USER_STATUS_COLUMNS:
+        errors.append(f"'status' must be one of: {', '.join(USER_STATUS_COLUMNS)}")
+
+    submitted_at = row.get('submitted_at')
+    values['submitted_at'] = now
+    if submitted_at:
+        for date_format in INGEST_DATETIME_FORMATS:
+            try:
+                values['submitted_at'] = datetime.strptime(str(submitted_at).strip(), date_format)
+                break
+            except ValueError:
+                continue
+        else:
+            errors.append("'submitted_at' must look like YYYY-MM-DD HH:MM:SS")
+        if values['submitted_at'] > now:
+            errors.append("'submitted_at' is in the future")
+
+    return (None, errors) if errors else (values, [])
+
+def write_issue_rows(cursor, rows, submitted_note, updated_by):
+    """Inserts issues and their initial status history with executemany and updates the derived tables.
+
+    `rows` are validated values, including issue_id and user_id. The caller commits.
+    """
+    history_rows = []
+    for values in rows:
+        history_rows.append((values['issue_id'], 'Submitted', submitted_note, updated_by, values['submitted_at']))
+        if values['status'] != 'Submitted':
+            history_rows.append((values['issue_id'], values['status'], f"Recorded with status {values['status']}.",
+                                 updated_by, values['submitted_at']))
+    cursor.executemany(
+        f"INSERT INTO issues ({', '.join(INGEST_ISSUE_COLUMNS)}) "
+        f"VALUES ({', '.join(['%s'] * len(INGEST_ISSUE_COLUMNS))})",
+        [tuple(values.get(column) for column in INGEST_ISSUE_COLUMNS) for values in rows]
+    )
+    cursor.executemany(
+        "INSERT INTO issue_status_history (issue_id_ref, status, notes, updated_by, created_at) "
+        "VALUES (%s, %s, %s, %s, %s)",
+        history_rows
+    )
+    record_issues_added(cursor, [values['issue_id'] for values in rows])
+
+def insert_issue_batch(conn, cursor, batch, imported_by, notify=True, attempts=3):
+    """Inserts validated rows and their status history in one transaction.
+
+    `batch` holds (row_number, values) pairs. Returns (inserted, failed) as lists of
+    (row_number, issue_id) and (row_number, message). A clash with an existing
+    issue_id is retried with fresh IDs; any other database error retries the rows
+    one at a time, so only the offending rows fail.
+    """
+    for attempt in range(attempts):
+        assigned = {}
+        for row_number, values in batch:
+            issue_id = generate_issue_id(values['submitted_at'])
+            while issue_id in assigned:
+                issue_id = generate_issue_id(values['submitted_at'])
+            assigned[issue_id] = (row_number, values)
+        try:
+            emails = sorted({values['email'].lower() for _, values in batch})
+            cursor.execute(f"SELECT id, email FROM users WHERE email IN ({', '.join(['%s'] * len(emails))})",
+                           tuple(emails))
+            user_ids = {email.lower(): user_id for user_id, email in cursor.fetchall()}
+
+            write_issue_rows(cursor, [
+                dict(values, issue_id=issue_id, user_id=user_ids.get(values['email'].lower()))
+                for issue_id, (_, values) in assigned.items()
+            ], f'Issue imported by {imported_by}.', imported_by)
+            conn.commit()
+        except mysql.connector.Error as err:
+            conn.rollback()
+            if err.errno == 1062 and attempt + 1 < attempts:  # an issue_id is taken; draw new ones
+                continue
+            if len(batch) == 1:
+                return [], [(batch[0][0], err.msg)]
+            print(f"Database error in issue import, retrying {len(batch)} rows one at a time: {err}")
+            inserted, failed = [], []
+            for entry in batch:
+                row_inserted, row_failed = insert_issue_batch(conn, cursor, [entry], imported_by, notify=False)
+                inserted += row_inserted
+                failed += row_failed
+            if notify and inserted:
+                invalidate_tables(*ISSUE_TABLES)
+                event_bus.publish('issue.imported', count=len(inserted), by=imported_by)
+            return inserted, failed
+        if notify:
+            invalidate_tables(*ISSUE_TABLES)
+            event_bus.publish('issue.imported', count=len(assigned), by=imported_by)
+        return [(row_number, issue_id) for issue_id, (row_number, _) in assigned.items()], []
+
+def ingest_issues(conn, records, imported_by, batch_size=INGEST_BATCH_SIZE):
+    """Validates and inserts the rows of iter_ingest_rows(). Returns the import report.
+
+    The report counts received, inserted, rejected (invalid) and failed (database
+    error) rows, lists the new issue ID of every inserted row and the errors of the
+    first INGEST_MAX_ERRORS rows that were not inserted.
+    """
+    report = {'received': 0, 'inserted': 0, 'rejected': 0, 'failed': 0, 'errors': [], 'issues': []}
+    now = datetime.now().replace(microsecond=0)
+    batch = []
+    cursor = conn.cursor()
+
+    def flush():
+        inserted, failed = insert_issue_batch(conn, cursor, batch, imported_by)
+        report['inserted'] += len(inserted)
+        report['issues'] += [{'row': row_number, 'issue_id': issue_id} for row_number, issue_id in inserted]
+        report['failed'] += len(failed)
+        for row_number, message in failed:
+            add_error(row_number, [message])
+        batch.clear()
+
+    def add_error(row_number, errors):
+        if len(report['errors']) < INGEST_MAX_ERRORS:
+            report['errors'].append({'row': row_number, 'errors': errors})
+
+    try:
+        for row_number, row, error in records:
+            report['received'] += 1
+            values, errors = (None, [error]) if error else validate_ingest_row(row, now)
+            if errors:
+                report['rejected'] += 1
+                add_error(row_number, errors)
+                continue
+            batch.append((row_number, values))
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    finally:
+        cursor.close()
+    report['issues'].sort(key=lambda entry: entry['row'])
+    report['errors'].sort(key=lambda entry: entry['row'])
+    return report
+
+@app.route('/admin/api/issues/import', methods=['POST'])
+def admin_import_issues():
+    """Imports issues from CSV or JSONL, sent as the `file` form field or as the request body."""
     if 'admin_id' not in session:
         return jsonify({'error': 'Admin not authenticated'}), 401
-    
+
+    upload = request.files.get('file')
+    if upload:
+        stream = upload.stream
+        ingest_format = request.args.get('format') or ingest_format_for(upload.filename, upload.mimetype)
+    else:
+        stream = io.BufferedReader(request.stream)
+        ingest_format = request.args.get('format') or ingest_format_for('', request.mimetype)
+    if ingest_format not in INGEST_FORMATS.values():
+        return jsonify({'error': "Send a .csv or .jsonl file, or pass ?format=csv or ?format=jsonl"}), 400
+
     conn = get_db_connection()
     if not conn:
-        return jsonify({'error': 'Database connection failed'}), 500
-    
-    cursor = conn.cursor(dictionary=True)
+        return jsonify({'error': 'Database connection failed.'}), 500
+
+    text_stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
     try:
-        cursor.execute("SELECT * FROM issues ORDER BY submitted_at DESC")
-        issues = cursor.fetchall()
-        
-        # Convert to CSV format
-        import csv
-        import io
-        from flask import make_response
-        
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=issues[0].keys() if issues else [])
-        writer.writeheader()
-        for issue in issues:
-            # Convert datetime objects to strings
-            row = {}
-            for key, value in issue.items():
-                if isinstance(value, datetime):
-                    row[key] = value.strftime('%Y-%m-%d %H:%M:%S')
-                else:
-                    row[key] = value
-            writer.writerow(row)
-        
-        response = make_response(output.getvalue())
-        response.headers['Content-Type'] = 'text/csv'
-        response.headers['Content-Disposition'] = f'attachment; filename=issues_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        return response
-        
+        report = ingest_issues(conn, iter_ingest_rows(text_stream, ingest_format),
+                               session.get('admin_username', 'Admin'))
+        report['status'] = 'success' if report['inserted'] == report['received'] else 'partial'
+        return jsonify(report)
     except mysql.connector.Error as err:
-        print(f"Database error on export: {err}")
+        print(f"Database error in issue import: {err}")
         return jsonify({'error': 'An internal server error occurred.'}), 500
+    finally:
+        text_stream.detach()
+        conn.close()
+
+issues_cli = AppGroup('issues', help='Bulk issue maintenance.')
+
+@issues_cli.command('import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'ingest_format', type=click.Choice(sorted(set(INGEST_FORMATS.values()))), default=None,
+              help='Default: from the file extension.')
+@click.option('--batch-size', type=int, default=INGEST_BATCH_SIZE, show_default=True)
+@click.option('--report', 'report_path', type=click.Path(dir_okay=False, writable=True), default=None,
+              help='Write the full JSON report (new issue IDs, row errors) to this file.')
+@click.option('--imported-by', default='Import', show_default=True)
+def import_issues_command(path, ingest_format, batch_size, report_path, imported_by):
+    """Import issues from a CSV or JSONL file."""
+    ingest_format = ingest_format or ingest_format_for(path)
+    if not ingest_format:
+        print("Cannot tell the format from the file name; pass --format csv or --format jsonl.")
+        return
+    conn = get_db_connection()
+    if not conn:
+        print("Could not connect to the database.")
+        return
+    try:
+        started = time.monotonic()
+        with open(path, encoding='utf-8-sig', newline='') as text_stream:
+            report = ingest_issues(conn, iter_ingest_rows(text_stream, ingest_format), imported_by, batch_size)
+        elapsed = time.monotonic() - started
+        print(f"Imported {report['inserted']} of {report['received']} rows in {elapsed:.2f}s "
+              f"({report['inserted'] / max(elapsed, 1e-9):.0f} rows/s); "
+              f"{report['rejected']} rejected, {report['failed']} failed.")
+        for entry in report['errors'][:20]:
+            print(f"  row {entry['row']}: {'; '.join(entry['errors'])}")
+        if report_path:
+            with open(report_path, 'w') as output:
+                json.dump(report, output, indent=2)
+            print(f"Report written to {report_path}.")
+    except mysql.connector.Error as err:
+        print(f"Error importing {path}: {err}")
+    finally:
+        conn.close()
+
+app.cli.add_command(issues_cli)
+
+# -----------------------------------------------------------------------------
+# Offline Device Sync
+# -----------------------------------------------------------------------------
+# Field volunteers queue reports on their phones while offline and upload the
+# whole queue in one request once they have a signal. Every queued report carries
+# a client-generated key. The (user, key) pair is written to issue_sync_keys in the
+# same transaction as the issue, so a retried upload is answered from that index
+# instead of creating the report a second time.
+
+SYNC_MAX_REPORTS = 100
+SYNC_KEY_PATTERN = re.compile(r'[A-Za-z0-9_.:-]{1,64}')
+
+@migration(9, 'Idempotency keys for offline report sync')
+def migration_0009_issue_sync_keys(cursor):
+    # No foreign key to issues: a key outlives its issue, so a late replay of a
+    # report an admin has since deleted does not bring it back.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS issue_sync_keys (
+            user_id INT NOT NULL,
+            client_key VARCHAR(64) NOT NULL,
+            issue_id VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (user_id, client_key),
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+    """)
+
+def read_sync_reports():
+    """The queued reports of a sync request. Raises ValueError for a malformed request.
+
+    Accepts a JSON body {"reports": [...]}, or a multipart form whose `reports` field
+    holds that list as JSON and whose file parts carry the images.
+    """
+    if request.is_json:
+        data = request.get_json(silent=True)
+        reports = data.get('reports') if isinstance(data, dict) else None
+    else:
+        try:
+            reports = json.loads(request.form.get('reports', ''))
+        except ValueError:
+            reports = None
+    if not isinstance(reports, list) or not reports:
+        raise ValueError("'reports' must be a non-empty list")
+    if len(reports) > SYNC_MAX_REPORTS:
+        raise ValueError(f"Send at most {SYNC_MAX_REPORTS} reports per sync")
+    return reports
+
+def sync_issue_reports(conn, user_id, email, reports, files, attempts=3):
+    """Creates a device's queued reports in one transaction. Returns one result per report.
+
+    A result holds the report's client_key and is 'created' or 'duplicate' (the key
+    was applied before, nothing is written) with the server issue_id, or 'rejected'
+    with the validation errors. A report may name a file part of `files` as its
+    `image`. Reports repeating a key within the batch get the first one's result. A key
+    applied before is answered from issue_sync_keys even if its report no longer
+    validates, e.g. a retry without the image part.
+    """
+    now = datetime.now().replace(microsecond=0)
+    keys, outcomes, valid, rejected = [], {}, {}, {}
+    for report in reports:
+        report = report if isinstance(report, dict) else {}
+        client_key = report.get('client_key')
+        keys.append(client_key)
+        if not isinstance(client_key, str) or not SYNC_KEY_PATTERN.fullmatch(client_key):
+            continue
+        if client_key in rejected or client_key in valid:
+            continue
+        # The status is the server's to set; submission time is when the report arrives
+        row = {column: value for column, value in report.items() if column not in ('status', 'submitted_at')}
+        values, errors = validate_ingest_row(dict(row, email=email), now)
+        upload = files.get(report['image']) if isinstance(report.get('image'), str) else None
+        if report.get('image') and not (upload and allowed_file(upload.filename)):
+            errors = errors + ["'image' must name an uploaded png, jpg, jpeg or gif file part"]
+        if errors:
+            rejected[client_key] = errors
+        else:
+            valid[client_key] = (values, upload)
+
+    cursor = conn.cursor()
+    saved = []
+    try:
+        for attempt in range(attempts):
+            created = {}
+            try:
+                applied = {}
+                # Every well-formed key is looked up, valid or not: a replay is answered
+                # from the index whatever it sends this time
+                well_formed = [*valid, *rejected]
+                if well_formed:
+                    cursor.execute(
+                        f"SELECT client_key, issue_id FROM issue_sync_keys "
+                        f"WHERE user_id = %s AND client_key IN ({', '.join(['%s'] * len(well_formed))})",
+                        (user_id, *well_formed)
+                    )
+                    applied = dict(cursor.fetchall())
+                rows = []
+                for client_key, (values, upload) in valid.items():
+                    if client_key in applied:
+                        continue
+                    issue_id = generate_issue_id()
+                    while issue_id in created.values():
+                        issue_id = generate_issue_id()
+                    created[client_key] = issue_id
+                    image_filename = None
+                    if upload:
+                        image_filename = f"{issue_id}_{secure_filename(upload.filename)}"
+                        path = os.path.join(app.config['UPLOAD_FOLDER'], image_filename)
+                        upload.stream.seek(0)
+                        upload.save(path)
+                        saved.append(path)
+                    rows.append(dict(values, issue_id=issue_id, user_id=user_id, image_filename=image_filename))
+                if rows:
+                    # The key rows go first: a concurrent upload of the same queue blocks on them
+                    # and then fails with a duplicate key, retries, and finds them applied.
+                    cursor.executemany(
+                        "INSERT INTO issue_sync_keys (user_id, client_key, issue_id) VALUES (%s, %s, %s)",
+                        [(user_id, client_key, issue_id) for client_key, issue_id in created.items()]
+                    )
+                    write_issue_rows(cursor, rows, 'Issue has been successfully submitted by the user.', 'System')
+                conn.commit()
+            except mysql.connector.Error as err:
+                conn.rollback()
+                for path in saved:
+                    if os.path.exists(path):
+                        os.remove(path)
+                saved = []
+                if err.errno == 1062 and attempt + 1 < attempts:
+                    continue
+                raise
+            break
     finally:
         cursor.close()
+
+    if rows:
+        invalidate_tables(*ISSUE_TABLES)
+        for values in rows:
+            event_bus.publish('issue.created', issue_id=values['issue_id'],
+                              category=values['customIssueType'] or values['issueCategory'],
+                              priority=values['priority'], city=values['city'])
+    for client_key, errors in rejected.items():
+        outcomes[client_key] = {'result': 'rejected', 'errors': errors}
+    for client_key, issue_id in applied.items():
+        outcomes[client_key] = {'result': 'duplicate', 'issue_id': issue_id}
+    for client_key, issue_id in created.items():
+        outcomes[client_key] = {'result': 'created', 'issue_id': issue_id}
+
+    results = []
+    for client_key in keys:
+        if client_key in outcomes:
+            results.append(dict(outcomes[client_key], client_key=client_key))
+        else:
+            results.append({'client_key': client_key, 'result': 'rejected',
+                            'errors': ["'client_key' must be 1-64 letters, digits or _.:-"]})
+    return results
+
+@app.route('/api/sync/reports', methods=['POST'])
+def sync_reports():
+    """Uploads a device's queue of offline reports; safe to retry until it gets an answer."""
+    if 'user_id' not in session:
+        return jsonify({'error': 'User not authenticated'}), 401
+    try:
+        reports = read_sync_reports()
+    except ValueError as err:
+        return jsonify({'error': str(err)}), 400
+
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'status': 'error', 'message': 'Database connection failed.'}), 500
+    try:
+        results = sync_issue_reports(conn, session['user_id'], session['user_email'], reports, request.files)
+        return jsonify({'status': 'success', 'results': results})
+    except mysql.connector.Error as err:
+        print(f"Database error on report sync: {err}")
+        return jsonify({'status': 'error', 'message': 'An internal error occurred.'}), 500
+    finally:
         conn.close()
 
+# Route to export issues data
+@app.route('/admin/api/issues/export')
+def admin_export_issues():
+    if 'admin_id' not in session:
+        return jsonify({'error': 'Admin not authenticated'}), 401
+    return export_response('issues')
+
 # Add these imports at the top of your app.py file
 import google.generativeai as genai
 import os
@@ -1977,25 +6682,15 @@ def log_chat_interaction(user_id, user_message, ai_response):
             
         cursor = conn.cursor()
         
-        # Create chat_logs table if it doesn't exist
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chat_logs (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT,
-                user_message TEXT,
-                ai_response TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL
-            )
-        """)
-        
-        # Insert the chat log
+        # Insert the chat log (the table is created by the schema migrations)
         cursor.execute("""
             INSERT INTO chat_logs (user_id, user_message, ai_response) 
             VALUES (%s, %s, %s)
         """, (user_id, user_message, ai_response))
         
         conn.commit()
+        invalidate_tables('chat_logs')
+        event_bus.publish('chat.logged', user_id=user_id)
         
     except Exception as e:
         print(f"Error logging chat interaction: {str(e)}")
@@ -2138,35 +6833,6 @@ def admin_api_chat_stats():
         cursor.close()
         conn.close()
 
-# Add this to your create_tables() function
-def create_chat_tables():
-    """Create chat-related tables"""
-    conn = get_db_connection()
-    if not conn:
-        print("Could not connect to the database. Chat table creation skipped.")
-        return
-
-    cursor = conn.cursor()
-    try:
-        # Chat logs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chat_logs (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT,
-                user_message TEXT,
-                ai_response TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL
-            )
-        """)
-        print("Chat logs table checked/created successfully.")
-        
-    except mysql.connector.Error as err:
-        print(f"Error during chat table creation: {err}")
-    finally:
-        cursor.close()
-        conn.close()
-
 @app.route('/api/user/profile', methods=['DELETE'])
 def delete_user_account():
     """Permanently deletes the currently authenticated user's account."""
@@ -2181,14 +6847,15 @@ def delete_user_account():
     
     cursor = conn.cursor()
     try:
-        # The `feedback` table has ON DELETE SET NULL for the user_id foreign key.
-        # Other records like issues are linked by email and will be orphaned, which is acceptable.
+        # The `feedback`, `chat_logs` and `issues` tables have ON DELETE SET NULL for their
+        # user_id foreign keys, so those records are kept but no longer linked to the account.
         cursor.execute("DELETE FROM users WHERE id = %s", (user_id_to_delete,))
         
         if cursor.rowcount == 0:
             return jsonify({'status': 'error', 'message': 'User not found.'}), 404
             
         conn.commit()
+        invalidate_tables('issues', 'user_issue_stats', 'feedback', 'chat_logs')
         
         # Clear the session to log the user out completely
         session.clear()
@@ -2217,43 +6884,50 @@ def analytics():
     return render_template('analytics.html', first_name=session.get('user_first_name'))
 
 @app.route('/api/analytics/overview')
+@conditional_get(lambda: [('table', table) for table in ISSUE_TABLES] if 'user_id' in session or 'admin_id' in session else None,
+                 period=3600)
 def api_analytics_overview():
     """Get overall analytics data"""
     if 'user_id' not in session and 'admin_id' not in session:
         return jsonify({'error': 'User not authenticated'}), 401
     
+    engine = ready_analytics_engine()
+    if engine:
+        return jsonify({'status': 'success', 'data': engine.overview()})
+    
     conn = get_db_connection()
     if not conn:
         return jsonify({'error': 'Database connection failed'}), 500
     
     cursor = conn.cursor(dictionary=True)
     try:
-        # Total issues
-        cursor.execute("SELECT COUNT(*) as total_issues FROM issues")
+        # Until the analytics engine has loaded, all figures come from the hourly rollup
+        cursor.execute("SELECT CAST(COALESCE(SUM(issue_count), 0) AS SIGNED) as total_issues FROM issue_rollup_hourly")
         total_issues = cursor.fetchone()['total_issues']
         
         # Issues by status
         cursor.execute("""
-            SELECT status, COUNT(*) as count 
-            FROM issues 
+            SELECT status, CAST(SUM(issue_count) AS SIGNED) as count 
+            FROM issue_rollup_hourly 
             GROUP BY status
+            HAVING count > 0
         """)
         status_data = cursor.fetchall()
         
         # Issues this month
         cursor.execute("""
-            SELECT COUNT(*) as monthly_issues 
-            FROM issues 
-            WHERE MONTH(submitted_at) = MONTH(CURRENT_DATE()) 
-            AND YEAR(submitted_at) = YEAR(CURRENT_DATE())
+            SELECT CAST(COALESCE(SUM(issue_count), 0) AS SIGNED) as monthly_issues 
+            FROM issue_rollup_hourly 
+            WHERE bucket_start >= DATE_FORMAT(CURRENT_DATE(), '%Y-%m-01')
         """)
         monthly_issues = cursor.fetchone()['monthly_issues']
         
         # Issues by category
         cursor.execute("""
-            SELECT issueCategory, COUNT(*) as count 
-            FROM issues 
-            GROUP BY issueCategory 
+            SELECT category as issueCategory, CAST(SUM(issue_count) AS SIGNED) as count 
+            FROM issue_rollup_hourly 
+            GROUP BY category 
+            HAVING count > 0
             ORDER BY count DESC 
             LIMIT 10
         """)
@@ -2261,18 +6935,20 @@ def api_analytics_overview():
         
         # Issues by priority
         cursor.execute("""
-            SELECT priority, COUNT(*) as count 
-            FROM issues 
+            SELECT priority, CAST(SUM(issue_count) AS SIGNED) as count 
+            FROM issue_rollup_hourly 
             GROUP BY priority
+            HAVING count > 0
         """)
         priority_data = cursor.fetchall()
         
         # Recent trends (last 30 days)
         cursor.execute("""
-            SELECT DATE(submitted_at) as date, COUNT(*) as count
-            FROM issues 
-            WHERE submitted_at >= DATE_SUB(CURRENT_DATE(), INTERVAL 30 DAY)
-            GROUP BY DATE(submitted_at)
+            SELECT DATE(bucket_start) as date, CAST(SUM(issue_count) AS SIGNED) as count
+            FROM issue_rollup_hourly 
+            WHERE bucket_start >= DATE_SUB(CURRENT_DATE(), INTERVAL 30 DAY)
+            GROUP BY DATE(bucket_start)
+            HAVING count > 0
             ORDER BY date ASC
         """)
         trend_data = cursor.fetchall()
@@ -2285,20 +6961,21 @@ def api_analytics_overview():
         # Response time analysis
         cursor.execute("""
             SELECT 
-                AVG(DATEDIFF(updated_at, submitted_at)) as avg_response_days,
-                MIN(DATEDIFF(updated_at, submitted_at)) as min_response_days,
-                MAX(DATEDIFF(updated_at, submitted_at)) as max_response_days
-            FROM issues 
-            WHERE status != 'Submitted' AND updated_at IS NOT NULL
+                SUM(response_days_sum) / NULLIF(SUM(issue_count), 0) as avg_response_days,
+                MIN(response_days_min) as min_response_days,
+                MAX(response_days_max) as max_response_days
+            FROM issue_rollup_hourly 
+            WHERE status != 'Submitted' AND issue_count > 0
         """)
         response_time = cursor.fetchone()
         
         # Top locations by issue count
         cursor.execute("""
-            SELECT city, COUNT(*) as count 
-            FROM issues 
-            WHERE city IS NOT NULL AND city != ''
+            SELECT city, CAST(SUM(issue_count) AS SIGNED) as count 
+            FROM issue_rollup_hourly 
+            WHERE city != ''
             GROUP BY city 
+            HAVING count > 0
             ORDER BY count DESC 
             LIMIT 10
         """)
@@ -2340,29 +7017,34 @@ def api_user_analytics():
     
     cursor = conn.cursor(dictionary=True)
     try:
-        user_email = session['user_email']
-        
-        # User's total submissions
-        cursor.execute("SELECT COUNT(*) as total_submissions FROM issues WHERE email = %s", (user_email,))
-        total_submissions = cursor.fetchone()['total_submissions']
-        
-        # User's submissions by status
-        cursor.execute("""
-            SELECT status, COUNT(*) as count 
-            FROM issues 
-            WHERE email = %s 
-            GROUP BY status
-        """, (user_email,))
-        user_status_data = cursor.fetchall()
+        user_id = session['user_id']
+        
+        # User's total submissions and submissions by status, from the summary row
+        stats = get_user_issue_stats(cursor, user_id)
+        total_submissions = stats['total_count']
+        user_status_data = [
+            {'status': status, 'count': stats[column]}
+            for status, column in USER_STATUS_COLUMNS.items() if stats[column]
+        ]
+        if sum(stats[column] for column in USER_STATUS_COLUMNS.values()) < total_submissions:
+            # The summary row only counts the standard statuses; admins may set any other
+            placeholders = ', '.join(['%s'] * len(USER_STATUS_COLUMNS))
+            cursor.execute(f"""
+                SELECT status, COUNT(*) as count
+                FROM issues
+                WHERE user_id = %s AND (status IS NULL OR status NOT IN ({placeholders}))
+                GROUP BY status
+            """, (user_id, *USER_STATUS_COLUMNS))
+            user_status_data += cursor.fetchall()
         
         # User's submissions by category
         cursor.execute("""
             SELECT issueCategory, COUNT(*) as count 
             FROM issues 
-            WHERE email = %s 
+            WHERE user_id = %s 
             GROUP BY issueCategory 
             ORDER BY count DESC
-        """, (user_email,))
+        """, (user_id,))
         user_category_data = cursor.fetchall()
         
         # User's submission trend (last 6 months)
@@ -2371,11 +7053,11 @@ def api_user_analytics():
                 DATE_FORMAT(submitted_at, '%Y-%m') as month,
                 COUNT(*) as count
             FROM issues 
-            WHERE email = %s 
+            WHERE user_id = %s 
             AND submitted_at >= DATE_SUB(CURRENT_DATE(), INTERVAL 6 MONTH)
             GROUP BY DATE_FORMAT(submitted_at, '%Y-%m')
             ORDER BY month ASC
-        """, (user_email,))
+        """, (user_id,))
         user_trend_data = cursor.fetchall()
         
         return jsonify({
@@ -2410,10 +7092,10 @@ def api_analytics_predictions():
         # Busiest day of week
         cursor.execute("""
             SELECT 
-                DAYNAME(submitted_at) as day_name,
-                COUNT(*) as count 
-            FROM issues 
-            GROUP BY DAYNAME(submitted_at), DAYOFWEEK(submitted_at)
+                DAYNAME(bucket_start) as day_name,
+                CAST(SUM(issue_count) AS SIGNED) as count 
+            FROM issue_rollup_hourly 
+            GROUP BY DAYNAME(bucket_start), DAYOFWEEK(bucket_start)
             ORDER BY count DESC 
             LIMIT 1
         """)
@@ -2422,10 +7104,10 @@ def api_analytics_predictions():
         # Peak hours
         cursor.execute("""
             SELECT 
-                HOUR(submitted_at) as hour,
-                COUNT(*) as count 
-            FROM issues 
-            GROUP BY HOUR(submitted_at)
+                HOUR(bucket_start) as hour,
+                CAST(SUM(issue_count) AS SIGNED) as count 
+            FROM issue_rollup_hourly 
+            GROUP BY HOUR(bucket_start)
             ORDER BY count DESC 
             LIMIT 3
         """)
@@ -2434,10 +7116,11 @@ def api_analytics_predictions():
         # Seasonal trends
         cursor.execute("""
             SELECT 
-                MONTH(submitted_at) as month,
-                COUNT(*) as count 
-            FROM issues 
-            GROUP BY MONTH(submitted_at)
+                MONTH(bucket_start) as month,
+                CAST(SUM(issue_count) AS SIGNED) as count 
+            FROM issue_rollup_hourly 
+            GROUP BY MONTH(bucket_start)
+            HAVING count > 0
             ORDER BY count DESC
         """)
         seasonal_data = cursor.fetchall()
@@ -2466,8 +7149,9 @@ def api_analytics_predictions():
         # Resolution rate insight
         cursor.execute("""
             SELECT 
-                (SELECT COUNT(*) FROM issues WHERE status IN ('Resolved', 'Completed')) * 100.0 / COUNT(*) as resolution_rate
-            FROM issues
+                SUM(CASE WHEN status IN ('Resolved', 'Completed') THEN issue_count ELSE 0 END) * 100.0
+                    / NULLIF(SUM(issue_count), 0) as resolution_rate
+            FROM issue_rollup_hourly
         """)
         resolution_rate = cursor.fetchone()['resolution_rate'] or 0
         
@@ -2499,10 +7183,6 @@ def api_analytics_predictions():
         cursor.close()
         conn.close()
 
-# Update your main create_tables() function to include chat tables
-# Add this line at the end of your existing create_tables() function:
-# create_chat_tables()
-
 # -----------------------------------------------------------------------------
 # Environment Variables Setup (Add this to the top of your file)
 # -----------------------------------------------------------------------------
@@ -2546,15 +7226,14 @@ def view_report_page(issue_id):
     cursor = conn.cursor(dictionary=True)
     try:
         # Fetch the issue regardless of who submitted it first
-        cursor.execute("SELECT * FROM issues WHERE id = %s", (issue_id,))
-        issue = cursor.fetchone()
+        issue = run_hot_query(conn, 'issue_by_pk', (issue_id,), one=True)
         
         if not issue:
             flash('Issue not found.', 'danger')
             return redirect(url_for('admin_issue_reports' if 'admin_id' in session else 'my_submissions'))
 
         # If a regular user is logged in, make sure they own the report
-        if 'user_id' in session and issue['email'] != session.get('user_email'):
+        if 'user_id' in session and issue['user_id'] != session['user_id']:
             flash('You do not have permission to view this report.', 'danger')
             return redirect(url_for('my_submissions'))
 
@@ -2588,7 +7267,8 @@ def view_report_page(issue_id):
             logo_base64=logo_data,
             maps_api_key=Maps_API_KEY,
             static_map_url=static_map_url,
-            qr_code_base64=qr_code_base64
+            qr_code_base64=qr_code_base64,
+            event_stream_url=EVENT_STREAM_URL
         )
 
     except Exception as e:
@@ -2604,6 +7284,7 @@ def view_report_page(issue_id):
 # In app.py, REPLACE the existing api_report_data function with this one
 
 @app.route('/api/report/data/<int:issue_id>')
+@conditional_get(lambda issue_id: [('issue', issue_id)] if 'user_id' in session or 'admin_id' in session else None)
 def api_report_data(issue_id):
     """API endpoint to get the latest data for a specific issue report."""
     # FIX: This now checks for EITHER a user OR an admin session
@@ -2617,18 +7298,16 @@ def api_report_data(issue_id):
     cursor = conn.cursor(dictionary=True)
     try:
         # The query now fetches the issue by its primary 'id'
-        cursor.execute("SELECT * FROM issues WHERE id = %s", (issue_id,))
-        issue = cursor.fetchone()
+        issue = run_hot_query(conn, 'issue_by_pk', (issue_id,), one=True)
 
         if not issue:
             return jsonify({'error': 'Issue not found or access denied'}), 404
         
         # If a regular user is logged in, double-check they own the report
-        if 'user_id' in session and issue['email'] != session.get('user_email'):
+        if 'user_id' in session and issue['user_id'] != session['user_id']:
              return jsonify({'error': 'Access denied'}), 403
 
-        cursor.execute("SELECT * FROM issue_status_history WHERE issue_id_ref = %s ORDER BY created_at ASC", (issue['issue_id'],))
-        status_history = cursor.fetchall()
+        status_history = run_hot_query(conn, 'issue_history', (issue['issue_id'],))
 
         # Format all dates into a readable string format for JSON
         for item in [issue] + status_history:
@@ -2751,8 +7430,9 @@ def admin_api_user_stats():
         cursor.execute("SELECT COUNT(*) as new_users FROM users WHERE created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)")
         new_users = cursor.fetchone()['new_users']
 
-        cursor.execute("SELECT COUNT(DISTINCT email) as users_with_submissions FROM issues")
-        users_with_submissions = cursor.fetchone()['users_with_submissions']
+        users_with_submissions = cached_query(
+            cursor, "SELECT COUNT(DISTINCT user_id) as users_with_submissions FROM issues", tables=('issues',), one=True
+        )['users_with_submissions']
         
         cursor.execute("SELECT COUNT(*) as active_users FROM users WHERE status = 'active'")
         active_users = cursor.fetchone()['active_users']
@@ -2826,10 +7506,11 @@ def admin_api_users():
                     COALESCE(i.issue_count, 0) as issue_count
                 FROM users u
                 LEFT JOIN (
-                    SELECT email, COUNT(*) as issue_count 
+                    SELECT user_id, COUNT(*) as issue_count 
                     FROM issues 
-                    GROUP BY email
-                ) i ON u.email = i.email
+                    WHERE user_id IS NOT NULL
+                    GROUP BY user_id
+                ) i ON u.id = i.user_id
                 ORDER BY u.created_at DESC
             """
             cursor.execute(sql)
@@ -2871,6 +7552,7 @@ def admin_api_manage_user(user_id):
             cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
             if cursor.rowcount == 0: return jsonify({'error': 'User not found'}), 404
             conn.commit()
+            invalidate_tables('issues', 'user_issue_stats', 'feedback', 'chat_logs')
             return jsonify({'status': 'success', 'message': 'User permanently deleted.'})
         except mysql.connector.Error as err:
             conn.rollback()
@@ -2992,6 +7674,79 @@ def admin_api_reset_password(user_id):
         cursor.close()
         conn.close()
 
+def rollup_comprehensive_analytics(cursor, days):
+    """Issue figures of the comprehensive analytics from issue_rollup_hourly (fallback for the analytics engine)."""
+    # --- Every windowed figure is a range scan over the hourly rollup ---
+    where_clause, params = rollup_window(days)
+    and_or_where = where_clause + ' AND' if where_clause else 'WHERE'
+
+    # 1. Overview Stats
+    cursor.execute(f"""
+        SELECT 
+            CAST(COALESCE(SUM(issue_count), 0) AS SIGNED) as total_issues,
+            CAST(COALESCE(SUM(CASE WHEN status = 'Resolved' THEN issue_count ELSE 0 END), 0) AS SIGNED) as resolved_count,
+            SUM(CASE WHEN status != 'Submitted' THEN response_days_sum ELSE 0 END)
+                / NULLIF(SUM(CASE WHEN status != 'Submitted' THEN issue_count ELSE 0 END), 0) as avg_response_days
+        FROM issue_rollup_hourly {where_clause}
+    """, params)
+    overview = cursor.fetchone()
+    total_issues = overview['total_issues']
+    resolved_count = overview['resolved_count']
+    resolution_rate = (resolved_count / total_issues * 100) if total_issues > 0 else 0
+    avg_response_days = float(overview['avg_response_days']) if overview['avg_response_days'] is not None else 0.0
+
+    # 2. Distributions
+    cursor.execute(f"SELECT status, CAST(SUM(issue_count) AS SIGNED) as count FROM issue_rollup_hourly {where_clause} GROUP BY status HAVING count > 0", params)
+    status_distribution = cursor.fetchall()
+
+    cursor.execute(f"SELECT priority, CAST(SUM(issue_count) AS SIGNED) as count FROM issue_rollup_hourly {where_clause} GROUP BY priority HAVING count > 0", params)
+    priority_distribution = cursor.fetchall()
+    
+    category_query = f"""
+        SELECT 
+            category as issueCategory, 
+            CAST(SUM(issue_count) AS SIGNED) as count 
+        FROM issue_rollup_hourly {where_clause} 
+        GROUP BY category
+        HAVING count > 0
+        ORDER BY count DESC LIMIT 10
+    """
+    cursor.execute(category_query, params)
+    category_distribution = cursor.fetchall()
+
+    cursor.execute(f"SELECT city, CAST(SUM(issue_count) AS SIGNED) as count FROM issue_rollup_hourly {and_or_where} city != '' GROUP BY city HAVING count > 0 ORDER BY count DESC LIMIT 10", params)
+    location_data = cursor.fetchall()
+
+    # 3. Trend Data
+    trend_query = f"""
+        SELECT DATE(bucket_start) as date, CAST(SUM(issue_count) AS SIGNED) as count 
+        FROM issue_rollup_hourly {where_clause} 
+        GROUP BY DATE(bucket_start) 
+        HAVING count > 0
+        ORDER BY date ASC
+    """
+    cursor.execute(trend_query, params)
+    trend_data = cursor.fetchall()
+    for item in trend_data:
+        if isinstance(item.get('date'), datetime):
+            item['date'] = item['date'].strftime('%Y-%m-%d')
+
+    user_stats = cached_query(cursor, "SELECT COUNT(DISTINCT user_id) as users_with_submissions FROM issues", tables=('issues',), one=True)
+
+    return {
+        'overview': {
+            'total_issues': total_issues,
+            'resolution_rate': resolution_rate,
+            'avg_response_days': avg_response_days
+        },
+        'status_distribution': status_distribution,
+        'priority_distribution': priority_distribution,
+        'category_distribution': category_distribution,
+        'location_data': location_data,
+        'trend_data': trend_data,
+        'user_stats': user_stats
+    }
+
 # Add this new, consolidated API endpoint to your app.py file
 
 # Add this consolidated API endpoint to your app.py file.
@@ -3016,103 +7771,44 @@ def admin_api_comprehensive_analytics():
     except (ValueError, TypeError):
         days = 30 # Fallback to 30 days on error
 
-    conn = get_db_connection()
-    if not conn:
-        return jsonify({'status': 'error', 'message': 'Database connection failed'}), 500
-    
-    cursor = conn.cursor(dictionary=True)
     try:
-        # --- Build the WHERE clause for date filtering ---
-        where_clause = ""
-        params = []
-        if days is not None:
-            where_clause = "WHERE submitted_at >= DATE_SUB(NOW(), INTERVAL %s DAY)"
-            params.append(days)
-
-        # --- Fetch all data in one go ---
-        
-        # 1. Overview Stats
-        cursor.execute(f"SELECT COUNT(*) as total_issues FROM issues {where_clause}", tuple(params))
-        total_issues = cursor.fetchone()['total_issues']
-        
-        resolved_query = f"SELECT COUNT(*) as resolved_count FROM issues {where_clause + ' AND' if where_clause else 'WHERE'} status = 'Resolved'"
-        cursor.execute(resolved_query, tuple(params))
-        resolved_count = cursor.fetchone()['resolved_count']
-        resolution_rate = (resolved_count / total_issues * 100) if total_issues > 0 else 0
-
-        cursor.execute(f"SELECT AVG(DATEDIFF(updated_at, submitted_at)) as avg_response_days FROM issues {where_clause + ' AND' if where_clause else 'WHERE'} status != 'Submitted'", tuple(params))
-        avg_response_days_result = cursor.fetchone()
-        avg_response_days = float(avg_response_days_result['avg_response_days']) if avg_response_days_result and avg_response_days_result['avg_response_days'] is not None else 0.0
-
-        # 2. Distributions
-        cursor.execute(f"SELECT status, COUNT(*) as count FROM issues {where_clause} GROUP BY status", tuple(params))
-        status_distribution = cursor.fetchall()
-
-        cursor.execute(f"SELECT priority, COUNT(*) as count FROM issues {where_clause} GROUP BY priority", tuple(params))
-        priority_distribution = cursor.fetchall()
-        
-        category_query = f"""
-            SELECT 
-                CASE WHEN customIssueType IS NOT NULL AND customIssueType != '' THEN customIssueType ELSE issueCategory END as issueCategory, 
-                COUNT(*) as count 
-            FROM issues {where_clause} 
-            GROUP BY 1
-            ORDER BY count DESC LIMIT 10
-        """
-        cursor.execute(category_query, tuple(params))
-        category_distribution = cursor.fetchall()
+        # Dashboards polling with the same range share one computation
+        data = single_flight.do(('comprehensive-analytics', days), lambda: comprehensive_analytics_data(days))
+    except mysql.connector.Error as err:
+        print(f"Database error on comprehensive analytics: {err}")
+        return jsonify({'status': 'error', 'message': 'An internal server error occurred.'}), 500
+    if data is None:
+        return jsonify({'status': 'error', 'message': 'Database connection failed'}), 500
 
-        cursor.execute(f"SELECT city, COUNT(*) as count FROM issues {where_clause + ' AND' if where_clause else 'WHERE'} city IS NOT NULL AND city != '' GROUP BY city ORDER BY count DESC LIMIT 10", tuple(params))
-        location_data = cursor.fetchall()
+    response_data = {
+        'status': 'success',
+        'data': data
+    }
+    return jsonify(response_data)
 
-        # 3. Trend Data
-        trend_query = f"""
-            SELECT DATE(submitted_at) as date, COUNT(*) as count 
-            FROM issues {where_clause} 
-            GROUP BY DATE(submitted_at) 
-            ORDER BY date ASC
-        """
-        cursor.execute(trend_query, tuple(params))
-        trend_data = cursor.fetchall()
-        for item in trend_data:
-            if isinstance(item.get('date'), datetime):
-                item['date'] = item['date'].strftime('%Y-%m-%d')
+def comprehensive_analytics_data(days):
+    """The admin analytics dataset for the last `days` days (all time for None), or None without a database."""
+    engine = ready_analytics_engine()
+    conn = get_db_connection()
+    if not conn:
+        return None
 
-        # 4. Other Stats (not time-bound)
-        cursor.execute("SELECT COUNT(DISTINCT email) as users_with_submissions FROM issues")
-        user_stats = cursor.fetchone()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        if engine:
+            data = engine.comprehensive(days)
+        else:
+            data = rollup_comprehensive_analytics(cursor, days)
 
-        cursor.execute("SELECT COUNT(*) as total_chats FROM chat_logs")
-        chat_stats = cursor.fetchone()
+        # Other Stats (not time-bound)
+        chat_stats = cached_query(cursor, "SELECT COUNT(*) as total_chats FROM chat_logs", tables=('chat_logs',), one=True)
 
-        cursor.execute("SELECT AVG(rating) as avg_rating FROM feedback")
-        feedback_stats_result = cursor.fetchone()
+        feedback_stats_result = cached_query(cursor, "SELECT AVG(rating) as avg_rating FROM feedback", tables=('feedback',), one=True)
         feedback_stats = {'avg_rating': float(feedback_stats_result['avg_rating']) if feedback_stats_result and feedback_stats_result['avg_rating'] is not None else 0.0}
 
-        # --- Assemble the final response ---
-        response_data = {
-            'status': 'success',
-            'data': {
-                'overview': {
-                    'total_issues': total_issues,
-                    'resolution_rate': resolution_rate,
-                    'avg_response_days': avg_response_days
-                },
-                'status_distribution': status_distribution,
-                'priority_distribution': priority_distribution,
-                'category_distribution': category_distribution,
-                'location_data': location_data,
-                'trend_data': trend_data,
-                'user_stats': user_stats,
-                'chat_stats': chat_stats,
-                'feedback_stats': feedback_stats
-            }
-        }
-        return jsonify(response_data)
-
-    except mysql.connector.Error as err:
-        print(f"Database error on comprehensive analytics: {err}")
-        return jsonify({'status': 'error', 'message': 'An internal server error occurred.'}), 500
+        data['chat_stats'] = chat_stats
+        data['feedback_stats'] = feedback_stats
+        return data
     finally:
         cursor.close()
         conn.close()
@@ -3129,23 +7825,28 @@ def admin_api_user_engagement():
     if not conn: return jsonify({'status': 'error', 'message': 'Database connection failed'}), 500
     cursor = conn.cursor(dictionary=True)
     try:
-        # CORRECTED QUERY (V3): This version is fully compliant with 'only_full_group_by'
-        # by grouping by all non-aggregated columns from the 'users' table.
+        # Issues are aggregated per user_id first and joined on the integer key,
+        # so the users table is never joined against every issue row.
         query = """
             SELECT 
                 u.email,
                 CONCAT(u.first_name, ' ', u.last_name) as fullName,
-                COUNT(i.id) as total_issues,
-                SUM(CASE WHEN i.status = 'Resolved' THEN 1 ELSE 0 END) as resolved_issues,
-                MAX(i.submitted_at) as last_activity,
+                COALESCE(i.total_issues, 0) as total_issues,
+                COALESCE(i.resolved_issues, 0) as resolved_issues,
+                i.last_activity,
                 COALESCE(cl.chat_sessions, 0) as chat_sessions
             FROM users u
-            LEFT JOIN issues i ON u.email = i.email
+            LEFT JOIN (
+                SELECT user_id,
+                       COUNT(*) as total_issues,
+                       SUM(CASE WHEN status = 'Resolved' THEN 1 ELSE 0 END) as resolved_issues,
+                       MAX(submitted_at) as last_activity
+                FROM issues WHERE user_id IS NOT NULL GROUP BY user_id
+            ) i ON u.id = i.user_id
             LEFT JOIN (
                 SELECT user_id, COUNT(DISTINCT DATE(created_at)) as chat_sessions 
                 FROM chat_logs GROUP BY user_id
             ) cl ON u.id = cl.user_id
-            GROUP BY u.id, u.email, u.first_name, u.last_name, cl.chat_sessions
             ORDER BY total_issues DESC;
         """
         cursor.execute(query)
@@ -3173,7 +7874,7 @@ def admin_api_resolution_analysis():
         query = """
             SELECT 
                 issue_id,
-                CASE WHEN customIssueType IS NOT NULL AND customIssueType != '' THEN customIssueType ELSE issueCategory END as category,
+                effective_category as category,
                 priority,
                 status,
                 submitted_at,
@@ -3272,14 +7973,14 @@ def admin_api_category_analysis():
     try:
         query = """
             SELECT 
-                CASE WHEN customIssueType IS NOT NULL AND customIssueType != '' THEN customIssueType ELSE issueCategory END as category,
+                effective_category as category,
                 COUNT(*) as total_issues,
                 SUM(CASE WHEN status = 'Resolved' THEN 1 ELSE 0 END) as resolved,
                 SUM(CASE WHEN status = 'In Progress' THEN 1 ELSE 0 END) as in_progress,
                 SUM(CASE WHEN status = 'Submitted' THEN 1 ELSE 0 END) as pending,
                 AVG(DATEDIFF(updated_at, submitted_at)) as avg_response_time
             FROM issues
-            GROUP BY category
+            GROUP BY effective_category
             ORDER BY total_issues DESC;
         """
         cursor.execute(query)
@@ -3295,16 +7996,19 @@ def admin_api_category_analysis():
 @app.route('/admin/api/detailed-analytics/activity-patterns')
 def admin_api_activity_patterns():
     if 'admin_id' not in session: return jsonify({'status': 'error', 'message': 'Unauthorized'}), 401
+    engine = ready_analytics_engine()
+    if engine:
+        return jsonify({'status': 'success', **engine.activity_patterns()})
     conn = get_db_connection()
     if not conn: return jsonify({'status': 'error', 'message': 'Database connection failed'}), 500
     cursor = conn.cursor(dictionary=True)
     try:
         # Hourly Pattern
-        cursor.execute("SELECT HOUR(submitted_at) as hour, COUNT(*) as count FROM issues GROUP BY hour ORDER BY hour ASC;")
+        cursor.execute("SELECT HOUR(bucket_start) as hour, CAST(SUM(issue_count) AS SIGNED) as count FROM issue_rollup_hourly GROUP BY hour HAVING count > 0 ORDER BY hour ASC;")
         hourly_data = cursor.fetchall()
 
         # Weekly Pattern
-        cursor.execute("SELECT DAYNAME(submitted_at) as day, DAYOFWEEK(submitted_at) as day_num, COUNT(*) as count FROM issues GROUP BY day, day_num ORDER BY day_num ASC;")
+        cursor.execute("SELECT DAYNAME(bucket_start) as day, DAYOFWEEK(bucket_start) as day_num, CAST(SUM(issue_count) AS SIGNED) as count FROM issue_rollup_hourly GROUP BY day, day_num HAVING count > 0 ORDER BY day_num ASC;")
         weekly_data = cursor.fetchall()
         
         return jsonify({
@@ -3492,6 +8196,59 @@ def admin_download_logs():
         flash('An error occurred while trying to download the log file.', 'danger')
         return redirect(url_for('admin_profile'))
 
+# API to monitor the database connection pool
+@app.route('/admin/api/db-pool-stats')
+def admin_api_db_pool_stats():
+    if 'admin_id' not in session:
+        return jsonify({'status': 'error', 'message': 'Unauthorized'}), 401
+    stats = db_pool.stats()
+    stats['export_pool'] = export_pool.stats()
+    if request.args.get('health') == '1':
+        stats['healthy'] = db_pool.health_check()
+    return jsonify({'status': 'success', 'stats': stats})
+
+@app.route('/admin/api/report-queue-stats')
+def admin_api_report_queue_stats():
+    if 'admin_id' not in session:
+        return jsonify({'status': 'error', 'message': 'Unauthorized'}), 401
+    if not ASYNC_REPORTS and not os.path.exists(REPORT_QUEUE_PATH):
+        return jsonify({'status': 'success', 'stats': {'enabled': False}})
+    try:
+        stats = report_queue.stats()
+    except sqlite3.Error as err:
+        print(f"Report queue unavailable: {err}")
+        return jsonify({'status': 'error', 'message': 'Report queue unavailable'}), 500
+    stats['enabled'] = ASYNC_REPORTS
+    return jsonify({'status': 'success', 'stats': stats})
+
+@app.route('/admin/api/query-cache-stats')
+def admin_api_query_cache_stats():
+    if 'admin_id' not in session:
+        return jsonify({'status': 'error', 'message': 'Unauthorized'}), 401
+    if request.args.get('clear') == '1':
+        query_cache.clear()
+    return jsonify({'status': 'success', 'stats': query_cache.stats(), 'single_flight': single_flight.stats(),
+                    'idempotency': idempotency.stats()})
+
+@app.route('/admin/api/live-feed')
+def admin_api_live_feed():
+    """Recent application events from the event bus, straight from memory.
+
+    `since` (the `latest_id` of the previous call) returns only newer events, `kinds`
+    (comma separated, e.g. issue.created,issue.status) filters them. `truncated` means
+    events were missed, so the client should reload what it shows.
+    """
+    if 'admin_id' not in session:
+        return jsonify({'status': 'error', 'message': 'Unauthorized'}), 401
+    try:
+        since = int(request.args['since']) if request.args.get('since') else None
+        limit = max(1, min(int(request.args.get('limit', 100)), EVENT_BUS_BUFFER))
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'since and limit must be integers'}), 400
+    kinds = [kind.strip() for kind in request.args.get('kinds', '').split(',') if kind.strip()]
+    events, latest_id, truncated = event_bus.since(since, kinds, limit)
+    return jsonify({'status': 'success', 'events': events, 'latest_id': latest_id, 'truncated': truncated})
+
 # =============================================================================
 # API FOR HELP & SUPPORT PAGE
 # =============================================================================
@@ -3546,8 +8303,7 @@ def admin_api_announcements():
     cursor = conn.cursor(dictionary=True)
     try:
         if request.method == 'GET':
-            cursor.execute("SELECT * FROM announcements ORDER BY created_at DESC")
-            announcements = cursor.fetchall()
+            announcements = cached_query(cursor, "SELECT * FROM announcements ORDER BY created_at DESC", tables=('announcements',))
             
             # --- START: FIX ---
             # Correctly handle timezone conversion
@@ -3572,6 +8328,7 @@ def admin_api_announcements():
             
             cursor.execute("INSERT INTO announcements (title, content) VALUES (%s, %s)", (title, content))
             conn.commit()
+            invalidate_tables('announcements')
             return jsonify({'status': 'success', 'message': 'Announcement posted successfully!'}), 201
             
     except Exception as e:
@@ -3596,6 +8353,7 @@ def admin_api_delete_announcement(announcement_id):
     try:
         cursor.execute("DELETE FROM announcements WHERE id = %s", (announcement_id,))
         conn.commit()
+        invalidate_tables('announcements')
         if cursor.rowcount == 0:
             return jsonify({'status': 'error', 'message': 'Announcement not found.'}), 404
         return jsonify({'status': 'success', 'message': 'Announcement deleted successfully.'})
@@ -3625,8 +8383,9 @@ def api_get_announcements():
     cursor = conn.cursor(dictionary=True)
     try:
         # Fetch the 5 most recent announcements
-        cursor.execute("SELECT title, content, created_at FROM announcements ORDER BY created_at DESC LIMIT 5")
-        announcements = cursor.fetchall()
+        announcements = cached_query(
+            cursor, "SELECT title, content, created_at FROM announcements ORDER BY created_at DESC LIMIT 5", tables=('announcements',)
+        )
         
         # --- START: FIX ---
         # Add the same timezone conversion logic from the admin route
@@ -3673,6 +8432,7 @@ def admin_api_update_announcement(announcement_id):
             (title, content, announcement_id)
         )
         conn.commit()
+        invalidate_tables('announcements')
 
         if cursor.rowcount == 0:
             return jsonify({'status': 'error', 'message': 'Announcement not found.'}), 404
@@ -3737,7 +8497,6 @@ def delete_profile_photo():
 if __name__ == '__main__':
     if not os.path.exists(UPLOAD_FOLDER):
         os.makedirs(UPLOAD_FOLDER)
-    create_tables()
-    create_chat_tables() # Ensure chat tables are created on startup
+    check_schema_version() # Applies pending schema migrations on first run
     app.run(debug=True)
 
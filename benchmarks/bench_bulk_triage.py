@@ -0,0 +1,94 @@
+"""Bulk triage: one request per issue vs. the chunked bulk status and delete endpoints.
+
+Seeds a scratch schema on first run, then moves N 'Resolved' issues to 'Completed'
+and deletes N more, once through the per-issue admin endpoints and once through
+/admin/api/issues/bulk-status and /admin/api/issues/bulk-delete (disjoint issue sets):
+
+    python benchmarks/bench_bulk_triage.py --database civicsense_bench --count 2000
+"""
+import argparse
+import time
+
+from seed import civicsense, seed, timed, use_database
+
+
+def admin_client():
+    client = civicsense.app.test_client()
+    with client.session_transaction() as session:
+        session['admin_id'] = 1
+        session['admin_username'] = 'bench'
+    return client
+
+
+def resolved_issue_ids(count):
+    conn = civicsense.get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT issue_id FROM issues WHERE status = 'Resolved' ORDER BY id LIMIT %s", (count,))
+    issue_ids = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    conn.close()
+    return issue_ids
+
+
+def run(label, action):
+    started = time.perf_counter()
+    requests = action()
+    seconds = time.perf_counter() - started
+    print(f"{label:<34}{requests:>10}{seconds:>10.2f}")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', default='civicsense_bench')
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--issues', type=int, default=200_000)
+    parser.add_argument('--count', type=int, default=2000, help='issues per scenario')
+    args = parser.parse_args()
+
+    use_database(args.database)
+    civicsense.migrate_up()
+
+    conn = civicsense.get_db_connection()
+    cursor = conn.cursor(buffered=True)
+    cursor.execute("SELECT COUNT(*) FROM issues WHERE status = 'Resolved'")
+    if cursor.fetchone()[0] < 4 * args.count:
+        with timed(f"Seeding {args.issues} issues"):
+            seed(conn, users=args.users, issues=args.issues)
+    cursor.close()
+    conn.close()
+
+    client = admin_client()
+    issue_ids = resolved_issue_ids(4 * args.count)
+    loop_update, bulk_update, loop_delete, bulk_delete = (
+        issue_ids[n * args.count:(n + 1) * args.count] for n in range(4)
+    )
+
+    def per_issue_status():
+        for issue_id in loop_update:
+            client.put(f'/admin/api/issues/{issue_id}/status', json={'status': 'Completed'})
+        return len(loop_update)
+
+    def per_issue_delete():
+        for issue_id in loop_delete:
+            client.delete(f'/admin/api/issues/{issue_id}')
+        return len(loop_delete)
+
+    def bulk(path, issue_ids, **extra):
+        def action():
+            response = client.post(path, json={'issue_ids': issue_ids, **extra}).get_json()
+            print(f"  summary: {response['summary']}")
+            return 1
+        return action
+
+    print(f"\n{'scenario':<34}{'requests':>10}{'seconds':>10}")
+    loop_seconds = run('status, one request per issue', per_issue_status)
+    bulk_seconds = run('status, bulk-status', bulk('/admin/api/issues/bulk-status', bulk_update, status='Completed'))
+    print(f"{'speedup':<34}{'':>10}{loop_seconds / bulk_seconds:>9.1f}x\n")
+    loop_seconds = run('delete, one request per issue', per_issue_delete)
+    bulk_seconds = run('delete, bulk-delete', bulk('/admin/api/issues/bulk-delete', bulk_delete))
+    print(f"{'speedup':<34}{'':>10}{loop_seconds / bulk_seconds:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
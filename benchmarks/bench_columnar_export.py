@@ -0,0 +1,65 @@
+"""Export size and time: streamed CSV (plain and gzip) vs. Parquet and Arrow IPC.
+
+Seeds a scratch schema (1M issues by default) on first run, then drives each
+export generator of the app over every table and reports bytes, seconds and the
+pyarrow memory high-water mark:
+
+    python benchmarks/bench_columnar_export.py --database civicsense_bench --issues 1000000
+"""
+import argparse
+import time
+
+from seed import civicsense, seed, timed, use_database
+
+TABLES = ['issues', 'issue_status_history', 'feedbacks', 'chat_logs']
+
+
+def run_export(export_name, export_format):
+    spec = civicsense.EXPORT_SPECS[export_name]
+    columns = list(spec['columns'])
+    sql, params = civicsense.export_query(spec, columns)
+    conn = civicsense.get_dedicated_db_connection()
+    if export_format in ('csv', 'csv.gz'):
+        stream = civicsense.stream_csv_export(conn, sql, params, columns, compress=export_format == 'csv.gz')
+    else:
+        schema = civicsense.export_arrow_schema(spec, columns)
+        stream = civicsense.stream_columnar_export(conn, sql, params, schema, export_format)
+    started = time.perf_counter()
+    size = sum(len(chunk) for chunk in stream)
+    return size, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', default='civicsense_bench')
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--issues', type=int, default=1_000_000)
+    parser.add_argument('--formats', default='csv,csv.gz,parquet,arrow')
+    args = parser.parse_args()
+    formats = args.formats.split(',')
+
+    use_database(args.database)
+    civicsense.migrate_up()
+
+    conn = civicsense.get_db_connection()
+    cursor = conn.cursor(buffered=True)
+    cursor.execute("SELECT COUNT(*) FROM issues")
+    if cursor.fetchone()[0] < args.issues:
+        with timed(f"Seeding {args.issues} issues"):
+            seed(conn, users=args.users, issues=args.issues)
+    cursor.close()
+    conn.close()
+
+    print(f"\n{'table':<22}{'format':<9}{'MB':>10}{'seconds':>10}{'vs csv size':>13}{'vs csv time':>13}")
+    for export_name in TABLES:
+        baseline = None
+        for export_format in formats:
+            size, seconds = run_export(export_name, export_format)
+            baseline = baseline or (size, seconds)
+            print(f"{export_name:<22}{export_format:<9}{size / 1e6:>10.1f}{seconds:>10.2f}"
+                  f"{size / baseline[0] if baseline[0] else 0:>12.2f}x{seconds / baseline[1] if baseline[1] else 0:>12.2f}x")
+    print(f"\npyarrow peak allocation: {civicsense.pa.default_memory_pool().max_memory() / 1e6:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""EXPLAIN plans and latency of the hot queries before and after the secondary index plan.
+
+Seeds a scratch schema (1M issues by default) on first run, drops the indexes from
+app.SECONDARY_INDEXES, measures, re-creates them and measures again:
+
+    python benchmarks/bench_indexes.py --database civicsense_bench --issues 1000000
+"""
+import argparse
+import statistics
+import time
+
+from seed import civicsense, seed, timed, use_database
+
+QUERIES = {
+    'my_submissions': (
+        "SELECT id, issue_id, issueCategory, customIssueType, locationAddress, priority, status, submitted_at "
+        "FROM issues WHERE email = %s ORDER BY submitted_at DESC", 'email'),
+    'dashboard_recent_page': (
+        "SELECT issue_id, status, submitted_at FROM issues WHERE email = %s "
+        "ORDER BY submitted_at DESC LIMIT 10 OFFSET 0", 'email'),
+    'dashboard_week_count': (
+        "SELECT COUNT(*) FROM issues WHERE email = %s AND submitted_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)", 'email'),
+    'admin_status_30d': (
+        "SELECT status, COUNT(*) FROM issues WHERE submitted_at >= DATE_SUB(NOW(), INTERVAL 30 DAY) GROUP BY status", None),
+    'admin_resolved_30d': (
+        "SELECT COUNT(*) FROM issues WHERE status = 'Resolved' AND submitted_at >= DATE_SUB(NOW(), INTERVAL 30 DAY)", None),
+    'admin_city_30d': (
+        "SELECT city, COUNT(*) AS count FROM issues WHERE submitted_at >= DATE_SUB(NOW(), INTERVAL 30 DAY) "
+        "AND city IS NOT NULL AND city != '' GROUP BY city ORDER BY count DESC LIMIT 10", None),
+    'admin_trend_30d': (
+        "SELECT DATE(submitted_at), COUNT(*) FROM issues WHERE submitted_at >= DATE_SUB(NOW(), INTERVAL 30 DAY) "
+        "GROUP BY DATE(submitted_at)", None),
+    'admin_issue_list': (
+        "SELECT id, issue_id, status, submitted_at FROM issues ORDER BY submitted_at DESC LIMIT 50", None),
+    'issue_history': (
+        "SELECT * FROM issue_status_history WHERE issue_id_ref = %s ORDER BY created_at ASC", 'issue_id'),
+    'chat_stats_7d': (
+        "SELECT DATE(created_at), COUNT(*) FROM chat_logs WHERE created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY) "
+        "GROUP BY DATE(created_at)", None),
+    'feedback_7d': (
+        "SELECT COUNT(*) FROM feedback WHERE submitted_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)", None),
+}
+
+
+def measure(cursor, params, repeats):
+    results = {}
+    for name, (sql, param) in QUERIES.items():
+        args = (params[param],) if param else ()
+        cursor.execute("EXPLAIN " + sql, args)
+        plan = [dict(zip(cursor.column_names, row)) for row in cursor.fetchall()]
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            cursor.execute(sql, args)
+            cursor.fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+        results[name] = (plan, statistics.median(timings))
+    return results
+
+
+def drop_indexes(cursor):
+    for table, index_name, _ in civicsense.SECONDARY_INDEXES:
+        if civicsense.index_exists(cursor, table, index_name):
+            try:
+                cursor.execute(f"ALTER TABLE {table} DROP INDEX {index_name}")
+            except civicsense.mysql.connector.Error as err:
+                # e.g. 1553: the index now backs a foreign key constraint
+                print(f"Kept {index_name}: {err.msg}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', default='civicsense_bench')
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--issues', type=int, default=1_000_000)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    use_database(args.database)
+    civicsense.migrate_up()
+
+    conn = civicsense.get_db_connection()
+    cursor = conn.cursor(buffered=True)
+    # No open snapshot may hold a metadata lock while the indexes are altered
+    cursor.execute("SET autocommit = 1")
+    cursor.execute("SELECT COUNT(*) FROM issues")
+    if cursor.fetchone()[0] < args.issues:
+        with timed(f"Seeding {args.issues} issues"):
+            seed(conn, users=args.users, issues=args.issues)
+
+    cursor.execute("SELECT email, COUNT(*) AS n FROM issues GROUP BY email ORDER BY n DESC LIMIT 1")
+    email = cursor.fetchone()[0]
+    cursor.execute("SELECT issue_id FROM issues ORDER BY id DESC LIMIT 1")
+    params = {'email': email, 'issue_id': cursor.fetchone()[0]}
+
+    drop_indexes(cursor)
+    cursor.execute("ANALYZE TABLE issues, issue_status_history, chat_logs, feedback")
+    cursor.fetchall()
+    before = measure(cursor, params, args.repeats)
+
+    with timed("create_secondary_indexes()"):
+        civicsense.create_secondary_indexes(cursor)
+    cursor.execute("ANALYZE TABLE issues, issue_status_history, chat_logs, feedback")
+    cursor.fetchall()
+    after = measure(cursor, params, args.repeats)
+
+    print(f"\n{'query':<24}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name in QUERIES:
+        b, a = before[name][1], after[name][1]
+        print(f"{name:<24}{b:>12.2f}{a:>12.2f}{b / a if a else 0:>9.1f}x")
+
+    print("\nEXPLAIN (before -> after): type / key / rows / Extra")
+    for name in QUERIES:
+        print(f"\n{name}")
+        for label, (plan, _) in (('before', before[name]), ('after', after[name])):
+            for row in plan:
+                print(f"  {label:<7}{row.get('type')!s:<8}{row.get('key')!s:<32}{row.get('rows')!s:>10}  {row.get('Extra') or ''}")
+
+    cursor.close()
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Issue ingestion throughput: one report_issue-style transaction per row vs. the batched importer.
+
+Writes N synthetic complaints to a CSV and a JSONL file, imports both through
+app.ingest_issues() and, for comparison, inserts a sample the way report_issue
+does (issue INSERT, history INSERT, commit per row):
+
+    python benchmarks/bench_ingest.py --database civicsense_bench --rows 100000
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from seed import CATEGORIES, CITIES, PRIORITIES, STATUSES, civicsense, use_database
+
+COLUMNS = ['fullName', 'age', 'mobile', 'email', 'pincode', 'city', 'state', 'issueCategory',
+           'issueDescription', 'latitude', 'longitude', 'priority', 'status', 'submitted_at']
+
+
+def synthetic_rows(count, rng):
+    now = datetime.now()
+    for n in range(count):
+        yield {
+            'fullName': f"Legacy Citizen {n}", 'age': rng.randint(18, 90), 'mobile': f"9{rng.randint(0, 10**9 - 1):09d}",
+            'email': f"legacy{n % 5000}@ward.example", 'pincode': f"{rng.randint(500001, 500099)}",
+            'city': rng.choice(CITIES), 'state': 'Telangana', 'issueCategory': rng.choice(CATEGORIES),
+            'issueDescription': 'Migrated complaint from the ward register. ' * rng.randint(1, 4),
+            'latitude': round(rng.uniform(17.2, 17.6), 6), 'longitude': round(rng.uniform(78.2, 78.7), 6),
+            'priority': rng.choice(PRIORITIES), 'status': rng.choice(STATUSES),
+            'submitted_at': (now - timedelta(seconds=rng.randint(0, 3 * 365 * 86400))).strftime('%Y-%m-%d %H:%M:%S'),
+        }
+
+
+def write_files(directory, count):
+    csv_path, jsonl_path = os.path.join(directory, 'issues.csv'), os.path.join(directory, 'issues.jsonl')
+    with open(csv_path, 'w', newline='') as csv_file, open(jsonl_path, 'w') as jsonl_file:
+        writer = csv.DictWriter(csv_file, COLUMNS)
+        writer.writeheader()
+        for row in synthetic_rows(count, random.Random(42)):
+            writer.writerow(row)
+            jsonl_file.write(json.dumps(row) + '\n')
+    return csv_path, jsonl_path
+
+
+def import_file(path, batch_size):
+    conn = civicsense.get_db_connection()
+    started = time.perf_counter()
+    with open(path, encoding='utf-8-sig', newline='') as text_stream:
+        report = civicsense.ingest_issues(conn, civicsense.iter_ingest_rows(text_stream, civicsense.ingest_format_for(path)),
+                                          'bench', batch_size)
+    seconds = time.perf_counter() - started
+    conn.close()
+    return report['inserted'], seconds
+
+
+def row_at_a_time(count):
+    conn = civicsense.get_db_connection()
+    cursor = conn.cursor()
+    now = datetime.now()
+    started = time.perf_counter()
+    for row in synthetic_rows(count, random.Random(7)):
+        issue_id = civicsense.generate_issue_id(now)
+        cursor.execute(
+            "INSERT INTO issues (issue_id, fullName, age, mobile, email, pincode, city, state, issueCategory, "
+            "issueDescription, latitude, longitude, priority) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            (issue_id, *(row[column] for column in COLUMNS[:12]))
+        )
+        civicsense.record_issues_added(cursor, [issue_id])
+        cursor.execute("INSERT INTO issue_status_history (issue_id_ref, status, notes) VALUES (%s, %s, %s)",
+                       (issue_id, 'Submitted', 'Issue has been successfully submitted by the user.'))
+        conn.commit()
+    seconds = time.perf_counter() - started
+    cursor.close()
+    conn.close()
+    return count, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', default='civicsense_bench')
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--sample', type=int, default=2000, help='rows inserted one transaction at a time')
+    parser.add_argument('--batch-size', type=int, default=civicsense.INGEST_BATCH_SIZE)
+    args = parser.parse_args()
+
+    use_database(args.database)
+    civicsense.migrate_up()
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, jsonl_path = write_files(directory, args.rows)
+        print(f"\n{'method':<28}{'rows':>10}{'seconds':>10}{'rows/s':>10}")
+        for label, (rows, seconds) in (
+            ('one transaction per row', row_at_a_time(args.sample)),
+            ('ingest_issues (csv)', import_file(csv_path, args.batch_size)),
+            ('ingest_issues (jsonl)', import_file(jsonl_path, args.batch_size)),
+        ):
+            print(f"{label:<28}{rows:>10}{seconds:>10.2f}{rows / seconds:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""Query cache hit rates across worker processes: per-process stores vs. one shared store.
+
+Runs the same read/write mix in N worker processes (8 by default), once with every
+worker on its own LocalCacheBackend and once with all of them on a RespCacheBackend
+pointed at an in-process LocalCacheServer (or at --url, e.g. a real Redis). Reads go
+through app.cached_query(); a simulated query stands in for MySQL and returns the
+current generation of its table, so the benchmark can also count stale reads:
+results served after a write to their table had already completed elsewhere.
+
+    python benchmarks/bench_shared_cache.py --workers 8 --requests 5000
+"""
+import argparse
+import multiprocessing
+import random
+import threading
+import time
+
+from seed import civicsense
+
+TABLES = ['issues', 'feedback', 'announcements', 'chat_logs']
+
+
+class SimulatedCursor:
+    """Answers every statement after `delay` seconds with its table's current generation."""
+
+    def __init__(self, generations, delay):
+        self.generations = generations
+        self.delay = delay
+        self.executed = 0
+        self._rows = None
+
+    def execute(self, sql, params=()):
+        self.executed += 1
+        table = sql.split(' FROM ')[1].split()[0]
+        time.sleep(self.delay)
+        self._rows = [{'generation': self.generations[TABLES.index(table)]}]
+
+    def fetchall(self):
+        return self._rows
+
+
+def worker(number, url, args, generations, results):
+    backend = civicsense.RespCacheBackend(url) if url else civicsense.LocalCacheBackend(64 * 1024 * 1024)
+    civicsense.query_cache = civicsense.QueryCache(backend, namespace='bench')
+    cursor = SimulatedCursor(generations, args.query_ms / 1000)
+    rng = random.Random(number)
+    # Zipf-like popularity: a few dashboards' queries dominate, as with polling loops
+    weights = [1 / (rank + 1) for rank in range(args.queries)]
+    stale = 0
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        table_index = rng.randrange(len(TABLES))
+        if rng.random() < args.write_ratio:
+            with generations.get_lock():
+                generations[table_index] += 1
+            civicsense.invalidate_tables(TABLES[table_index])
+            continue
+        query = rng.choices(range(args.queries), weights)[0]
+        table_index = query % len(TABLES)
+        before = generations[table_index]
+        rows = civicsense.cached_query(cursor, f"SELECT {query} FROM {TABLES[table_index]}",
+                                       tables=(TABLES[table_index],))
+        if rows[0]['generation'] < before:
+            stale += 1
+    stats = civicsense.query_cache.stats()
+    results.put((number, stats['hits'], stats['misses'], cursor.executed, stale, time.perf_counter() - started))
+
+
+def run(label, url, args):
+    generations = multiprocessing.Array('q', len(TABLES))
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=worker, args=(n, url, args, generations, results))
+                 for n in range(args.workers)]
+    for process in processes:
+        process.start()
+    rows = sorted(results.get() for _ in processes)
+    for process in processes:
+        process.join()
+
+    print(f"\n{label}")
+    print(f"{'worker':>8}{'hits':>9}{'misses':>9}{'hit rate':>10}{'db queries':>12}{'stale':>8}{'seconds':>10}")
+    totals = [0, 0, 0, 0]
+    for number, hits, misses, executed, stale, seconds in rows:
+        print(f"{number:>8}{hits:>9}{misses:>9}{hits / max(hits + misses, 1):>10.1%}{executed:>12}{stale:>8}{seconds:>10.2f}")
+        totals = [a + b for a, b in zip(totals, (hits, misses, executed, stale))]
+    hits, misses, executed, stale = totals
+    print(f"{'total':>8}{hits:>9}{misses:>9}{hits / max(hits + misses, 1):>10.1%}{executed:>12}{stale:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=5000, help='per worker')
+    parser.add_argument('--queries', type=int, default=200, help='distinct statements')
+    parser.add_argument('--write-ratio', type=float, default=0.005)
+    parser.add_argument('--query-ms', type=float, default=1.0, help='simulated query latency')
+    parser.add_argument('--url', help='redis:// URL of an existing server (default: start a LocalCacheServer)')
+    args = parser.parse_args()
+
+    url = args.url
+    if not url:
+        server = civicsense.LocalCacheServer(('127.0.0.1', 0))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"redis://127.0.0.1:{server.server_address[1]}/0"
+
+    run(f"{args.workers} workers, one LocalCacheBackend each (invalidations stay in the writing worker)", None, args)
+    run(f"{args.workers} workers sharing {url}", url, args)
+
+
+if __name__ == '__main__':
+    multiprocessing.set_start_method('fork')
+    main()
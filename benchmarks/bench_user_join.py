@@ -0,0 +1,103 @@
+"""Admin user list and per-user lookups: joining issues on email vs. on the integer user_id.
+
+Seeds 100k users and 1M issues into a scratch schema, times the user_id backfill
+migration, then compares the old email-join queries with the user_id versions:
+
+    python benchmarks/bench_user_join.py --database civicsense_bench_users
+"""
+import argparse
+import statistics
+import time
+
+from seed import civicsense, seed, timed, use_database
+
+QUERIES = {
+    'admin_user_list': (
+        """SELECT u.id, u.email, COALESCE(i.issue_count, 0) AS issue_count FROM users u
+           LEFT JOIN (SELECT email, COUNT(*) AS issue_count FROM issues GROUP BY email) i ON u.email = i.email
+           ORDER BY u.created_at DESC""",
+        """SELECT u.id, u.email, COALESCE(i.issue_count, 0) AS issue_count FROM users u
+           LEFT JOIN (SELECT user_id, COUNT(*) AS issue_count FROM issues WHERE user_id IS NOT NULL GROUP BY user_id) i
+           ON u.id = i.user_id
+           ORDER BY u.created_at DESC""",
+        None),
+    'user_engagement': (
+        """SELECT u.email, COUNT(i.id), SUM(CASE WHEN i.status = 'Resolved' THEN 1 ELSE 0 END), MAX(i.submitted_at)
+           FROM users u LEFT JOIN issues i ON u.email = i.email GROUP BY u.id, u.email""",
+        """SELECT u.email, COALESCE(i.total, 0), COALESCE(i.resolved, 0), i.last_activity FROM users u
+           LEFT JOIN (SELECT user_id, COUNT(*) AS total, SUM(CASE WHEN status = 'Resolved' THEN 1 ELSE 0 END) AS resolved,
+                             MAX(submitted_at) AS last_activity
+                      FROM issues WHERE user_id IS NOT NULL GROUP BY user_id) i ON u.id = i.user_id""",
+        None),
+    'user_issue_count': (
+        "SELECT COUNT(*) FROM issues WHERE email = %s",
+        "SELECT COUNT(*) FROM issues WHERE user_id = %s",
+        'user'),
+    'user_submissions': (
+        "SELECT id, issue_id, status, submitted_at FROM issues WHERE email = %s ORDER BY submitted_at DESC",
+        "SELECT id, issue_id, status, submitted_at FROM issues WHERE user_id = %s ORDER BY submitted_at DESC",
+        'user'),
+}
+
+
+def run(cursor, sql, args, repeats):
+    cursor.execute("EXPLAIN " + sql, args)
+    plan = [dict(zip(cursor.column_names, row)) for row in cursor.fetchall()]
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        cursor.execute(sql, args)
+        cursor.fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return plan, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', default='civicsense_bench_users')
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--issues', type=int, default=1_000_000)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    use_database(args.database)
+    civicsense.migrate_up(target=3)
+
+    conn = civicsense.get_db_connection()
+    cursor = conn.cursor(buffered=True)
+    cursor.execute("SET autocommit = 1")
+    cursor.execute("SELECT COUNT(*) FROM issues")
+    if cursor.fetchone()[0] < args.issues:
+        with timed(f"Seeding {args.users} users / {args.issues} issues"):
+            seed(conn, users=args.users, issues=args.issues)
+
+    with timed("Migration 0004 (user_id column, index, backfill, foreign key)"):
+        civicsense.migrate_up(target=4)
+    cursor.execute("ANALYZE TABLE users, issues")
+    cursor.fetchall()
+
+    cursor.execute("SELECT user_id, email, COUNT(*) AS n FROM issues GROUP BY user_id, email ORDER BY n DESC LIMIT 1")
+    user_id, email, _ = cursor.fetchone()
+
+    print(f"\n{'query':<20}{'email ms':>12}{'user_id ms':>12}{'speedup':>10}")
+    plans = {}
+    for name, (email_sql, id_sql, param) in QUERIES.items():
+        email_plan, email_ms = run(cursor, email_sql, (email,) if param else (), args.repeats)
+        id_plan, id_ms = run(cursor, id_sql, (user_id,) if param else (), args.repeats)
+        plans[name] = (email_plan, id_plan)
+        print(f"{name:<20}{email_ms:>12.1f}{id_ms:>12.1f}{email_ms / id_ms if id_ms else 0:>9.1f}x")
+
+    print("\nEXPLAIN: table / type / key / rows / Extra")
+    for name, (email_plan, id_plan) in plans.items():
+        print(f"\n{name}")
+        for label, plan in (('email', email_plan), ('user_id', id_plan)):
+            for row in plan:
+                print(f"  {label:<8}{row.get('table')!s:<12}{row.get('type')!s:<8}{row.get('key')!s:<30}"
+                      f"{row.get('rows')!s:>10}  {row.get('Extra') or ''}")
+
+    cursor.close()
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Synthetic data generator shared by the benchmark scripts.
+
+Point the benchmarks at a scratch schema, never at the live database:
+
+    python benchmarks/bench_indexes.py --database civicsense_bench
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as civicsense  # noqa: E402
+
+CATEGORIES = ['Pothole', 'Streetlight', 'Garbage Collection', 'Water Supply', 'Drainage',
+              'Road Damage', 'Public Safety', 'Noise', 'Parks', 'Other']
+STATUSES = ['Submitted', 'In Progress', 'Resolved', 'Completed', 'Rejected']
+PRIORITIES = ['Low', 'Medium', 'High', 'Critical']
+CITIES = ['Hyderabad', 'Chennai', 'Bengaluru', 'Mumbai', 'Pune', 'Delhi', 'Kolkata',
+          'Vijayawada', 'Visakhapatnam', 'Guntur', 'Coimbatore', 'Mysuru']
+
+
+def use_database(database):
+    """Routes every get_db_connection() call of the app module to `database`."""
+    civicsense.db_config['database'] = database
+    server_config = {key: value for key, value in civicsense.db_config.items() if key != 'database'}
+    conn = civicsense.mysql.connector.connect(**server_config)
+    cursor = conn.cursor()
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+    cursor.close()
+    conn.close()
+
+
+def timed(label):
+    """Context manager printing the wall time of a block."""
+    class _Timer:
+        def __enter__(self):
+            self.started = time.perf_counter()
+            return self
+
+        def __exit__(self, *exc):
+            self.elapsed = time.perf_counter() - self.started
+            print(f"{label}: {self.elapsed:.2f}s")
+    return _Timer()
+
+
+def seed(conn, users=10_000, issues=1_000_000, batch=5_000, days=730, rng=None):
+    """Bulk-loads users, issues, status history, feedback and chat logs. Returns user emails."""
+    rng = rng or random.Random(42)
+    cursor = conn.cursor()
+    now = datetime.now()
+
+    emails = [f"user{n}@bench.civicsense" for n in range(users)]
+    rows = [(f"First{n}", f"Last{n}", emails[n], 'x', rng.choice(CITIES)) for n in range(users)]
+    for start in range(0, len(rows), batch):
+        cursor.executemany(
+            "INSERT IGNORE INTO users (first_name, last_name, email, password, city) VALUES (%s, %s, %s, %s, %s)",
+            rows[start:start + batch]
+        )
+        conn.commit()
+
+    for start in range(0, issues, batch):
+        issue_rows, history_rows = [], []
+        for n in range(start, min(start + batch, issues)):
+            submitted = now - timedelta(seconds=rng.randint(0, days * 86400))
+            status = rng.choice(STATUSES)
+            issue_id = f"CS-BENCH-{n:09d}"
+            custom = rng.choice(['', '', '', 'Fallen tree'])
+            issue_rows.append((
+                issue_id, f"Citizen {n}", '9000000000', rng.choice(emails), rng.choice(CITIES),
+                rng.choice(CATEGORIES), custom, 'Synthetic benchmark issue', rng.choice(PRIORITIES),
+                status, submitted, submitted + timedelta(days=rng.randint(0, 30))
+            ))
+            history_rows.append((issue_id, 'Submitted', 'Issue has been successfully submitted by the user.', submitted))
+            if status != 'Submitted':
+                history_rows.append((issue_id, status, f'Status updated to {status} by admin.', submitted + timedelta(days=1)))
+        cursor.executemany(
+            "INSERT INTO issues (issue_id, fullName, mobile, email, city, issueCategory, customIssueType, "
+            "issueDescription, priority, status, submitted_at, updated_at) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            issue_rows
+        )
+        cursor.executemany(
+            "INSERT INTO issue_status_history (issue_id_ref, status, notes, created_at) VALUES (%s, %s, %s, %s)",
+            history_rows
+        )
+        conn.commit()
+
+    cursor.execute("SELECT id FROM users WHERE email LIKE '%@bench.civicsense' LIMIT 1000")
+    user_ids = [row[0] for row in cursor.fetchall()]
+    side_rows = [(rng.choice(user_ids), rng.randint(1, 5), now - timedelta(seconds=rng.randint(0, days * 86400)))
+                 for _ in range(max(issues // 20, 1))]
+    for start in range(0, len(side_rows), batch):
+        chunk = side_rows[start:start + batch]
+        cursor.executemany("INSERT INTO feedback (user_id, rating, submitted_at) VALUES (%s, %s, %s)", chunk)
+        cursor.executemany(
+            "INSERT INTO chat_logs (user_id, user_message, ai_response, created_at) VALUES (%s, 'hi', 'hello', %s)",
+            [(user_id, created) for user_id, _, created in chunk]
+        )
+        conn.commit()
+    cursor.close()
+    return emails